@@ -0,0 +1,246 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from pytfsclient.client_factory import ClientFactory
+from pytfsclient.tfs_client import TfsBaseClient
+from pytfsclient.tfs_workitem_client import TfsWorkitemClient
+from pytfsclient.models.workitems.tfs_workitem import Workitem
+from pytfsclient.models.workitems.tfs_workitem_changes import WorkitemChange
+from pytfsclient.testing import FakeAzureDevOpsServer, SyntheticDataset
+
+### COMMAND
+# python .\benchmarks\bench_facade.py
+# python .\benchmarks\bench_facade.py --save-baseline
+# python .\benchmarks\bench_facade.py --only get_workitems --latency 0.005
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+def peak_rss_mb() -> float:
+    '''
+    Returns peak resident set size of process in MB or None if platform doesn't provide it
+    '''
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return round(peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024, 1)
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+class BenchmarkResult:
+    '''
+    Result of one benchmark case
+    '''
+
+    def __init__(self, name: str, latencies: List[float], items: int, requests: int) -> None:
+        self.name = name
+        self.latencies = latencies
+        self.items = items
+        self.requests = requests
+        self.seconds = sum(latencies)
+        self.peak_rss_mb = peak_rss_mb()
+
+    def to_json(self) -> dict:
+        seconds = self.seconds or 1e-9
+
+        return {
+            'iterations': len(self.latencies),
+            'requests': self.requests,
+            'items': self.items,
+            'requests_per_sec': round(self.requests / seconds, 1),
+            'items_per_sec': round(self.items / seconds, 1),
+            'p50_ms': round(percentile(self.latencies, 0.5) * 1000, 3),
+            'p99_ms': round(percentile(self.latencies, 0.99) * 1000, 3),
+            'peak_rss_mb': self.peak_rss_mb,
+        }
+
+class BenchmarkSuite:
+    '''
+    Runs facade hot paths against FakeAzureDevOpsServer
+    '''
+
+    def __init__(self, server: FakeAzureDevOpsServer, repeat: int) -> None:
+        self.server = server
+        self.repeat = repeat
+        self.results: Dict[str, BenchmarkResult] = dict()
+
+        project_name = f'{FakeAzureDevOpsServer.COLLECTION}/{SyntheticDataset.project_name(0)}'
+        self.client_connection = ClientFactory.create_pat('token', server.url, project_name)
+        self.workitem_client = ClientFactory.get_workitem_client(self.client_connection)
+        self.project_client = ClientFactory.get_project_client(self.client_connection)
+
+    def measure(self, name: str, func: Callable[[], int]) -> BenchmarkResult:
+        '''
+        Calls func repeat times (after one warm up call). func returns number of processed items
+        '''
+
+        func()
+
+        latencies = list()
+        items = 0
+        requests = self.server.stats.requests
+
+        for _ in range(self.repeat):
+            started = time.perf_counter()
+            items += func()
+            latencies.append(time.perf_counter() - started)
+
+        result = BenchmarkResult(name, latencies, items, self.server.stats.requests - requests)
+        self.results[name] = result
+
+        return result
+
+    ### CASES REGION ###
+
+    def bench_get_workitems(self, count: int, batch_sizes: List[int]) -> None:
+        item_ids = list(range(1, count + 1))
+
+        for batch_size in batch_sizes:
+            self.measure(f'get_workitems[batch={batch_size}]', \
+                lambda: len(self.workitem_client.get_workitems(item_ids, batch_size=batch_size)))
+
+    def bench_run_wiql(self, count: int) -> None:
+        query = 'SELECT [System.Id] FROM workitems ORDER BY [System.Id]'
+        self.measure('run_wiql.workitems', lambda: len(self.workitem_client.run_wiql(query, max_top=count).workitems))
+
+    def bench_workitem_changes(self) -> None:
+        dataset = self.server.dataset
+        item_id = max(range(1, 201), key=lambda item: len(dataset.updates(item)))
+
+        self.measure('get_workitem_changes', lambda: len(self.workitem_client.get_workitem_changes(item_id)))
+
+    def bench_parsing(self, count: int) -> None:
+        dataset = self.server.dataset
+        base_url = self.server.collection_url
+
+        json_items = [dataset.workitem(item_id, base_url, expand='All') for item_id in range(1, count + 1)]
+        json_updates = [update for item_id in range(1, count // 10 + 1) for update in dataset.updates(item_id, base_url)]
+
+        self.measure('Workitem.from_json', \
+            lambda: len([Workitem.from_json(self.workitem_client, json_item) for json_item in json_items]))
+        self.measure('WorkitemChange.from_json', \
+            lambda: len([WorkitemChange.from_json(json_update) for json_update in json_updates]))
+
+    def bench_get_projects(self) -> None:
+        self.measure('get_projects', lambda: len(self.project_client.get_projects()))
+
+    def bench_legacy_wrapper(self, count: int) -> None:
+        item_ids = list(range(1, count + 1))
+        legacy_client = TfsWorkitemClient(TfsBaseClient(self.client_connection))
+
+        self.measure('TfsWorkitemClient.get_workitems', lambda: len(legacy_client.get_workitems(item_ids)))
+
+    ### END OF CASES REGION ###
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    '''
+    Returns list of regressions: throughput lower or p99 latency higher than baseline by more than tolerance
+    '''
+
+    regressions = list()
+
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if not expected:
+            continue
+
+        if result['items_per_sec'] < expected['items_per_sec'] * (1.0 - tolerance):
+            regressions.append(f'{name}: items/s {result["items_per_sec"]} < baseline {expected["items_per_sec"]}')
+
+        if result['p99_ms'] > expected['p99_ms'] * (1.0 + tolerance):
+            regressions.append(f'{name}: p99 {result["p99_ms"]} ms > baseline {expected["p99_ms"]} ms')
+
+    return regressions
+
+def print_table(results: Dict[str, dict], baseline: Dict[str, dict]) -> None:
+    header = f'{"case":36} {"req/s":>10} {"items/s":>12} {"p50 ms":>10} {"p99 ms":>10} {"rss MB":>8} {"vs base":>8}'
+    print(header)
+    print('-' * len(header))
+
+    for name, result in results.items():
+        expected = baseline.get(name)
+        ratio = f'{result["items_per_sec"] / expected["items_per_sec"]:.2f}x' \
+            if expected and expected.get('items_per_sec') else '-'
+
+        print(f'{name:36} {result["requests_per_sec"]:>10} {result["items_per_sec"]:>12} ' \
+            f'{result["p50_ms"]:>10} {result["p99_ms"]:>10} {str(result["peak_rss_mb"]):>8} {ratio:>8}')
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='PyTfsClient facade benchmarks against local stand-in server')
+    parser.add_argument('--workitems', type=int, default=2000, help='number of workitems requested by cases')
+    parser.add_argument('--repeat', type=int, default=5, help='measured iterations of every case')
+    parser.add_argument('--latency', type=float, default=0.0, help='server latency of every response in seconds')
+    parser.add_argument('--only', default=None, help='run only cases which names contain given text')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='path of baseline json')
+    parser.add_argument('--save-baseline', action='store_true', help='write results as new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative regression')
+    args = parser.parse_args(argv)
+
+    dataset = SyntheticDataset(workitem_count=max(args.workitems, 20000), project_count=120, \
+        updates_per_workitem=400, seed=0)
+
+    with FakeAzureDevOpsServer(dataset, latency=args.latency, page_size=20, updates_page_size=50) as server:
+        suite = BenchmarkSuite(server, args.repeat)
+
+        cases = [
+            ('get_workitems', lambda: suite.bench_get_workitems(args.workitems, [50, 100, 200])),
+            ('run_wiql', lambda: suite.bench_run_wiql(args.workitems)),
+            ('get_workitem_changes', suite.bench_workitem_changes),
+            ('from_json', lambda: suite.bench_parsing(args.workitems)),
+            ('get_projects', suite.bench_get_projects),
+            ('TfsWorkitemClient', lambda: suite.bench_legacy_wrapper(args.workitems)),
+        ]
+
+        for name, run_case in cases:
+            if args.only and args.only not in name:
+                continue
+            run_case()
+
+    results = {name: result.to_json() for name, result in suite.results.items()}
+
+    baseline = dict()
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file).get('results', {})
+
+    print_table(results, baseline)
+
+    if args.save_baseline:
+        document = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'workitems': args.workitems,
+            'repeat': args.repeat,
+            'latency': args.latency,
+            'results': results,
+        }
+
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(document, file, indent=2)
+        print(f'Baseline saved to {args.baseline}')
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -22,6 +22,13 @@ setup(
         'requests',
         'requests_ntlm',
     ],
+    extras_require={
+        'async': ['httpx'],
+        'async-ntlm': ['httpx', 'httpx_ntlm'],
+        'fast-json': ['orjson'],
+        'stream': ['ijson'],
+        'tracing': ['opentelemetry-api'],
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',      # Chose either "3 - Alpha", "4 - Beta" or "5 - Production/Stable" as the current state of your package
         'Intended Audience :: Developers',      # Define that your audience are developers
@@ -1,8 +1,11 @@
 from .services.http.http_client import HttpClient
+from .services.http.async_http_client import AsyncHttpClient
 from .client_connection import ClientConnection
 from .services.mention_client.mention_client import MentionClient
 from .services.project_client.project_client import ProjectClient
 from .services.workitem_client.workitem_client import WorkitemClient
+from .services.workitem_client.async_workitem_client import AsyncWorkitemClient
+from .services.project_client.async_project_client import AsyncProjectClient
 from .models.client_error import ClientError
 
 class ClientFactory:
@@ -13,10 +16,16 @@ class ClientFactory:
     Functions to get facades:
     - get_project_client() -> returns ProjectClient facade for managing projects, teams and team members.
     - get_workitem_client() -> returns WorkitemClient facade for managing workitems.
+
+    Asynchronous API (requires httpx package):
+    - create_ntlm_async() or create_pat_async() -> returns ClientConnection with AsyncHttpClient.
+    - get_async_project_client() -> returns AsyncProjectClient facade.
+    - get_async_workitem_client() -> returns AsyncWorkitemClient facade.
     '''
 
     @staticmethod
-    def create_ntlm(user_name: str, user_password: str, server_url: str, project_name: str='DefaultCollection', verify_ssl: bool=False) -> ClientConnection:
+    def create_ntlm(user_name: str, user_password: str, server_url: str, project_name: str='DefaultCollection', verify_ssl: bool=False, \
+        **http_options) -> ClientConnection:
         '''
         Creates ClientConnection instance with NTLM authorization for connection to TFS/Azure.
 
@@ -28,6 +37,11 @@ class ClientFactory:
             server_url (str): URL of TFS/Azure service
             project_name (str): project name with collection. Default is 'DefaultCollection' without project
             verify_ssl (bool): flag for verifing SSL. Default is False
+            http_options: keyword arguments of HttpClient constructor:
+                pool_connections (int), pool_maxsize (int), pool_block (bool), keep_alive (bool),
+                retry_policy (RetryPolicy), rate_limiter (AdaptiveRateLimiter), http_cache (HttpCache),
+                json_codec (JsonCodec | str), hooks (List[RequestHook]), transport (CassetteTransport),
+                single_flight (SingleFlight)
 
         Returns:
             Instance of ClientConnection with NTLM authorization for connection to TFS/Azure
@@ -45,13 +59,14 @@ class ClientFactory:
         if not server_url:
             raise ClientError('Server URL can\'t be None')
 
-        http_client = HttpClient(server_url, verify_ssl)
+        http_client = HttpClient(server_url, verify_ssl, **http_options)
         http_client.authentificate_with_password(user_name, user_password)
 
         return ClientConnection(http_client, project_name)
 
     @staticmethod
-    def create_pat(personal_access_token: str, server_url: str, project_name: str='DefaultCollection', verify_ssl: bool=False) -> ClientConnection:
+    def create_pat(personal_access_token: str, server_url: str, project_name: str='DefaultCollection', verify_ssl: bool=False, \
+        **http_options) -> ClientConnection:
         '''
         Creates ClientConnection instance with authorization with personal access token for connection to TFS/Azure.
         
@@ -61,6 +76,11 @@ class ClientFactory:
             server_url (str): URL of TFS/Azure service
             project_name (str): project name with collection. Default is 'DefaultCollection' without project
             verify_ssl (bool): flag for verifing SSL. Default is False
+            http_options: keyword arguments of HttpClient constructor:
+                pool_connections (int), pool_maxsize (int), pool_block (bool), keep_alive (bool),
+                retry_policy (RetryPolicy), rate_limiter (AdaptiveRateLimiter), http_cache (HttpCache),
+                json_codec (JsonCodec | str), hooks (List[RequestHook]), transport (CassetteTransport),
+                single_flight (SingleFlight)
 
         Returns:
             Instance of ClientConnection with NTLM authorization for connection to TFS/Azure
@@ -75,11 +95,83 @@ class ClientFactory:
         if not server_url:
             raise ClientError('Server URL can\'t be None')
 
-        http_client = HttpClient(server_url, verify_ssl)
+        http_client = HttpClient(server_url, verify_ssl, **http_options)
         http_client.authentificate_with_pat(personal_access_token)
         
         return ClientConnection(http_client, project_name)
 
+    @staticmethod
+    def create_ntlm_async(user_name: str, user_password: str, server_url: str, project_name: str='DefaultCollection', \
+        verify_ssl: bool=False, max_connections: int=100, **http_options) -> ClientConnection:
+        '''
+        Creates ClientConnection instance with asynchronous http client and NTLM authorization.
+        Requires httpx and httpx_ntlm packages.
+
+        Args:
+            user_name (str): user name
+            user_password (str): user password
+            server_url (str): URL of TFS/Azure service
+            project_name (str): project name with collection. Default is 'DefaultCollection' without project
+            verify_ssl (bool): flag for verifing SSL. Default is False
+            max_connections (int): max number of connections opened by async http client. Default is 100
+            http_options: options of AsyncHttpClient: retry_policy (RetryPolicy), rate_limiter (AdaptiveRateLimiter),
+                json_codec (JsonCodec | str), hooks (List[RequestHook])
+
+        Returns:
+            Instance of ClientConnection with AsyncHttpClient
+
+        Raises:
+            ConnectionError: if user_name, user_password or server_url are None
+        '''
+
+        if not user_name:
+            raise ClientError('User name can\'t be None')
+        
+        if not user_password:
+            raise ClientError('User password can\'t be None')
+        
+        if not server_url:
+            raise ClientError('Server URL can\'t be None')
+
+        http_client = AsyncHttpClient(server_url, verify_ssl, max_connections, **http_options)
+        http_client.authentificate_with_password(user_name, user_password)
+
+        return ClientConnection(http_client, project_name)
+
+    @staticmethod
+    def create_pat_async(personal_access_token: str, server_url: str, project_name: str='DefaultCollection', \
+        verify_ssl: bool=False, max_connections: int=100, **http_options) -> ClientConnection:
+        '''
+        Creates ClientConnection instance with asynchronous http client and personal access token authorization.
+        Requires httpx package. Close connection with: await client_connection.http_client.close()
+
+        Args:
+            personal_access_token (str): personal access token for connection to TFS/Azure service
+            server_url (str): URL of TFS/Azure service
+            project_name (str): project name with collection. Default is 'DefaultCollection' without project
+            verify_ssl (bool): flag for verifing SSL. Default is False
+            max_connections (int): max number of connections opened by async http client. Default is 100
+            http_options: options of AsyncHttpClient: retry_policy (RetryPolicy), rate_limiter (AdaptiveRateLimiter),
+                json_codec (JsonCodec | str), hooks (List[RequestHook])
+
+        Returns:
+            Instance of ClientConnection with AsyncHttpClient
+
+        Raises:
+            ConnectionError: if personal_access_token or server_url are None
+        '''
+
+        if not personal_access_token:
+            raise ClientError('Personal access token can\'t be None')
+        
+        if not server_url:
+            raise ClientError('Server URL can\'t be None')
+
+        http_client = AsyncHttpClient(server_url, verify_ssl, max_connections, **http_options)
+        http_client.authentificate_with_pat(personal_access_token)
+
+        return ClientConnection(http_client, project_name)
+
     @staticmethod
     def create_http_client(http_client: HttpClient, project_name: str='DefaultCollection') -> ClientConnection:
         '''
@@ -150,3 +242,50 @@ class ClientFactory:
         '''
 
         return MentionClient()
+
+
+    @staticmethod
+    def get_async_workitem_client(client_connection: ClientConnection) -> AsyncWorkitemClient:
+        '''
+        Returns instance of AsyncWorkitemClient facade for managing workitems.
+
+        Args:
+            client_connection (ClientConnection): instance of ClientConnection with AsyncHttpClient
+
+        Returns:
+            Instance of AsyncWorkitemClient facade for managing workitems TFS/Azure service.
+
+        Raises:
+            ConnectionError: if client_connection is None or it is not asynchronous
+        '''
+
+        if not client_connection:
+            raise ClientError('Client Connection can\'t be None')
+
+        if not isinstance(client_connection.http_client, AsyncHttpClient):
+            raise ClientError('Client Connection should be created with create_pat_async() or create_ntlm_async()')
+
+        return AsyncWorkitemClient(client_connection)
+
+    @staticmethod
+    def get_async_project_client(client_connection: ClientConnection) -> AsyncProjectClient:
+        '''
+        Returns instance of AsyncProjectClient facade for managing projects, teams and members of TFS/Azure service.
+
+        Args:
+            client_connection (ClientConnection): instance of ClientConnection with AsyncHttpClient
+
+        Returns:
+            Instance of AsyncProjectClient facade.
+
+        Raises:
+            ConnectionError: if client_connection is None or it is not asynchronous
+        '''
+
+        if not client_connection:
+            raise ClientError('Client Connection can\'t be None')
+
+        if not isinstance(client_connection.http_client, AsyncHttpClient):
+            raise ClientError('Client Connection should be created with create_pat_async() or create_ntlm_async()')
+
+        return AsyncProjectClient(client_connection)
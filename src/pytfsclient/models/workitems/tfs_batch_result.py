@@ -0,0 +1,129 @@
+from typing import Dict, List, Iterator
+from .tfs_workitem import Workitem
+
+class BatchItemResult:
+    '''
+    Result of one workitem request of wit/$batch. Failed requests keep their input to be sent again.
+    '''
+
+    def __init__(self, request, item_id: int = None, status_code: int = None, workitem: Workitem = None, error: str = None) -> None:
+        self.__request = request
+        self.__item_id = item_id
+        self.__status_code = status_code
+        self.__workitem = workitem
+        self.__error = error
+
+    @property
+    def request(self):
+        '''
+        Returns:
+            Input of request, e.g. dictonary of updated fields
+        '''
+
+        return self.__request
+
+    @property
+    def item_id(self) -> int:
+        '''
+        Returns:
+            Id of workitem or None if workitem wasn't created
+        '''
+
+        return self.__item_id
+
+    @property
+    def status_code(self) -> int:
+        '''
+        Returns:
+            HTTP status code of request or None if batch wasn't sent
+        '''
+
+        return self.__status_code
+
+    @property
+    def workitem(self) -> Workitem:
+        '''
+        Returns:
+            Workitem from response or None if request failed or response has no body
+        '''
+
+        return self.__workitem
+
+    @property
+    def error(self) -> str:
+        '''
+        Returns:
+            Error message of failed request or None
+        '''
+
+        return self.__error
+
+    @property
+    def is_success(self) -> bool:
+        return (self.__error is None) and (self.__status_code is not None) and (200 <= self.__status_code < 300)
+
+    def __repr__(self) -> str:
+        return f'BatchItemResult(id={self.__item_id}, status={self.__status_code}, error={self.__error!r})'
+
+class BatchResult:
+    '''
+    Results of workitem requests sent through wit/$batch in order of input.
+    Use WorkitemClient::update_workitems_batch().
+    '''
+
+    def __init__(self, results: List[BatchItemResult], requests: int) -> None:
+        self.__results = results
+        self.__requests = requests
+
+    @property
+    def results(self) -> List[BatchItemResult]:
+        return self.__results
+
+    @property
+    def requests(self) -> int:
+        '''
+        Returns:
+            Number of HTTP requests sent
+        '''
+
+        return self.__requests
+
+    @property
+    def is_success(self) -> bool:
+        '''
+        Returns:
+            True if all requests succeeded
+        '''
+
+        return all(result.is_success for result in self.__results)
+
+    @property
+    def workitems(self) -> List[Workitem]:
+        '''
+        Returns:
+            Workitems of succeeded requests
+        '''
+
+        return [result.workitem for result in self.__results if result.is_success and result.workitem]
+
+    @property
+    def failed(self) -> List[BatchItemResult]:
+        return [result for result in self.__results if not result.is_success]
+
+    @property
+    def failed_updates(self) -> Dict[int, dict]:
+        '''
+        Returns:
+            Dictonary { id: fields } of failed updates, can be passed to WorkitemClient::update_workitems_batch() again
+        '''
+
+        return {result.item_id: result.request for result in self.__results if not result.is_success}
+
+    def __len__(self) -> int:
+        return len(self.__results)
+
+    def __iter__(self) -> Iterator[BatchItemResult]:
+        return iter(self.__results)
+
+    def __getitem__(self, index: int) -> BatchItemResult:
+        return self.__results[index]
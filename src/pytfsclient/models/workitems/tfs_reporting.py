@@ -0,0 +1,213 @@
+from typing import Iterator
+from ..client_error import ClientError
+
+class WorkitemRevision:
+    '''
+    Revision of workitem from reporting endpoint. Use WorkitemClient::iter_reporting_revisions().
+    '''
+
+    @property
+    def id(self) -> int:
+        '''
+        Returns:
+            Id of workitem: int
+        '''
+
+        return self.__id
+
+    @property
+    def revision(self) -> int:
+        '''
+        Returns:
+            Revision number: int
+        '''
+
+        return self.__revision
+
+    @property
+    def fields(self) -> dict:
+        '''
+        Returns:
+            Fields of workitem at this revision: dict
+        '''
+
+        return self.__fields
+
+    @property
+    def changed_date(self) -> str:
+        '''
+        Returns:
+            Date of revision (System.ChangedDate) or None if field wasn't requested
+        '''
+
+        return self.__fields.get('System.ChangedDate')
+
+    @property
+    def raw(self) -> dict:
+        '''
+        Returns:
+            JSON object of revision received from TFS/Azure
+        '''
+
+        return self.__raw
+
+    def __getitem__(self, field_name: str):
+        return self.__fields[field_name]
+
+    def __repr__(self) -> str:
+        return f'WorkitemRevision(id={self.__id}, rev={self.__revision})'
+
+    @classmethod
+    def from_json(cls, json_item: dict):
+        '''
+        Classmethod creates WorkitemRevision instance from given json item.
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        revision = cls()
+
+        try:
+            revision.__raw = json_item
+            revision.__id = int(json_item['id'])
+            revision.__fields = json_item.get('fields') or {}
+
+            rev = json_item.get('rev')
+            if rev is None:
+                rev = revision.__fields.get('System.Rev')
+            revision.__revision = int(rev) if rev is not None else None
+
+            return revision
+        except Exception as ex:
+            raise ClientError(ex)
+
+class ReportingBatch:
+    '''
+    One page of reporting endpoint (WorkitemRevision or WorkitemLink records). Save continuation_token after the page is processed to resume export from it.
+    '''
+
+    def __init__(self, items: list, continuation_token: str, is_last_batch: bool) -> None:
+        self.__items = items
+        self.__continuation_token = continuation_token
+        self.__is_last_batch = is_last_batch
+
+    @property
+    def items(self) -> list:
+        '''
+        Returns:
+            Records of page
+        '''
+
+        return self.__items
+
+    @property
+    def continuation_token(self) -> str:
+        '''
+        Returns:
+            Token of the next page. Token of the last page returns records changed later (watermark)
+        '''
+
+        return self.__continuation_token
+
+    @property
+    def is_last_batch(self) -> bool:
+        '''
+        Returns:
+            True if page is the last one at the moment of request
+        '''
+
+        return self.__is_last_batch
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.__items)
+
+class WorkitemLink:
+    '''
+    Compact record of link change from reporting endpoint. Use WorkitemClient::iter_reporting_links().
+    Unpacks to (source_id, target_id, rel, changed_date, is_active).
+    '''
+
+    __slots__ = ('__source_id', '__target_id', '__rel', '__changed_date', '__is_active')
+
+    def __init__(self, source_id: int, target_id: int, rel: str, changed_date: str, is_active: bool) -> None:
+        self.__source_id = source_id
+        self.__target_id = target_id
+        self.__rel = rel
+        self.__changed_date = changed_date
+        self.__is_active = is_active
+
+    @property
+    def source_id(self) -> int:
+        '''
+        Returns:
+            Id of source workitem: int
+        '''
+
+        return self.__source_id
+
+    @property
+    def target_id(self) -> int:
+        '''
+        Returns:
+            Id of target workitem: int
+        '''
+
+        return self.__target_id
+
+    @property
+    def rel(self) -> str:
+        '''
+        Returns:
+            Reference name of link type, e.g. System.LinkTypes.Hierarchy-Forward
+        '''
+
+        return self.__rel
+
+    @property
+    def changed_date(self) -> str:
+        '''
+        Returns:
+            Date of link change
+        '''
+
+        return self.__changed_date
+
+    @property
+    def is_active(self) -> bool:
+        '''
+        Returns:
+            True if link was created, False if link was removed
+        '''
+
+        return self.__is_active
+
+    def __iter__(self) -> Iterator:
+        return iter((self.__source_id, self.__target_id, self.__rel, self.__changed_date, self.__is_active))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, WorkitemLink) and (tuple(self) == tuple(other))
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f'WorkitemLink({self.__source_id} -> {self.__target_id}, {self.__rel}, active={self.__is_active})'
+
+    @classmethod
+    def from_json(cls, json_item: dict):
+        '''
+        Classmethod creates WorkitemLink instance from given json item.
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        try:
+            return cls(int(json_item['sourceId']), int(json_item['targetId']), json_item.get('rel'), \
+                json_item.get('changedDate'), bool(json_item.get('isActive', True)))
+        except Exception as ex:
+            raise ClientError(ex)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Iterator
 from .tfs_workitem import Workitem
 from ..client_error import ClientError
 
@@ -33,6 +33,27 @@ class WiqlResult:
         '''
 
         return self.__client.get_workitems(self.item_ids) if not self.is_empty else []
+
+    def iter_workitems(self, item_fields: List[str] = None, expand: str = 'All', \
+        batch_size: int = None, prefetch: bool = False) -> Iterator[Workitem]:
+        '''
+        Generator yields workitems of WIQL query result batch by batch. Calls WorkitemClient::iter_workitems().
+
+        Args:
+            item_fields (List[str]): list of requested fields of workitems. Default: all fields
+            expand (str): The expand parameters for work item attributes. Default: All
+            batch_size (int): batch size. Default: None
+            prefetch (bool): request next batch in background. Default: False
+
+        Returns:
+            Iterator of workitems: Iterator[Workitem]
+        '''
+
+        if self.is_empty:
+            return iter([])
+
+        return self.__client.iter_workitems(self.item_ids, item_fields=item_fields, expand=expand, \
+            batch_size=batch_size, prefetch=prefetch)
     
     @classmethod
     def from_json(cls, tfs_client, json_response):
@@ -52,6 +52,15 @@ class Workitem:
 
         return self.__url
     
+    @property
+    def raw(self) -> dict:
+        '''
+        Returns:
+            JSON object of workitem received from TFS/Azure
+        '''
+
+        return self.__raw
+
     @property
     def revision(self) -> int:
         '''
@@ -90,6 +99,7 @@ class Workitem:
         '''
 
         self.__updated_fields['System.Title'] = value
+        self.__track()
 
     @property
     def description(self) -> str:
@@ -107,6 +117,7 @@ class Workitem:
     @description.setter
     def description(self, value: str) -> None:
         self.__updated_fields['System.Description'] = value
+        self.__track()
 
     @property
     def assigned_to(self) -> str:
@@ -181,6 +192,25 @@ class Workitem:
             raise ClientError('Field value can\'t be None')
 
         self.__updated_fields[fld_name] = fld_value
+        self.__track()
+
+    @property
+    def updated_fields(self) -> Dict[str, str]:
+        '''
+        Returns:
+            Dictonary(str, str) of edited fields which are not updated on server yet
+        '''
+
+        return dict(self.__updated_fields)
+
+    @property
+    def is_dirty(self) -> bool:
+        '''
+        Returns:
+            True if workitem has edited fields which are not updated on server yet
+        '''
+
+        return len(self.__updated_fields) > 0
 
     @property
     def relations(self) -> List[WorkitemRelation]:
@@ -219,6 +249,36 @@ class Workitem:
         except:
             return UpdateFieldsResult.UPDATE_EXCEPTION
     
+    def _apply_update(self, item: 'Workitem' = None, fields: Dict[str, str] = None) -> None:
+        '''
+        Applies result of update made by WorkitemSession: fields of updated workitem from response or,
+        if response has no workitem, flushed edited fields. Fields edited after flush are kept.
+        '''
+
+        flushed = fields if fields is not None else dict(self.__updated_fields)
+
+        if item is not None:
+            self.__fields = item.__fields
+            self.__raw = item.__raw
+            # response without $expand=Relations has no relations
+            if item.__relations:
+                self.__relations = item.__relations
+        else:
+            self.__fields.update(flushed)
+
+        for fld_name, fld_value in flushed.items():
+            if self.__updated_fields.get(fld_name) == fld_value:
+                del self.__updated_fields[fld_name]
+
+    def __track(self) -> None:
+        '''
+        Registers edited workitem in active WorkitemSession of client
+        '''
+
+        track = getattr(self.__client, '_track_dirty', None)
+        if track:
+            track(self)
+
     def get_changes(self, skip: int = 0, top: int = -1) -> List[WorkitemChange]:
         '''
         Get history changes of workitem.
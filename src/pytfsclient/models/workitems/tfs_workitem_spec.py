@@ -0,0 +1,75 @@
+from typing import Dict, List, Tuple, Union
+from .tfs_workitem import Workitem
+from .tfs_workitem_relation import RelationTypes, RelationMap
+from ..client_error import ClientError
+
+class WorkitemSpec:
+    '''
+    Specification of new workitem for WorkitemClient::create_workitems().
+    Negative temporary id lets other specs of the same call link to this workitem before it exists.
+
+    Usage:
+        parent = WorkitemSpec('User Story', {'System.Title': 'Story'}, temp_id=-1)
+        task = WorkitemSpec('Task', {'System.Title': 'Task'}, relations=[(RelationTypes.PARENT, -1)])
+    '''
+
+    def __init__(self, type_name: str, fields: Dict[str, str] = None, \
+        relations: List[Tuple[Union[str, RelationTypes], Union[int, Workitem]]] = None, temp_id: int = None) -> None:
+        '''
+        WorkitemSpec constructor.
+
+        Args:
+            type_name (str): workitem type, e.g. Task
+            fields (Dict[str, str]): field values. Default: None
+            relations (List[Tuple[str | RelationTypes, int | Workitem]]): relations (relation type name, target workitem).
+                Negative target is temporary id of other spec. Default: None
+            temp_id (int): negative temporary id of workitem. Default: None
+
+        Raises:
+            ClientError if type name is empty or temporary id isn't negative
+        '''
+
+        if not type_name:
+            raise ClientError('WorkitemSpec: type name can\'t be None')
+
+        if (temp_id is not None) and (int(temp_id) >= 0):
+            raise ClientError(f'WorkitemSpec: temporary id should be negative, got {temp_id}')
+
+        self.__type_name = type_name
+        self.__fields = dict(fields or {})
+        self.__temp_id = int(temp_id) if temp_id is not None else None
+        self.__relations = [(RelationMap[relation_name] if isinstance(relation_name, RelationTypes) else relation_name, \
+            target.id if isinstance(target, Workitem) else int(target)) for relation_name, target in (relations or [])]
+
+    @property
+    def type_name(self) -> str:
+        return self.__type_name
+
+    @property
+    def fields(self) -> Dict[str, str]:
+        return self.__fields
+
+    @property
+    def relations(self) -> List[Tuple[str, int]]:
+        '''
+        Returns:
+            List of (relation type name, target id), negative target id is temporary id
+        '''
+
+        return self.__relations
+
+    @property
+    def temp_id(self) -> int:
+        return self.__temp_id
+
+    @property
+    def dependencies(self) -> List[int]:
+        '''
+        Returns:
+            Temporary ids of other specs this workitem links to
+        '''
+
+        return [target_id for _, target_id in self.__relations if target_id < 0]
+
+    def __repr__(self) -> str:
+        return f'WorkitemSpec({self.__type_name!r}, temp_id={self.__temp_id})'
@@ -33,4 +33,17 @@ class BaseClient(ABC):
         '''
         HttpClient intance of client connection
         '''
-        return self._http_client
\ No newline at end of file
+        return self._http_client
+
+    def _read_json(self, response):
+        '''
+        Decodes json body of response with codec of HttpClient. Raises ValueError if response is not json.
+        '''
+        return self._http_client.read_json(response)
+
+    def _iter_json_items(self, response, key: str = 'value'):
+        '''
+        Generator yields items of top level array attribute of streamed response with HttpClient::iter_json_items.
+        Raises ValueError if response is not json.
+        '''
+        return self._http_client.iter_json_items(response, key)
@@ -0,0 +1,220 @@
+import re
+import json
+from typing import Iterable, Iterator
+
+# ijson is optional dependency: pip install pytfsclient[stream]
+try:
+    import ijson
+except ImportError: # pragma: no cover
+    ijson = None
+
+class _ChunkReader:
+    '''
+    File-like wrapper of iterable of bytes chunks for ijson.
+    Keeps read bytes until release() to check document without items.
+    '''
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self.__chunks = iter(chunks)
+        self.__rest = b''
+        self.__kept = bytearray()
+        self.__keep = True
+
+    @property
+    def kept(self) -> bytes:
+        return bytes(self.__kept)
+
+    def release(self) -> None:
+        self.__keep = False
+        self.__kept = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes type of stream with read(0)
+        if size == 0:
+            return b''
+
+        if not self.__rest:
+            self.__rest = next((chunk for chunk in self.__chunks if chunk), b'')
+
+        if (size < 0) or (size >= len(self.__rest)):
+            data, self.__rest = self.__rest, b''
+        else:
+            data, self.__rest = self.__rest[:size], self.__rest[size:]
+
+        if self.__keep:
+            self.__kept += data
+
+        return data
+
+def _iter_ijson_items(chunks: Iterable[bytes], key: str) -> Iterator:
+    '''
+    Yields items of top level array attribute with ijson parser
+    '''
+
+    reader = _ChunkReader(chunks)
+    items = ijson.items(reader, f'{key}.item', use_float=True)
+
+    try:
+        for item in items:
+            # document has the array, bytes of its beginning aren't needed anymore
+            reader.release()
+            yield item
+            break
+        else:
+            # ijson yields nothing for document without array, it's told apart from empty array here
+            document = json.loads(reader.kept)
+            if (not isinstance(document, dict)) or (not isinstance(document.get(key), list)):
+                raise ValueError(f'json document has no \'{key}\' array')
+            return
+
+        yield from items
+    except ijson.JSONError as ex:
+        raise ValueError(f'json document is not valid or truncated: {ex}') from ex
+
+# structural characters outside of strings and special characters inside strings
+_STRUCTURE_PATTERN = re.compile(rb'["{}\[\],:]')
+_STRING_PATTERN = re.compile(rb'["\\]')
+
+_QUOTE = ord('"')
+_BACKSLASH = ord('\\')
+_OPEN_CHARS = (ord('{'), ord('['))
+_CLOSE_CHARS = (ord('}'), ord(']'))
+_OPEN_ARRAY = ord('[')
+_COLON = ord(':')
+_COMMA = ord(',')
+
+def _iter_scanner_items(chunks: Iterable[bytes], key: str, loads) -> Iterator:
+    '''
+    Yields items of top level array attribute with incremental scanner.
+    Scanner jumps between structural characters and decodes every item with loads as soon as it is received.
+    '''
+
+    key_bytes = key.encode('utf-8')
+
+    buffer = bytearray()
+    # position of next byte to scan
+    pos = 0
+
+    depth = 0
+    in_string = False
+    escape = False
+
+    # start of string at top level object and last string, key candidate
+    string_start = -1
+    last_string = None
+    current_key = None
+
+    in_array = False
+    array_done = False
+    item_start = -1
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+
+        buffer += chunk
+        size = len(buffer)
+
+        while pos < size:
+            if in_string:
+                if escape:
+                    escape = False
+                    pos += 1
+                    continue
+
+                match = _STRING_PATTERN.search(buffer, pos)
+                if not match:
+                    pos = size
+                    break
+
+                pos = match.start()
+                if buffer[pos] == _BACKSLASH:
+                    escape = True
+                else:
+                    in_string = False
+                    if string_start >= 0:
+                        last_string = bytes(buffer[string_start:pos])
+                        string_start = -1
+
+                pos += 1
+                continue
+
+            match = _STRUCTURE_PATTERN.search(buffer, pos)
+            if not match:
+                pos = size
+                break
+
+            pos = match.start()
+            char = buffer[pos]
+
+            if char == _QUOTE:
+                in_string = True
+                if depth == 1:
+                    string_start = pos + 1
+            elif char in _OPEN_CHARS:
+                if (depth == 1) and (char == _OPEN_ARRAY) and (current_key == key_bytes) and not array_done:
+                    in_array = True
+                    item_start = pos + 1
+                depth += 1
+            elif char in _CLOSE_CHARS:
+                depth -= 1
+                if in_array and (depth == 1):
+                    item = bytes(buffer[item_start:pos]).strip()
+                    if item:
+                        yield loads(item)
+
+                    in_array = False
+                    array_done = True
+                    item_start = -1
+            elif char == _COLON:
+                if depth == 1:
+                    current_key = last_string
+            elif char == _COMMA:
+                if depth == 1:
+                    current_key = None
+                elif in_array and (depth == 2):
+                    yield loads(bytes(buffer[item_start:pos]).strip())
+                    item_start = pos + 1
+
+            pos += 1
+
+        # drop scanned bytes which are not part of current item or key
+        keep_from = pos
+        if item_start >= 0:
+            keep_from = min(keep_from, item_start)
+        if string_start >= 0:
+            keep_from = min(keep_from, string_start)
+
+        if keep_from > 0:
+            del buffer[:keep_from]
+            pos -= keep_from
+            if item_start >= 0:
+                item_start -= keep_from
+            if string_start >= 0:
+                string_start -= keep_from
+
+    if not array_done:
+        raise ValueError(f'json document has no \'{key}\' array or document is truncated')
+
+def iter_json_items(chunks: Iterable[bytes], key: str = 'value', loads = None) -> Iterator:
+    '''
+    Generator yields items of top level array attribute of json document (like 'value' of TFS/Azure list responses)
+    while document is being downloaded. Only current item is kept in memory.
+    Uses ijson if it's installed, otherwise incremental scanner which decodes items with loads.
+
+    Args:
+        chunks (Iterable[bytes]): chunks of json document, e.g. response.iter_content()
+        key (str): name of top level array attribute. Default: value
+        loads (callable): function decodes json item by scanner. Default: None (json.loads)
+
+    Returns:
+        Iterator of decoded items
+
+    Raises:
+        ValueError if document is not json or has no array attribute
+    '''
+
+    if ijson is not None:
+        return _iter_ijson_items(chunks, key)
+
+    return _iter_scanner_items(chunks, key, loads or json.loads)
@@ -0,0 +1,132 @@
+import inspect
+import contextvars
+from functools import wraps
+from contextlib import contextmanager
+
+# opentelemetry-api is optional dependency: pip install pytfsclient[tracing]
+# Without it spans are not created and tracing costs one None check per call
+try:
+    from opentelemetry import trace
+except ImportError: # pragma: no cover
+    trace = None
+
+_TRACER_NAME = 'pytfsclient'
+
+# Proxy tracer delegates to tracer provider configured by application, even if it's configured later
+_tracer = trace.get_tracer(_TRACER_NAME) if trace else None
+
+def is_enabled() -> bool:
+    '''
+    Returns True if opentelemetry-api is installed
+    '''
+
+    return _tracer is not None
+
+def _clean_attributes(attributes: dict) -> dict:
+    '''
+    Returns attributes with supported values: None values are dropped
+    '''
+
+    return {f'{_TRACER_NAME}.{name}' if '.' not in name else name: value \
+        for name, value in attributes.items() if value is not None}
+
+@contextmanager
+def span(name: str, **attributes):
+    '''
+    Context manager opens span as child of current span. Yields span or None if tracing is disabled.
+    Attribute names without namespace get "pytfsclient." prefix.
+    '''
+
+    if _tracer is None:
+        yield None
+        return
+
+    with _tracer.start_as_current_span(name, attributes=_clean_attributes(attributes)) as current:
+        yield current
+
+def set_attributes(**attributes) -> None:
+    '''
+    Sets attributes of current span. Attribute names without namespace get "pytfsclient." prefix.
+    '''
+
+    if _tracer is None:
+        return
+
+    current = trace.get_current_span()
+    if current.is_recording():
+        current.set_attributes(_clean_attributes(attributes))
+
+def bind_context(func):
+    '''
+    Returns function which runs func in context of caller, so spans opened in executor threads
+    are children of current span
+    '''
+
+    if _tracer is None:
+        return func
+
+    context = contextvars.copy_context()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        # every call gets own copy, context can't be entered by several threads at the same time
+        return context.copy().run(func, *args, **kwargs)
+
+    return wrapper
+
+def traced(name: str = None):
+    '''
+    Decorator opens span around call of function, coroutine or whole iteration of generator.
+    Span name is qualified name of function (e.g. WorkitemClient.get_workitems) if name is None.
+    '''
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if inspect.isgeneratorfunction(func):
+            @wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    yield from func(*args, **kwargs)
+                    return
+
+                # span is current only while generator runs, consumer code between items isn't part of it
+                current = _tracer.start_span(span_name)
+                generator = func(*args, **kwargs)
+                try:
+                    while True:
+                        with trace.use_span(current, end_on_exit=False):
+                            try:
+                                item = next(generator)
+                            except StopIteration:
+                                return
+
+                        yield item
+                finally:
+                    generator.close()
+                    current.end()
+
+            return generator_wrapper
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def coroutine_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return await func(*args, **kwargs)
+
+                with _tracer.start_as_current_span(span_name):
+                    return await func(*args, **kwargs)
+
+            return coroutine_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+
+            with _tracer.start_as_current_span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
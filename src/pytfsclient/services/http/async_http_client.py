@@ -0,0 +1,276 @@
+import time
+import base64
+import asyncio
+from typing import List
+from urllib.parse import urljoin
+from .http_client import HttpClient, HttpException
+from .retry_policy import RetryPolicy, RetryStats
+from .rate_limiter import AdaptiveRateLimiter
+from .json_codec import JsonCodec, get_json_codec
+from .metrics import RequestHook, RequestEvent
+from ..helpers import tracing
+
+# httpx is optional dependency: pip install pytfsclient[async]
+try:
+    import httpx
+except ImportError: # pragma: no cover
+    httpx = None
+
+class AsyncHttpClient:
+    '''
+    Asynchronous Http client public class. Has same surface as HttpClient, but all requests are coroutines.
+    Requires httpx package.
+    '''
+
+    # Constructor
+    def __init__(self, base_url: str, verify: bool=False, max_connections: int=100, retry_policy: RetryPolicy=None, \
+        rate_limiter: AdaptiveRateLimiter=None, json_codec=None, hooks: List[RequestHook]=None) -> None:
+        if httpx is None:
+            raise HttpException('AsyncHttpClient: httpx package is not installed. Use \"pip install pytfsclient[async]\"')
+
+        if not base_url.endswith('/'):
+            base_url += '/'
+
+        # store base url
+        self.__base_url = base_url
+        # store verify ssl
+        self.__verify_ssl = verify
+        # create internal http client. TFS/Azure requests can be long, so timeout is disabled like in requests
+        self.__httpClient = httpx.AsyncClient(verify=verify, timeout=None, follow_redirects=True, \
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections))
+        # retries of throttled and failed requests
+        self.__retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        # optional client side rate limiter shared by all coroutines
+        self.__rate_limiter = rate_limiter
+        # codec of json bodies
+        self.__json_codec = json_codec if isinstance(json_codec, JsonCodec) else get_json_codec(json_codec)
+        # instrumentation hooks
+        self.__hooks: List[RequestHook] = list(hooks or [])
+
+    ## Section properties
+    @property
+    def base_url(self) -> str:
+        return self.__base_url
+
+    @base_url.setter
+    def base_url(self, base_url: str) -> None:
+        if not base_url.endswith('/'):
+            base_url += '/'
+
+        self.__base_url = base_url
+
+    @property
+    def verify_ssl(self) -> bool:
+        return self.__verify_ssl
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self.__retry_policy
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        return self.__retry_policy.stats
+
+    @property
+    def rate_limiter(self) -> AdaptiveRateLimiter:
+        return self.__rate_limiter
+
+    @property
+    def json_codec(self) -> JsonCodec:
+        return self.__json_codec
+
+    @property
+    def hooks(self) -> List[RequestHook]:
+        return list(self.__hooks)
+
+    def add_hook(self, hook: RequestHook) -> None:
+        self.__hooks = self.__hooks + [hook]
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        self.__hooks = [item for item in self.__hooks if item is not hook]
+
+    def read_json(self, response):
+        '''
+        Decodes json body of response with client codec. Raises ValueError if response is not json.
+        '''
+
+        return self.__json_codec.loads(response.content)
+
+    def authentificate_with_password(self, user_name: str, user_password: str) -> None:
+        '''
+        Set NTLM authication. Requires httpx_ntlm package.
+        '''
+
+        if not user_name:
+            raise HttpException('AsyncHttpClient::authentificate_with_password: \"user_name\" can\'t be None')
+
+        if not user_password:
+            raise HttpException('AsyncHttpClient::authentificate_with_password: \"user_password\" can\'t be None')
+
+        try:
+            from httpx_ntlm import HttpNtlmAuth
+        except ImportError:
+            raise HttpException('AsyncHttpClient::authentificate_with_password: httpx_ntlm package is not installed')
+
+        self.__httpClient.auth = HttpNtlmAuth(user_name, user_password)
+
+    def authentificate_with_pat(self, personal_access_token: str) -> None:
+        '''
+        Set personal access token authication (PAT)
+        '''
+
+        if not personal_access_token:
+            raise HttpException('AsyncHttpClient::authentificate_with_pat: personal access token can\'t be None')
+
+        pat = ':' + personal_access_token
+        pat_base64 = b'Basic ' + base64.b64encode(pat.encode("utf8"))
+
+        self.__httpClient.headers.update({'Authorization': pat_base64.decode('ascii')})
+
+    async def close(self) -> None:
+        '''
+        Closes internal connection pool
+        '''
+
+        await self.__httpClient.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    @staticmethod
+    def _data_kwargs(data) -> dict:
+        '''
+        httpx sends raw str/bytes body as content and dictonary as form data
+        '''
+
+        return {'content': data} if isinstance(data, (str, bytes)) else {'data': data}
+
+    async def _send(self, method: str, resource: str, query_params=None, custom_headers=None, attempt: int=0, **kwargs):
+        '''
+        Sends one HTTP request, waits for rate limiter and calls instrumentation hooks
+        '''
+
+        if self.__rate_limiter:
+            delay = self.__rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        url = urljoin(self.__base_url, resource)
+
+        # list is replaced on change, so hooks can be added while requests are sent
+        hooks = self.__hooks
+        if hooks:
+            event = RequestEvent(method, url, attempt, HttpClient._body_size(kwargs.get('content')))
+            for hook in hooks:
+                hook.before_request(event)
+
+        try:
+            with tracing.span(f'HTTP {method}', **HttpClient._span_attributes(method, self.__base_url, url, attempt)) as span:
+                response = await self.__httpClient.request(method, url,
+                    params=query_params,
+                    headers=custom_headers,
+                    **kwargs)
+
+                if span is not None:
+                    span.set_attribute('http.response.status_code', response.status_code)
+        except Exception as ex:
+            if hooks:
+                event.elapsed = time.monotonic() - event.started
+                event.error = ex
+                for hook in hooks:
+                    hook.after_response(event)
+            raise
+
+        if self.__rate_limiter:
+            self.__rate_limiter.update(response.status_code, response.headers)
+
+        if hooks:
+            event.elapsed = time.monotonic() - event.started
+            event.status_code = response.status_code
+            event.bytes_received = len(response.content)
+            for hook in hooks:
+                hook.after_response(event)
+
+        return response
+
+    async def _request(self, method: str, resource: str, query_params=None, custom_headers=None, json_data=None, **kwargs):
+        '''
+        Makes HTTP request, replays safe requests according to retry policy and raises HTTPStatusError for error status codes
+        '''
+
+        # json body is encoded with client codec
+        if json_data is not None:
+            kwargs['content'] = self.__json_codec.dumps(json_data)
+
+            if not any(name.lower() == 'content-type' for name in (custom_headers or {})):
+                custom_headers = dict(custom_headers or {})
+                custom_headers['Content-Type'] = 'application/json'
+
+        policy = self.__retry_policy
+        replayable = policy.is_replayable(method, resource, json_data)
+
+        attempt = 0
+        while True:
+            try:
+                response = await self._send(method, resource, query_params, custom_headers, attempt, **kwargs)
+            except httpx.TransportError:
+                if not (replayable and policy.can_retry_error(attempt)):
+                    raise
+
+                delay = policy.get_delay(attempt)
+            else:
+                if response.is_success or (not policy.should_retry(attempt, response.status_code)) or (not replayable):
+                    break
+
+                delay = policy.get_delay(attempt, response.headers)
+                await response.aclose()
+
+            policy.record_retry(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        response.raise_for_status()
+
+        return response
+
+    async def get(self, resource: str, query_params=None, custom_headers=None, cookies=None):
+        '''
+        Make HTTP GET request
+        '''
+
+        if cookies:
+            custom_headers = dict(custom_headers or {})
+            custom_headers['Cookie'] = '; '.join(f'{name}={value}' for name, value in cookies.items())
+
+        return await self._request('GET', resource, query_params, custom_headers)
+
+    async def post(self, resource: str, data, query_params=None, custom_headers=None):
+        '''
+        Make HTTP POST request
+        '''
+
+        return await self._request('POST', resource, query_params, custom_headers, **AsyncHttpClient._data_kwargs(data))
+
+    async def post_json(self, resource: str, json_data, query_params=None, custom_headers=None):
+        '''
+        Make HTTP POST request with JSON data
+        '''
+
+        return await self._request('POST', resource, query_params, custom_headers, json_data=json_data)
+
+    async def patch(self, resource: str, data, query_params=None, custom_headers=None):
+        '''
+        Make HTTP PATCH request
+        '''
+
+        return await self._request('PATCH', resource, query_params, custom_headers, **AsyncHttpClient._data_kwargs(data))
+
+    async def patch_json(self, resource: str, json_data, query_params=None, custom_headers=None):
+        '''
+        Make HTTP PATCH request with JSON body
+        '''
+
+        return await self._request('PATCH', resource, query_params, custom_headers, json_data=json_data)
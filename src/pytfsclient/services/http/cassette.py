@@ -0,0 +1,265 @@
+import io
+import os
+import gzip
+import json
+import time
+import base64
+import hashlib
+import threading
+from datetime import timedelta
+from collections import deque
+from typing import Dict, List
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from requests import Response, RequestException
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+class CassetteMissError(RequestException):
+    '''
+    Raised in replay mode if cassette has no recorded response for request. Isn't retried by RetryPolicy
+    '''
+    pass
+
+class CassetteTransport(BaseAdapter):
+    '''
+    Record/replay transport of HttpClient: HttpClient(base_url, transport=CassetteTransport(path)).
+    Records request/response pairs to gzip compressed json cassette and replays them without network.
+
+    Requests are matched by method, url with sorted query params and hash of body.
+    Identical requests are replayed in recorded order, the last recorded response is repeated.
+    Authorization, Cookie and Set-Cookie headers are never stored.
+    '''
+
+    MODE_RECORD = 'record'
+    MODE_REPLAY = 'replay'
+    MODE_ONCE = 'once'
+
+    _VERSION = 1
+    _SECRET_HEADERS = ('authorization', 'cookie', 'set-cookie', 'proxy-authorization')
+    # body is stored decoded, so transfer headers of original response are dropped
+    _TRANSFER_HEADERS = ('content-encoding', 'transfer-encoding', 'content-length')
+
+    def __init__(self, path: str, mode: str = MODE_ONCE, latency: float = 0.0, recorded_latency: bool = False, \
+        inner: BaseAdapter = None) -> None:
+        '''
+        CassetteTransport constructor.
+
+        Args:
+            path (str): path of cassette file (*.json.gz)
+            mode (str): record - send requests and record responses; replay - serve recorded responses only;
+                once - replay if cassette file exists, otherwise record. Default: once
+            latency (float): delay in seconds added to every replayed response. Default: 0.0
+            recorded_latency (bool): delay replayed responses by recorded response time. Default: False
+            inner (BaseAdapter): transport sending requests in record mode. Default: None (HTTPAdapter)
+        '''
+
+        super().__init__()
+
+        if mode not in (self.MODE_RECORD, self.MODE_REPLAY, self.MODE_ONCE):
+            raise ValueError(f'CassetteTransport: unknown mode {mode}')
+
+        if mode == self.MODE_ONCE:
+            mode = self.MODE_REPLAY if os.path.exists(path) else self.MODE_RECORD
+
+        self.__path = path
+        self.__mode = mode
+        self.__latency = latency
+        self.__recorded_latency = recorded_latency
+        self.__inner = inner
+
+        self.__lock = threading.Lock()
+        self.__interactions: List[dict] = list()
+        self.__replay: Dict[str, deque] = dict()
+        self.__last: Dict[str, dict] = dict()
+        self.__dirty = False
+
+        if mode == self.MODE_REPLAY:
+            self.__load()
+        elif self.__inner is None:
+            self.__inner = HTTPAdapter()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def mode(self) -> str:
+        '''
+        Returns:
+            Current mode: record or replay
+        '''
+        return self.__mode
+
+    @property
+    def interactions_count(self) -> int:
+        with self.__lock:
+            return len(self.__interactions)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None) -> Response:
+        '''
+        Sends request with inner transport or returns recorded response
+        '''
+
+        key = CassetteTransport._make_key(request.method, request.url, request.body)
+
+        if self.__mode == self.MODE_REPLAY:
+            return self.__replay_response(key, request)
+
+        started = time.monotonic()
+        response = self.__inner.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        # body is downloaded to be recorded
+        content = response.content
+        elapsed = time.monotonic() - started
+
+        interaction = {
+            'key': key,
+            'request': {
+                'method': request.method,
+                'url': request.url,
+            },
+            'response': {
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': CassetteTransport._record_headers(response.headers, content),
+                'elapsed': round(elapsed, 6),
+                **CassetteTransport._encode_body(content)
+            }
+        }
+
+        with self.__lock:
+            self.__interactions.append(interaction)
+            self.__dirty = True
+
+        return response
+
+    def save(self) -> None:
+        '''
+        Writes recorded interactions to cassette file
+        '''
+
+        with self.__lock:
+            if not self.__dirty:
+                return
+
+            document = {
+                'version': self._VERSION,
+                'interactions': self.__interactions
+            }
+
+            directory = os.path.dirname(self.__path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            with gzip.open(self.__path, 'wt', encoding='utf-8') as file:
+                json.dump(document, file, separators=(',', ':'))
+
+            self.__dirty = False
+
+    def close(self) -> None:
+        '''
+        Saves recorded interactions and closes inner transport
+        '''
+
+        self.save()
+
+        if self.__inner is not None:
+            self.__inner.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __load(self) -> None:
+        '''
+        Reads interactions from cassette file
+        '''
+
+        with gzip.open(self.__path, 'rt', encoding='utf-8') as file:
+            document = json.load(file)
+
+        if document.get('version') != self._VERSION:
+            raise ValueError(f'CassetteTransport: unsupported cassette version {document.get("version")}')
+
+        self.__interactions = document['interactions']
+        for interaction in self.__interactions:
+            self.__replay.setdefault(interaction['key'], deque()).append(interaction)
+
+    def __replay_response(self, key: str, request) -> Response:
+        '''
+        Builds response from recorded interaction
+        '''
+
+        with self.__lock:
+            queue = self.__replay.get(key)
+            if queue:
+                interaction = queue.popleft()
+                self.__last[key] = interaction
+            else:
+                interaction = self.__last.get(key)
+
+        if interaction is None:
+            raise CassetteMissError(f'CassetteTransport: no recorded response for {request.method} {request.url}', request=request)
+
+        recorded = interaction['response']
+
+        delay = self.__latency + (recorded.get('elapsed', 0.0) if self.__recorded_latency else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        response = Response()
+        response.status_code = recorded['status']
+        response.reason = recorded.get('reason')
+        response.headers = CaseInsensitiveDict(recorded['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        # raw stream lets requests read body like body of real response, streamed or not
+        response.raw = io.BytesIO(CassetteTransport._decode_body(recorded))
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=delay)
+        response.connection = self
+
+        return response
+
+    @staticmethod
+    def _make_key(method: str, url: str, body) -> str:
+        '''
+        Returns key of request: method, url with sorted query params and hash of body
+        '''
+
+        parts = urlsplit(url)
+        query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+        normalized_url = urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, query, ''))
+
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        body_hash = hashlib.sha1(body).hexdigest()[:16] if body else ''
+
+        return f'{method} {normalized_url} {body_hash}'.rstrip()
+
+    @staticmethod
+    def _record_headers(headers, content: bytes) -> dict:
+        recorded = {name: value for name, value in headers.items() \
+            if name.lower() not in CassetteTransport._SECRET_HEADERS + CassetteTransport._TRANSFER_HEADERS}
+        recorded['Content-Length'] = str(len(content or b''))
+
+        return recorded
+
+    @staticmethod
+    def _encode_body(content: bytes) -> dict:
+        if not content:
+            return {'body': ''}
+
+        try:
+            return {'body': content.decode('utf-8')}
+        except UnicodeDecodeError:
+            return {'body_base64': base64.b64encode(content).decode('ascii')}
+
+    @staticmethod
+    def _decode_body(recorded: dict) -> bytes:
+        if 'body_base64' in recorded:
+            return base64.b64decode(recorded['body_base64'])
+
+        return recorded.get('body', '').encode('utf-8')
@@ -0,0 +1,203 @@
+import threading
+from collections import OrderedDict
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+class HttpCacheStats:
+    '''
+    Snapshot of HttpCache counters. Use HttpClient::http_cache.stats.
+    '''
+
+    def __init__(self, hits: int, misses: int, evictions: int, size: int, max_entries: int) -> None:
+        self.__hits = hits
+        self.__misses = misses
+        self.__evictions = evictions
+        self.__size = size
+        self.__max_entries = max_entries
+
+    @property
+    def hits(self) -> int:
+        '''
+        Returns:
+            Number of 304 Not Modified responses served from cache
+        '''
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        '''
+        Returns:
+            Number of GET requests which downloaded full response
+        '''
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        '''
+        Returns:
+            Number of least recently used entries removed from cache
+        '''
+        return self.__evictions
+
+    @property
+    def size(self) -> int:
+        '''
+        Returns:
+            Number of cached responses
+        '''
+        return self.__size
+
+    @property
+    def max_entries(self) -> int:
+        '''
+        Returns:
+            Max number of cached responses
+        '''
+        return self.__max_entries
+
+    @property
+    def hit_ratio(self) -> float:
+        '''
+        Returns:
+            Share of requests served from cache
+        '''
+        total = self.__hits + self.__misses
+        return self.__hits / total if total else 0.0
+
+class _CacheEntry:
+    '''
+    Cached GET response with its validators
+    '''
+
+    __slots__ = ('etag', 'last_modified', 'status_code', 'headers', 'content', 'encoding')
+
+    def __init__(self, response: Response) -> None:
+        self.etag = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+        self.status_code = response.status_code
+        self.headers = dict(response.headers)
+        self.content = response.content
+        self.encoding = response.encoding
+
+class HttpCache:
+    '''
+    Conditional GET cache of HttpClient with LRU eviction.
+    Stores responses with ETag or Last-Modified headers, sends If-None-Match / If-Modified-Since
+    and serves cached body when server answers 304 Not Modified.
+    '''
+
+    def __init__(self, max_entries: int = 256) -> None:
+        '''
+        HttpCache constructor.
+
+        Args:
+            max_entries (int): max number of cached responses. Default: 256
+        '''
+
+        self.__max_entries = max(1, max_entries)
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock = threading.Lock()
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @property
+    def stats(self) -> HttpCacheStats:
+        '''
+        Returns:
+            Snapshot of cache counters: HttpCacheStats
+        '''
+
+        with self.__lock:
+            return HttpCacheStats(self.__hits, self.__misses, self.__evictions, len(self.__entries), self.__max_entries)
+
+    @staticmethod
+    def make_key(resource: str, query_params = None, custom_headers = None) -> tuple:
+        '''
+        Returns cache key of GET request
+        '''
+
+        params = tuple(sorted((str(name), str(value)) for name, value in query_params.items())) if query_params else ()
+        headers = tuple(sorted((str(name).lower(), str(value)) for name, value in custom_headers.items())) if custom_headers else ()
+
+        return (resource, params, headers)
+
+    def get_conditional_headers(self, key: tuple) -> dict:
+        '''
+        Returns If-None-Match / If-Modified-Since headers for cached request or empty dictonary
+        '''
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+        headers = {}
+        if entry:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        return headers
+
+    def process_response(self, key: tuple, response: Response) -> Response:
+        '''
+        Returns cached response for 304 Not Modified or stores new response in cache.
+        304 is returned as is if its entry was evicted while request was sent, caller requests resource again
+        without conditional headers.
+        '''
+
+        if response.status_code == 304:
+            with self.__lock:
+                entry = self.__entries.get(key)
+                if entry:
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+
+            # miss is counted by repeated request
+            return HttpCache._build_response(entry, response) if entry else response
+
+        with self.__lock:
+            self.__misses += 1
+
+            if (response.status_code == 200) and (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+                self.__entries[key] = _CacheEntry(response)
+                self.__entries.move_to_end(key)
+
+                while len(self.__entries) > self.__max_entries:
+                    self.__entries.popitem(last=False)
+                    self.__evictions += 1
+            else:
+                self.__entries.pop(key, None)
+
+        return response
+
+    def invalidate(self, resource: str = None) -> None:
+        '''
+        Removes cached responses of given resource or all responses if resource is None
+        '''
+
+        with self.__lock:
+            if resource is None:
+                self.__entries.clear()
+            else:
+                for key in [key for key in self.__entries.keys() if key[0] == resource]:
+                    del self.__entries[key]
+
+    @staticmethod
+    def _build_response(entry: _CacheEntry, not_modified: Response) -> Response:
+        '''
+        Creates response from cache entry for 304 Not Modified response
+        '''
+
+        response = Response()
+        response.status_code = entry.status_code
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response._content = entry.content
+        response.encoding = entry.encoding
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.elapsed = not_modified.elapsed
+
+        return response
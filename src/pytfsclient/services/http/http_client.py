@@ -1,8 +1,21 @@
+import copy
+import time
 import base64
+import threading
 import requests
+from typing import List
+from requests.adapters import BaseAdapter, HTTPAdapter
 from requests.packages import urllib3
 from urllib.parse import urljoin
 from requests_ntlm import HttpNtlmAuth
+from .retry_policy import RetryPolicy, RetryStats
+from .rate_limiter import AdaptiveRateLimiter
+from .http_cache import HttpCache
+from .single_flight import SingleFlight
+from .json_codec import JsonCodec, get_json_codec
+from .metrics import RequestHook, RequestEvent, endpoint_template
+from ..helpers.json_stream import iter_json_items
+from ..helpers import tracing
 
 ### DISABLE HTTPS INSECURE WARNING
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -37,13 +50,128 @@ class _BaseUrlSession(requests.Session):
 
         return urljoin(self.base_url, url)
     
+class ConnectionPoolStats:
+    '''
+    Snapshot of connection pool usage of HttpClient. Use HttpClient::pool_stats.
+    If saturated_requests grows, pool_maxsize is too small for number of concurrent threads.
+    '''
+
+    def __init__(self, pool_maxsize: int, pool_block: bool, in_flight: int, peak_in_flight: int, \
+        saturated_requests: int, connections_created: int, requests_sent: int, idle_connections: int) -> None:
+        self.__pool_maxsize = pool_maxsize
+        self.__pool_block = pool_block
+        self.__in_flight = in_flight
+        self.__peak_in_flight = peak_in_flight
+        self.__saturated_requests = saturated_requests
+        self.__connections_created = connections_created
+        self.__requests_sent = requests_sent
+        self.__idle_connections = idle_connections
+
+    @property
+    def pool_maxsize(self) -> int:
+        '''
+        Returns:
+            Max number of connections kept in pool for one host
+        '''
+        return self.__pool_maxsize
+
+    @property
+    def pool_block(self) -> bool:
+        '''
+        Returns:
+            True if requests wait for free connection when pool is full
+        '''
+        return self.__pool_block
+
+    @property
+    def in_flight(self) -> int:
+        '''
+        Returns:
+            Number of requests executing now
+        '''
+        return self.__in_flight
+
+    @property
+    def peak_in_flight(self) -> int:
+        '''
+        Returns:
+            Max number of requests executed at the same time
+        '''
+        return self.__peak_in_flight
+
+    @property
+    def saturated_requests(self) -> int:
+        '''
+        Returns:
+            Number of requests started when all pooled connections were busy
+        '''
+        return self.__saturated_requests
+
+    @property
+    def connections_created(self) -> int:
+        '''
+        Returns:
+            Number of connections opened by pool. Growth above pool_maxsize means connections are discarded and reopened
+        '''
+        return self.__connections_created
+
+    @property
+    def requests_sent(self) -> int:
+        '''
+        Returns:
+            Number of requests sent through pool
+        '''
+        return self.__requests_sent
+
+    @property
+    def idle_connections(self) -> int:
+        '''
+        Returns:
+            Number of idle connections in pool
+        '''
+        return self.__idle_connections
+
+    @property
+    def is_saturated(self) -> bool:
+        '''
+        Returns:
+            True if number of concurrent requests exceeded pool size
+        '''
+        return self.__saturated_requests > 0
+
 class HttpClient:
     '''
     Http client public class
     '''
 
+    # Size of chunks read from streamed responses
+    _STREAM_CHUNK_SIZE = 64 * 1024
+
     # Constructor
-    def __init__(self, base_url: str, verify: bool=False) -> None:
+    def __init__(self, base_url: str, verify: bool=False, pool_connections: int=10, pool_maxsize: int=10, \
+        pool_block: bool=False, keep_alive: bool=True, retry_policy: RetryPolicy=None, \
+        rate_limiter: AdaptiveRateLimiter=None, http_cache: HttpCache=None, json_codec=None, \
+        hooks: List[RequestHook]=None, transport: BaseAdapter=None, single_flight: SingleFlight=None) -> None:
+        '''
+        HttpClient constructor.
+
+        Args:
+            base_url (str): URL of TFS/Azure service
+            verify (bool): flag for verifing SSL. Default is False
+            pool_connections (int): number of hosts to keep connection pools for. Default is 10
+            pool_maxsize (int): max number of connections kept in pool for one host. Set it to number of concurrent threads. Default is 10
+            pool_block (bool): wait for free connection instead of opening and discarding extra connection. Default is False
+            keep_alive (bool): reuse connections between requests. NTLM authorization requires keep alive. Default is True
+            retry_policy (RetryPolicy): retry policy for throttled and failed requests. Default is RetryPolicy()
+            rate_limiter (AdaptiveRateLimiter): client side rate limiter shared by all threads. Default is None
+            http_cache (HttpCache): conditional GET cache (ETag / Last-Modified). Default is None
+            json_codec (JsonCodec | str): codec or codec name (orjson, ujson, json). Default is None (fastest installed)
+            hooks (List[RequestHook]): instrumentation hooks called for every request attempt, e.g. MetricsCollector. Default is None
+            transport (BaseAdapter): transport used instead of connection pool, e.g. CassetteTransport. Default is None
+            single_flight (SingleFlight): coalesces identical concurrent GET and read-only POST requests
+                (wit/workitemsbatch, wit/wiql) into one request. Default is None
+        '''
+
         if not base_url.endswith('/'):
             base_url += '/'
         
@@ -54,6 +182,44 @@ class HttpClient:
         # store verify ssl
         self.__verify_ssl = verify
 
+        # configure connection pool
+        self.__pool_maxsize = pool_maxsize
+        self.__pool_block = pool_block
+        self.__adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+        # custom transport replaces connection pool, e.g. record/replay of requests
+        self.__transport = transport
+        self.__httpClient.mount('http://', transport or self.__adapter)
+        self.__httpClient.mount('https://', transport or self.__adapter)
+
+        self.__keep_alive = keep_alive
+        if not keep_alive:
+            self.__httpClient.headers.update({'Connection': 'close'})
+
+        # retries of throttled and failed requests
+        self.__retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+
+        # optional client side rate limiter
+        self.__rate_limiter = rate_limiter
+
+        # codec of json bodies
+        self.__json_codec = json_codec if isinstance(json_codec, JsonCodec) else get_json_codec(json_codec)
+
+        # optional conditional GET cache
+        self.__http_cache = http_cache
+
+        # optional coalescing of identical in-flight GET and read-only POST requests
+        self.__single_flight = single_flight
+
+        # instrumentation hooks
+        self.__hooks: List[RequestHook] = list(hooks or [])
+
+        # pool usage counters
+        self.__stats_lock = threading.Lock()
+        self.__in_flight = 0
+        self.__peak_in_flight = 0
+        self.__saturated_requests = 0
+
     ## Section properties
     @property
     def base_url(self) -> str:
@@ -70,6 +236,130 @@ class HttpClient:
     @property
     def verify_ssl(self) -> bool:
         return self.__verify_ssl
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        '''
+        Returns:
+            Retry policy of client: RetryPolicy
+        '''
+        return self.__retry_policy
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        '''
+        Returns:
+            Snapshot of retry counters: RetryStats
+        '''
+        return self.__retry_policy.stats
+
+    @property
+    def rate_limiter(self) -> AdaptiveRateLimiter:
+        '''
+        Returns:
+            Client side rate limiter or None: AdaptiveRateLimiter
+        '''
+        return self.__rate_limiter
+
+    @property
+    def json_codec(self) -> JsonCodec:
+        '''
+        Returns:
+            Codec of json bodies: JsonCodec
+        '''
+        return self.__json_codec
+
+    def read_json(self, response):
+        '''
+        Decodes json body of response with client codec. Raises ValueError if response is not json.
+        '''
+
+        return self.__json_codec.loads(response.content)
+
+    def iter_json_items(self, response, key: str = 'value'):
+        '''
+        Generator yields items of top level array attribute of streamed response (requested with stream=True)
+        while body is being downloaded. Response is closed when generator is exhausted or closed.
+        Raises ValueError if response is not json or has no array attribute.
+        '''
+
+        try:
+            yield from iter_json_items(response.iter_content(chunk_size=self._STREAM_CHUNK_SIZE), key, self.__json_codec.loads)
+        finally:
+            response.close()
+
+    @property
+    def transport(self) -> BaseAdapter:
+        '''
+        Returns:
+            Custom transport or None if requests are sent with connection pool: BaseAdapter
+        '''
+        return self.__transport
+
+    @property
+    def hooks(self) -> List[RequestHook]:
+        '''
+        Returns:
+            Copy of list of instrumentation hooks: List[RequestHook]
+        '''
+        return list(self.__hooks)
+
+    def add_hook(self, hook: RequestHook) -> None:
+        '''
+        Adds instrumentation hook called for every request attempt
+        '''
+
+        self.__hooks = self.__hooks + [hook]
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        '''
+        Removes instrumentation hook
+        '''
+
+        self.__hooks = [item for item in self.__hooks if item is not hook]
+
+    @property
+    def http_cache(self) -> HttpCache:
+        '''
+        Returns:
+            Conditional GET cache or None: HttpCache
+        '''
+        return self.__http_cache
+
+    @property
+    def single_flight(self) -> SingleFlight:
+        '''
+        Returns:
+            Coalescing of identical in-flight GET and read-only POST requests or None: SingleFlight
+        '''
+        return self.__single_flight
+
+    @property
+    def pool_stats(self) -> ConnectionPoolStats:
+        '''
+        Returns:
+            Snapshot of connection pool usage: ConnectionPoolStats
+        '''
+
+        connections_created = 0
+        requests_sent = 0
+        idle_connections = 0
+
+        pools = self.__adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+
+            connections_created += pool.num_connections
+            requests_sent += pool.num_requests
+            # Pool queue contains idle connections and None placeholders for not opened ones
+            idle_connections += sum(1 for conn in list(pool.pool.queue) if conn is not None) if pool.pool else 0
+
+        with self.__stats_lock:
+            return ConnectionPoolStats(self.__pool_maxsize, self.__pool_block, \
+                self.__in_flight, self.__peak_in_flight, self.__saturated_requests, \
+                connections_created, requests_sent, idle_connections)
     
     def authentificate_with_password(self, user_name: str, user_password: str) -> None:
         '''
@@ -82,6 +372,9 @@ class HttpClient:
         if not user_password:
             raise HttpException('HttpClient::authentificate_with_password: \"user_password\" can\'t be None')
 
+        if not self.__keep_alive:
+            raise HttpException('HttpClient::authentificate_with_password: NTLM authorization requires keep_alive connections')
+
         self.__httpClient.auth = HttpNtlmAuth(user_name, user_password)
 
     def authentificate_with_pat(self, personal_access_token: str) -> None:
@@ -96,71 +389,212 @@ class HttpClient:
         pat_base64 = b'Basic ' + base64.b64encode(pat.encode("utf8"))
 
         self.__httpClient.headers.update({'Authorization': pat_base64})
-    
-    def get(self, resource: str, query_params=None, custom_headers=None, cookies=None):
-        """Make HTTP GET request"""
-
-        response = self.__httpClient.get(resource, 
-            params=query_params, 
-            headers=custom_headers,
-            cookies=cookies,
-            verify=self.__verify_ssl)
-        response.raise_for_status()
+
+    def _auth_key(self) -> tuple:
+        '''
+        Returns identity of current authorization, requests of different users are never coalesced
+        '''
+
+        return (self.__httpClient.headers.get('Authorization'), id(self.__httpClient.auth))
+
+    def _send(self, method: str, resource: str, query_params=None, custom_headers=None, attempt: int=0, **kwargs):
+        '''
+        Sends one HTTP request, waits for rate limiter, tracks connection pool usage and calls instrumentation hooks
+        '''
+
+        if self.__rate_limiter:
+            delay = self.__rate_limiter.reserve()
+            if delay > 0:
+                time.sleep(delay)
+
+        # list is replaced on change, so hooks can be added while requests are sent
+        hooks = self.__hooks
+        if hooks:
+            event = RequestEvent(method, urljoin(self.__base_url, resource), attempt, HttpClient._body_size(kwargs.get('data')))
+            for hook in hooks:
+                hook.before_request(event)
+
+        with self.__stats_lock:
+            if self.__in_flight >= self.__pool_maxsize:
+                self.__saturated_requests += 1
+
+            self.__in_flight += 1
+            self.__peak_in_flight = max(self.__peak_in_flight, self.__in_flight)
+
+        try:
+            with tracing.span(f'HTTP {method}', **HttpClient._span_attributes(method, self.__base_url, resource, attempt)) as span:
+                response = self.__httpClient.request(method, resource,
+                    params=query_params,
+                    headers=custom_headers,
+                    verify=self.__verify_ssl,
+                    **kwargs)
+
+                if span is not None:
+                    span.set_attribute('http.response.status_code', response.status_code)
+        except Exception as ex:
+            if hooks:
+                event.elapsed = time.monotonic() - event.started
+                event.error = ex
+                for hook in hooks:
+                    hook.after_response(event)
+            raise
+        finally:
+            with self.__stats_lock:
+                self.__in_flight -= 1
+
+        if self.__rate_limiter:
+            self.__rate_limiter.update(response.status_code, response.headers)
+
+        if hooks:
+            event.elapsed = time.monotonic() - event.started
+            event.status_code = response.status_code
+            event.bytes_received = HttpClient._response_size(response, kwargs.get('stream', False))
+            for hook in hooks:
+                hook.after_response(event)
 
         return response
-    
-    def post(self, resource: str, data, query_params=None, custom_headers=None):
+
+    @staticmethod
+    def _span_attributes(method: str, base_url: str, resource: str, attempt: int) -> dict:
+        if not tracing.is_enabled():
+            return {}
+
+        url = urljoin(base_url, resource)
+        return {
+            'http.request.method': method,
+            'url.full': url,
+            'endpoint': endpoint_template(url),
+            'attempt': attempt
+        }
+
+    @staticmethod
+    def _body_size(data) -> int:
+        if isinstance(data, bytes):
+            return len(data)
+        if isinstance(data, str):
+            return len(data.encode('utf-8'))
+
+        return 0
+
+    @staticmethod
+    def _response_size(response, stream: bool) -> int:
+        # body of streamed response isn't downloaded yet
+        if stream:
+            length = response.headers.get('Content-Length')
+            return int(length) if length and length.isdigit() else None
+
+        return len(response.content)
+
+    def _request(self, method: str, resource: str, query_params=None, custom_headers=None, json_data=None, **kwargs):
         '''
-        Make HTTP POST request
+        Makes HTTP request, replays safe requests according to retry policy and raises HTTPError for error status codes
         '''
 
-        response = self.__httpClient.post(resource, 
-            data=data, 
-            params=query_params, 
-            headers=custom_headers,
-            verify=self.__verify_ssl)
+        # json body is encoded with client codec
+        if json_data is not None:
+            kwargs['data'] = self.__json_codec.dumps(json_data)
+
+            if not any(name.lower() == 'content-type' for name in (custom_headers or {})):
+                custom_headers = dict(custom_headers or {})
+                custom_headers['Content-Type'] = 'application/json'
+
+        policy = self.__retry_policy
+        replayable = policy.is_replayable(method, resource, json_data)
+
+        attempt = 0
+        while True:
+            try:
+                response = self._send(method, resource, query_params, custom_headers, attempt, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not (replayable and policy.can_retry_error(attempt)):
+                    raise
+
+                delay = policy.get_delay(attempt)
+            else:
+                if response.ok or (not policy.should_retry(attempt, response.status_code)) or (not replayable):
+                    break
+
+                delay = policy.get_delay(attempt, response.headers)
+                response.close()
+
+            policy.record_retry(delay)
+            time.sleep(delay)
+            attempt += 1
+
         response.raise_for_status()
 
         return response
     
-    def post_json(self, resource: str, json_data, query_params=None, custom_headers=None):
+    def get(self, resource: str, query_params=None, custom_headers=None, cookies=None, stream: bool=False):
+        """Make HTTP GET request. Body of streamed response (stream=True) is downloaded on read"""
+
+        if stream:
+            return self._request('GET', resource, query_params, custom_headers, cookies=cookies, stream=True)
+
+        # requests with cookies are neither coalesced nor cached
+        if cookies:
+            return self._request('GET', resource, query_params, custom_headers, cookies=cookies)
+
+        if not self.__single_flight:
+            return self._get(resource, query_params, custom_headers)
+
+        # waiting callers get copies of response with downloaded body
+        key = ('GET', HttpCache.make_key(resource, query_params, custom_headers), self._auth_key())
+        return self.__single_flight.do(key, lambda: self._get(resource, query_params, custom_headers), share=copy.copy)
+
+    def _get(self, resource: str, query_params=None, custom_headers=None):
         '''
-        Make HTTP POST request with JSON data
+        Makes HTTP GET request through conditional GET cache if it is set
         '''
 
-        response = self.__httpClient.post(resource, 
-            json=json_data, 
-            params=query_params, 
-            headers=custom_headers,
-            verify=self.__verify_ssl)
-        response.raise_for_status()
+        if not self.__http_cache:
+            return self._request('GET', resource, query_params, custom_headers)
+
+        cache_key = HttpCache.make_key(resource, query_params, custom_headers)
+        conditional_headers = self.__http_cache.get_conditional_headers(cache_key)
+        if conditional_headers:
+            conditional_headers.update(custom_headers or {})
+
+        response = self._request('GET', resource, query_params, conditional_headers or custom_headers)
+        response = self.__http_cache.process_response(cache_key, response)
+
+        # entry was evicted by other request after conditional headers were sent, 304 has no body
+        if conditional_headers and (response.status_code == 304):
+            response = self._request('GET', resource, query_params, custom_headers)
+            response = self.__http_cache.process_response(cache_key, response)
 
         return response
     
+    def post(self, resource: str, data, query_params=None, custom_headers=None):
+        '''
+        Make HTTP POST request
+        '''
+
+        return self._request('POST', resource, query_params, custom_headers, data=data)
+    
+    def post_json(self, resource: str, json_data, query_params=None, custom_headers=None, stream: bool=False):
+        '''
+        Make HTTP POST request with JSON data. Body of streamed response (stream=True) is downloaded on read
+        '''
+
+        if (not self.__single_flight) or stream or (not self.__retry_policy.is_replayable('POST', resource)):
+            return self._request('POST', resource, query_params, custom_headers, json_data=json_data, stream=stream)
+
+        # read-only POST requests (e.g. wit/workitemsbatch) are coalesced like GET requests
+        key = ('POST', HttpCache.make_key(resource, query_params, custom_headers), self.__json_codec.dumps(json_data), self._auth_key())
+        return self.__single_flight.do(key, \
+            lambda: self._request('POST', resource, query_params, custom_headers, json_data=json_data), share=copy.copy)
+    
     def patch(self, resource: str, data, query_params=None, custom_headers=None):
         '''
         Make HTTP PATCH request
         '''
 
-        response = self.__httpClient.patch(resource,
-            data=data,
-            params=query_params,
-            headers=custom_headers,
-            verify=self.__verify_ssl)
-        response.raise_for_status()
-
-        return response
+        return self._request('PATCH', resource, query_params, custom_headers, data=data)
     
     def patch_json(self, resource: str, json_data, query_params=None, custom_headers=None):
         '''
         Make HTTP PATCH request with JSON body
         '''
 
-        response = self.__httpClient.patch(resource,
-            json=json_data,
-            params=query_params,
-            headers=custom_headers,
-            verify=self.__verify_ssl)
-        response.raise_for_status()
-
-        return response
\ No newline at end of file
+        return self._request('PATCH', resource, query_params, custom_headers, json_data=json_data)
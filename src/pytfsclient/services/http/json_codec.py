@@ -0,0 +1,93 @@
+import json
+
+class JsonCodec:
+    '''
+    JSON codec used by HttpClient to decode responses and encode request bodies.
+    Use get_json_codec() to get fastest installed codec: orjson, ujson or stdlib json.
+    '''
+
+    def __init__(self, name: str, loads, dumps) -> None:
+        '''
+        JsonCodec constructor.
+
+        Args:
+            name (str): codec name
+            loads (callable): function decodes bytes or str to python object
+            dumps (callable): function encodes python object to bytes
+        '''
+
+        self.__name = name
+        self.__loads = loads
+        self.__dumps = dumps
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    def loads(self, content):
+        '''
+        Decodes JSON document. Raises ValueError if content is not JSON.
+        '''
+
+        return self.__loads(content)
+
+    def dumps(self, obj) -> bytes:
+        '''
+        Encodes python object to UTF-8 JSON document
+        '''
+
+        return self.__dumps(obj)
+
+    def __repr__(self) -> str:
+        return f'JsonCodec({self.__name})'
+
+def _create_orjson_codec() -> JsonCodec:
+    import orjson
+
+    # orjson.JSONDecodeError is subclass of ValueError
+    return JsonCodec('orjson', orjson.loads, orjson.dumps)
+
+def _create_ujson_codec() -> JsonCodec:
+    import ujson
+
+    return JsonCodec('ujson', ujson.loads, \
+        lambda obj: ujson.dumps(obj, ensure_ascii=False).encode('utf-8'))
+
+def _create_stdlib_codec() -> JsonCodec:
+    return JsonCodec('json', json.loads, \
+        lambda obj: json.dumps(obj, separators=(',', ':')).encode('utf-8'))
+
+_CODEC_FACTORIES = {
+    'orjson' : _create_orjson_codec,
+    'ujson' : _create_ujson_codec,
+    'json' : _create_stdlib_codec,
+}
+
+def get_json_codec(name: str = None) -> JsonCodec:
+    '''
+    Returns JSON codec with given name or fastest installed codec.
+
+    Args:
+        name (str): codec name: orjson, ujson or json. Default: None (first installed of orjson, ujson, json)
+
+    Returns:
+        Instance of JsonCodec
+
+    Raises:
+        ValueError if codec name is unknown
+        ImportError if requested codec is not installed
+    '''
+
+    if name:
+        if name not in _CODEC_FACTORIES:
+            raise ValueError(f'Unknown json codec: {name}. Possible options are {list(_CODEC_FACTORIES.keys())}')
+
+        return _CODEC_FACTORIES[name]()
+
+    for factory in _CODEC_FACTORIES.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+
+    return _create_stdlib_codec()
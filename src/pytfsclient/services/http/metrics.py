@@ -0,0 +1,364 @@
+import re
+import time
+import threading
+from typing import List, Dict, Tuple
+from urllib.parse import urlsplit
+
+# Path segments replaced with {id}: numbers, GUIDs and descriptors of identities
+_ID_SEGMENT_PATTERN = re.compile(r'^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$')
+_API_PATTERN = re.compile(r'/_apis?/')
+
+def endpoint_template(url: str) -> str:
+    '''
+    Returns logical endpoint of request url: path after _apis/ without query,
+    numbers and GUIDs are replaced with {id}. Example: wit/workitems/{id}/updates
+    '''
+
+    path = urlsplit(url).path
+
+    match = _API_PATTERN.search(path)
+    if match:
+        path = path[match.end():]
+
+    segments = [segment for segment in path.split('/') if segment]
+    return '/'.join('{id}' if _ID_SEGMENT_PATTERN.match(segment) else segment.lower() for segment in segments)
+
+class RequestEvent:
+    '''
+    Information about one HTTP request attempt passed to RequestHook.
+    Response attributes are set before RequestHook::after_response() call.
+    '''
+
+    __slots__ = ('method', 'url', 'endpoint', 'attempt', 'bytes_sent', 'started', \
+        'status_code', 'elapsed', 'bytes_received', 'error')
+
+    def __init__(self, method: str, url: str, attempt: int, bytes_sent: int) -> None:
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint_template(url)
+        # 0 - first attempt, greater than 0 - retry
+        self.attempt = attempt
+        self.bytes_sent = bytes_sent
+        self.started = time.monotonic()
+
+        self.status_code: int = None
+        self.elapsed: float = None
+        self.bytes_received: int = None
+        self.error: Exception = None
+
+    @property
+    def is_retry(self) -> bool:
+        return self.attempt > 0
+
+class RequestHook:
+    '''
+    Base class of HttpClient instrumentation hooks. Hooks are called for every request attempt (retries included)
+    from threads which send requests, so implementations must be thread safe and fast.
+    '''
+
+    def before_request(self, event: RequestEvent) -> None:
+        '''
+        Called before request is sent
+        '''
+        pass
+
+    def after_response(self, event: RequestEvent) -> None:
+        '''
+        Called after response is received or request failed (event.error is set)
+        '''
+        pass
+
+class EndpointMetrics:
+    '''
+    Snapshot of metrics of one endpoint and HTTP method
+    '''
+
+    def __init__(self, method: str, endpoint: str, count: int, errors: int, retries: int, total_seconds: float, \
+        max_seconds: float, bytes_sent: int, bytes_received: int, status_codes: Dict[int, int], \
+        buckets: List[Tuple[float, int]]) -> None:
+        self.__method = method
+        self.__endpoint = endpoint
+        self.__count = count
+        self.__errors = errors
+        self.__retries = retries
+        self.__total_seconds = total_seconds
+        self.__max_seconds = max_seconds
+        self.__bytes_sent = bytes_sent
+        self.__bytes_received = bytes_received
+        self.__status_codes = status_codes
+        self.__buckets = buckets
+
+    @property
+    def method(self) -> str:
+        return self.__method
+
+    @property
+    def endpoint(self) -> str:
+        '''
+        Returns:
+            Templated endpoint, e.g. wit/workitems/{id}/updates
+        '''
+        return self.__endpoint
+
+    @property
+    def count(self) -> int:
+        '''
+        Returns:
+            Number of request attempts
+        '''
+        return self.__count
+
+    @property
+    def errors(self) -> int:
+        '''
+        Returns:
+            Number of attempts failed without response (connection errors, timeouts)
+        '''
+        return self.__errors
+
+    @property
+    def retries(self) -> int:
+        '''
+        Returns:
+            Number of retried attempts
+        '''
+        return self.__retries
+
+    @property
+    def total_seconds(self) -> float:
+        return self.__total_seconds
+
+    @property
+    def max_seconds(self) -> float:
+        return self.__max_seconds
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.__total_seconds / self.__count if self.__count else 0.0
+
+    @property
+    def bytes_sent(self) -> int:
+        return self.__bytes_sent
+
+    @property
+    def bytes_received(self) -> int:
+        return self.__bytes_received
+
+    @property
+    def status_codes(self) -> Dict[int, int]:
+        '''
+        Returns:
+            Number of responses by status code
+        '''
+        return dict(self.__status_codes)
+
+    @property
+    def buckets(self) -> List[Tuple[float, int]]:
+        '''
+        Returns:
+            Latency histogram: list of (upper bound in seconds, cumulative count), last bound is +Inf
+        '''
+        return list(self.__buckets)
+
+    def quantile(self, q: float) -> float:
+        '''
+        Returns estimated latency quantile in seconds: upper bound of histogram bucket (max latency for +Inf bucket)
+        '''
+
+        if not self.__count:
+            return 0.0
+
+        rank = q * self.__count
+        for bound, count in self.__buckets:
+            if count >= rank:
+                return min(bound, self.__max_seconds)
+
+        return self.__max_seconds
+
+class MetricsSnapshot:
+    '''
+    Snapshot of MetricsCollector. Use MetricsCollector::snapshot()
+    '''
+
+    def __init__(self, endpoints: List[EndpointMetrics]) -> None:
+        self.__endpoints = endpoints
+
+    @property
+    def endpoints(self) -> List[EndpointMetrics]:
+        '''
+        Returns:
+            Metrics of endpoints sorted by total time, the slowest first
+        '''
+        return list(self.__endpoints)
+
+    @property
+    def total_requests(self) -> int:
+        return sum(endpoint.count for endpoint in self.__endpoints)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(endpoint.total_seconds for endpoint in self.__endpoints)
+
+    def get(self, method: str, endpoint: str) -> EndpointMetrics:
+        '''
+        Returns metrics of endpoint or None
+        '''
+
+        for metrics in self.__endpoints:
+            if (metrics.method == method) and (metrics.endpoint == endpoint):
+                return metrics
+
+        return None
+
+class _EndpointCounters:
+    '''
+    Mutable counters of one endpoint, guarded by lock of MetricsCollector
+    '''
+
+    __slots__ = ('count', 'errors', 'retries', 'total_seconds', 'max_seconds', \
+        'bytes_sent', 'bytes_received', 'status_codes', 'bucket_counts')
+
+    def __init__(self, bucket_count: int) -> None:
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.status_codes: Dict[int, int] = {}
+        self.bucket_counts = [0] * bucket_count
+
+class MetricsCollector(RequestHook):
+    '''
+    Built-in RequestHook which records count, latency histogram, bytes in and out, status codes and retries
+    per HTTP method and templated endpoint. Use snapshot() or to_prometheus() to read metrics.
+    '''
+
+    # Default latency buckets in seconds
+    DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        '''
+        MetricsCollector constructor.
+
+        Args:
+            buckets (Tuple[float]): upper bounds of latency histogram buckets in seconds. Default: DEFAULT_BUCKETS
+        '''
+
+        self.__bounds = tuple(sorted(buckets)) + (float('inf'),)
+        self.__counters: Dict[Tuple[str, str], _EndpointCounters] = {}
+        self.__lock = threading.Lock()
+
+    def after_response(self, event: RequestEvent) -> None:
+        bucket = next(index for index, bound in enumerate(self.__bounds) if event.elapsed <= bound)
+
+        with self.__lock:
+            key = (event.method, event.endpoint)
+
+            counters = self.__counters.get(key)
+            if counters is None:
+                counters = self.__counters[key] = _EndpointCounters(len(self.__bounds))
+
+            counters.count += 1
+            counters.total_seconds += event.elapsed
+            counters.max_seconds = max(counters.max_seconds, event.elapsed)
+            counters.bucket_counts[bucket] += 1
+            counters.bytes_sent += event.bytes_sent or 0
+            counters.bytes_received += event.bytes_received or 0
+
+            if event.is_retry:
+                counters.retries += 1
+
+            if event.status_code is None:
+                counters.errors += 1
+            else:
+                counters.status_codes[event.status_code] = counters.status_codes.get(event.status_code, 0) + 1
+
+    def reset(self) -> None:
+        '''
+        Removes all recorded metrics
+        '''
+
+        with self.__lock:
+            self.__counters.clear()
+
+    def snapshot(self) -> MetricsSnapshot:
+        '''
+        Returns:
+            Snapshot of recorded metrics: MetricsSnapshot
+        '''
+
+        endpoints = list()
+
+        with self.__lock:
+            for (method, endpoint), counters in self.__counters.items():
+                cumulative = 0
+                buckets = list()
+                for bound, count in zip(self.__bounds, counters.bucket_counts):
+                    cumulative += count
+                    buckets.append((bound, cumulative))
+
+                endpoints.append(EndpointMetrics(method, endpoint, counters.count, counters.errors, counters.retries, \
+                    counters.total_seconds, counters.max_seconds, counters.bytes_sent, counters.bytes_received, \
+                    dict(counters.status_codes), buckets))
+
+        endpoints.sort(key=lambda metrics: metrics.total_seconds, reverse=True)
+        return MetricsSnapshot(endpoints)
+
+    def to_prometheus(self, prefix: str = 'pytfsclient') -> str:
+        '''
+        Returns recorded metrics in Prometheus text exposition format
+
+        Args:
+            prefix (str): prefix of metric names. Default: pytfsclient
+        '''
+
+        snapshot = self.snapshot()
+        lines = list()
+
+        def labels(metrics: EndpointMetrics, **extra) -> str:
+            values = {'method': metrics.method, 'endpoint': metrics.endpoint}
+            values.update(extra)
+            return ','.join(f'{name}="{MetricsCollector._escape(value)}"' for name, value in values.items())
+
+        lines.append(f'# HELP {prefix}_request_duration_seconds Latency of TFS/Azure requests.')
+        lines.append(f'# TYPE {prefix}_request_duration_seconds histogram')
+        for metrics in snapshot.endpoints:
+            for bound, count in metrics.buckets:
+                bound_label = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels(metrics, le=bound_label)}}} {count}')
+            lines.append(f'{prefix}_request_duration_seconds_sum{{{labels(metrics)}}} {metrics.total_seconds}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{{labels(metrics)}}} {metrics.count}')
+
+        counters = (
+            ('responses_total', 'Number of TFS/Azure responses by status code.'),
+            ('request_errors_total', 'Number of TFS/Azure requests failed without response.'),
+            ('request_retries_total', 'Number of retried TFS/Azure requests.'),
+            ('request_bytes_total', 'Number of bytes sent in TFS/Azure request bodies.'),
+            ('response_bytes_total', 'Number of bytes received in TFS/Azure response bodies.'),
+        )
+
+        for name, help_text in counters:
+            lines.append(f'# HELP {prefix}_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+
+            for metrics in snapshot.endpoints:
+                if name == 'responses_total':
+                    for status_code, count in sorted(metrics.status_codes.items()):
+                        lines.append(f'{prefix}_{name}{{{labels(metrics, status=str(status_code))}}} {count}')
+                    continue
+
+                value = {
+                    'request_errors_total': metrics.errors,
+                    'request_retries_total': metrics.retries,
+                    'request_bytes_total': metrics.bytes_sent,
+                    'response_bytes_total': metrics.bytes_received,
+                }[name]
+                lines.append(f'{prefix}_{name}{{{labels(metrics)}}} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
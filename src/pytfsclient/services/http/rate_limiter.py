@@ -0,0 +1,245 @@
+import time
+import threading
+from collections import deque
+
+class RateLimiterStats:
+    '''
+    Snapshot of AdaptiveRateLimiter counters. Use HttpClient::rate_limiter.stats.
+    '''
+
+    def __init__(self, requests: int, delayed_requests: int, waited_seconds: float, rate: float, \
+        decreases: int, increases: int, remaining: float, limit: float) -> None:
+        self.__requests = requests
+        self.__delayed_requests = delayed_requests
+        self.__waited_seconds = waited_seconds
+        self.__rate = rate
+        self.__decreases = decreases
+        self.__increases = increases
+        self.__remaining = remaining
+        self.__limit = limit
+
+    @property
+    def requests(self) -> int:
+        '''
+        Returns:
+            Number of requests passed through limiter
+        '''
+        return self.__requests
+
+    @property
+    def delayed_requests(self) -> int:
+        '''
+        Returns:
+            Number of requests delayed by limiter
+        '''
+        return self.__delayed_requests
+
+    @property
+    def waited_seconds(self) -> float:
+        '''
+        Returns:
+            Total time in seconds requests waited in limiter
+        '''
+        return self.__waited_seconds
+
+    @property
+    def rate(self) -> float:
+        '''
+        Returns:
+            Current allowed rate in requests per second. None if requests are not limited
+        '''
+        return self.__rate
+
+    @property
+    def decreases(self) -> int:
+        '''
+        Returns:
+            Number of times rate was decreased
+        '''
+        return self.__decreases
+
+    @property
+    def increases(self) -> int:
+        '''
+        Returns:
+            Number of times rate was increased
+        '''
+        return self.__increases
+
+    @property
+    def remaining(self) -> float:
+        '''
+        Returns:
+            Last X-RateLimit-Remaining value (remaining throughput units). None if server didn't send it
+        '''
+        return self.__remaining
+
+    @property
+    def limit(self) -> float:
+        '''
+        Returns:
+            Last X-RateLimit-Limit value (throughput units budget). None if server didn't send it
+        '''
+        return self.__limit
+
+class AdaptiveRateLimiter:
+    '''
+    Client side AIMD rate limiter shared by all threads and coroutines of HttpClient.
+    Reads X-RateLimit-Remaining, X-RateLimit-Limit and X-RateLimit-Delay headers (TSTU usage) and Retry-After of every response:
+    - rate is decreased multiplicatively when usage of throughput units goes above threshold or server delays/throttles requests;
+    - rate is increased additively (about increase_step requests per second every second) while server is not under pressure.
+    Requests are not limited until server reports first pressure.
+    '''
+
+    # Number of last requests used to measure current rate
+    _WINDOW_SIZE = 50
+
+    def __init__(self, max_rate: float = 100.0, min_rate: float = 0.5, usage_threshold: float = 0.8, \
+        decrease_factor: float = 0.5, increase_step: float = 1.0) -> None:
+        '''
+        AdaptiveRateLimiter constructor.
+
+        Args:
+            max_rate (float): rate in requests per second after which limiter stops limiting requests. Default: 100
+            min_rate (float): min rate in requests per second. Default: 0.5
+            usage_threshold (float): used share of throughput units (1 - Remaining / Limit) to start slowing down. Default: 0.8
+            decrease_factor (float): rate multiplier when server is under pressure. Default: 0.5
+            increase_step (float): additive rate increase per second when server is not under pressure. Default: 1.0
+        '''
+
+        self.__max_rate = max_rate
+        self.__min_rate = min_rate
+        self.__usage_threshold = usage_threshold
+        self.__decrease_factor = decrease_factor
+        self.__increase_step = increase_step
+
+        self.__lock = threading.Lock()
+
+        # None - requests are not limited
+        self.__rate: float = None
+        self.__next_time = 0.0
+        self.__blocked_until = 0.0
+        self.__last_decrease = 0.0
+        self.__sent = deque(maxlen=self._WINDOW_SIZE)
+
+        # counters
+        self.__requests = 0
+        self.__delayed_requests = 0
+        self.__waited_seconds = 0.0
+        self.__decreases = 0
+        self.__increases = 0
+        self.__remaining: float = None
+        self.__limit: float = None
+
+    @property
+    def rate(self) -> float:
+        '''
+        Returns:
+            Current allowed rate in requests per second. None if requests are not limited
+        '''
+        return self.__rate
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        '''
+        Returns:
+            Snapshot of limiter counters: RateLimiterStats
+        '''
+
+        with self.__lock:
+            return RateLimiterStats(self.__requests, self.__delayed_requests, self.__waited_seconds, self.__rate, \
+                self.__decreases, self.__increases, self.__remaining, self.__limit)
+
+    def reserve(self) -> float:
+        '''
+        Reserves slot for next request. Caller should wait returned delay before sending request
+        (time.sleep in threads or asyncio.sleep in coroutines).
+
+        Returns:
+            Delay in seconds before request can be sent
+        '''
+
+        with self.__lock:
+            now = time.monotonic()
+            start = max(now, self.__next_time, self.__blocked_until)
+
+            if self.__rate:
+                self.__next_time = start + 1.0 / self.__rate
+
+            delay = start - now
+
+            self.__requests += 1
+            self.__sent.append(start)
+            if delay > 0:
+                self.__delayed_requests += 1
+                self.__waited_seconds += delay
+
+            return delay
+
+    def update(self, status_code: int, headers) -> None:
+        '''
+        Adapts rate to headers of server response
+        '''
+
+        remaining = AdaptiveRateLimiter._get_float(headers, 'X-RateLimit-Remaining')
+        limit = AdaptiveRateLimiter._get_float(headers, 'X-RateLimit-Limit')
+        delayed = AdaptiveRateLimiter._get_float(headers, 'X-RateLimit-Delay')
+        retry_after = AdaptiveRateLimiter._get_float(headers, 'Retry-After')
+
+        throttled = status_code in (429, 503)
+
+        under_pressure = throttled or ((delayed is not None) and (delayed > 0))
+        if (remaining is not None) and limit:
+            under_pressure = under_pressure or ((1.0 - remaining / limit) >= self.__usage_threshold)
+
+        with self.__lock:
+            now = time.monotonic()
+
+            if remaining is not None:
+                self.__remaining = remaining
+            if limit is not None:
+                self.__limit = limit
+
+            # all threads wait until server accepts requests again
+            if throttled and retry_after:
+                self.__blocked_until = max(self.__blocked_until, now + retry_after)
+
+            if under_pressure:
+                # decrease rate once per measured interval, so burst of responses doesn't collapse rate to min
+                interval = 1.0 / self.__rate if self.__rate else 0.0
+                if now - self.__last_decrease < interval:
+                    return
+
+                current_rate = self.__rate or self._measured_rate(now)
+                self.__rate = max(self.__min_rate, current_rate * self.__decrease_factor)
+                self.__last_decrease = now
+                self.__decreases += 1
+            elif self.__rate:
+                # additive increase: about increase_step requests per second every second
+                self.__rate += self.__increase_step / self.__rate
+                self.__increases += 1
+
+                if self.__rate >= self.__max_rate:
+                    self.__rate = None
+
+    def _measured_rate(self, now: float) -> float:
+        '''
+        Returns rate of last requests in requests per second
+        '''
+
+        if len(self.__sent) < 2:
+            return self.__max_rate
+
+        elapsed = max(now - self.__sent[0], 1e-3)
+        return min(self.__max_rate, len(self.__sent) / elapsed)
+
+    @staticmethod
+    def _get_float(headers, name: str) -> float:
+        value = headers.get(name) if headers else None
+        if value is None:
+            return None
+
+        try:
+            return float(value)
+        except ValueError:
+            return None
@@ -0,0 +1,229 @@
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+
+class RetryStats:
+    '''
+    Snapshot of retry counters of HttpClient. Use HttpClient::retry_stats.
+    '''
+
+    def __init__(self, retries: int, throttled_responses: int, slept_seconds: float, exhausted: int) -> None:
+        self.__retries = retries
+        self.__throttled_responses = throttled_responses
+        self.__slept_seconds = slept_seconds
+        self.__exhausted = exhausted
+
+    @property
+    def retries(self) -> int:
+        '''
+        Returns:
+            Number of replayed requests
+        '''
+        return self.__retries
+
+    @property
+    def throttled_responses(self) -> int:
+        '''
+        Returns:
+            Number of 429 and 503 responses got from server
+        '''
+        return self.__throttled_responses
+
+    @property
+    def slept_seconds(self) -> float:
+        '''
+        Returns:
+            Total time in seconds spent waiting before retries
+        '''
+        return self.__slept_seconds
+
+    @property
+    def exhausted(self) -> int:
+        '''
+        Returns:
+            Number of requests failed after all retries
+        '''
+        return self.__exhausted
+
+class RetryPolicy:
+    '''
+    Retry policy of HttpClient for throttled (429, 503) and failed requests.
+    Uses exponential backoff with jitter and honors Retry-After and X-RateLimit-Reset headers.
+
+    Only safe requests are replayed:
+    - GET requests
+    - PATCH requests guarded by json-patch operation { "op": "test", "path": "/rev" }
+    - POST requests to read-only endpoints (replayable_posts), like wit/workitemsbatch and wit/wiql
+    '''
+
+    # Throttling status codes
+    _THROTTLED_STATUSES = (429, 503)
+
+    def __init__(self, max_retries: int = 5, backoff_factor: float = 0.5, max_backoff: float = 60.0, \
+        jitter: bool = True, retry_statuses = (429, 500, 502, 503, 504), retry_connection_errors: bool = True, \
+        replayable_posts = ('wit/workitemsbatch', 'wit/wiql')) -> None:
+        '''
+        RetryPolicy constructor.
+
+        Args:
+            max_retries (int): max number of retries of one request. 0 disables retries. Default: 5
+            backoff_factor (float): base delay in seconds, delay is backoff_factor * 2 ^ attempt. Default: 0.5
+            max_backoff (float): max delay in seconds between retries. Default: 60
+            jitter (bool): randomize backoff delay (full jitter). Default: True
+            retry_statuses (Tuple[int]): http status codes to retry. Default: (429, 500, 502, 503, 504)
+            retry_connection_errors (bool): retry requests failed with connection errors. Default: True
+            replayable_posts (Tuple[str]): endpoints of read-only POST requests. Default: ('wit/workitemsbatch', 'wit/wiql')
+        '''
+
+        self.__max_retries = max(0, max_retries)
+        self.__backoff_factor = backoff_factor
+        self.__max_backoff = max_backoff
+        self.__jitter = jitter
+        self.__retry_statuses = tuple(retry_statuses)
+        self.__retry_connection_errors = retry_connection_errors
+        self.__replayable_posts = tuple(replayable_posts)
+
+        self.__lock = threading.Lock()
+        self.__retries = 0
+        self.__throttled_responses = 0
+        self.__slept_seconds = 0.0
+        self.__exhausted = 0
+
+    ### Properties section ###
+
+    @property
+    def max_retries(self) -> int:
+        return self.__max_retries
+
+    @property
+    def retry_connection_errors(self) -> bool:
+        return self.__retry_connection_errors
+
+    @property
+    def stats(self) -> RetryStats:
+        '''
+        Returns:
+            Snapshot of retry counters: RetryStats
+        '''
+
+        with self.__lock:
+            return RetryStats(self.__retries, self.__throttled_responses, self.__slept_seconds, self.__exhausted)
+
+    ### Policy section ###
+
+    def is_replayable(self, method: str, resource: str, json_data = None) -> bool:
+        '''
+        Returns:
+            True if request can be safely sent again
+        '''
+
+        method = method.upper()
+
+        if method in ('GET', 'HEAD', 'OPTIONS'):
+            return True
+
+        if method == 'POST':
+            path = resource.split('?')[0].rstrip('/')
+            return any(path.endswith(post_path) for post_path in self.__replayable_posts)
+
+        if (method == 'PATCH') and isinstance(json_data, list):
+            return any(isinstance(op, dict) and (str(op.get('op', '')).lower() == 'test') and (op.get('path') == '/rev') \
+                for op in json_data)
+
+        return False
+
+    def should_retry(self, attempt: int, status_code: int) -> bool:
+        '''
+        Returns:
+            True if response with given status code should be retried. Counts throttled and exhausted requests.
+        '''
+
+        with self.__lock:
+            if status_code in self._THROTTLED_STATUSES:
+                self.__throttled_responses += 1
+
+            if status_code not in self.__retry_statuses:
+                return False
+
+            if attempt >= self.__max_retries:
+                self.__exhausted += 1
+                return False
+
+            return True
+
+    def can_retry_error(self, attempt: int) -> bool:
+        '''
+        Returns:
+            True if request failed with connection error should be retried
+        '''
+
+        with self.__lock:
+            if not self.__retry_connection_errors:
+                return False
+
+            if attempt >= self.__max_retries:
+                self.__exhausted += 1
+                return False
+
+            return True
+
+    def get_delay(self, attempt: int, headers = None) -> float:
+        '''
+        Returns delay in seconds before next attempt.
+        Retry-After header (seconds or http-date) has priority, then X-RateLimit-Reset (unix time), then exponential backoff.
+        '''
+
+        header_delay = RetryPolicy._get_header_delay(headers) if headers else None
+        if header_delay is not None:
+            return min(max(header_delay, 0.0), self.__max_backoff)
+
+        delay = min(self.__backoff_factor * (2 ** attempt), self.__max_backoff)
+        return random.uniform(0, delay) if self.__jitter else delay
+
+    def record_retry(self, delay: float) -> None:
+        '''
+        Counts retry and time spent before it
+        '''
+
+        with self.__lock:
+            self.__retries += 1
+            self.__slept_seconds += delay
+
+    def reset_stats(self) -> None:
+        '''
+        Resets retry counters
+        '''
+
+        with self.__lock:
+            self.__retries = 0
+            self.__throttled_responses = 0
+            self.__slept_seconds = 0.0
+            self.__exhausted = 0
+
+    @staticmethod
+    def _get_header_delay(headers) -> float:
+        '''
+        Returns delay from Retry-After or X-RateLimit-Reset headers or None
+        '''
+
+        retry_after = headers.get('Retry-After')
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+
+            try:
+                return parsedate_to_datetime(retry_after).timestamp() - time.time()
+            except (TypeError, ValueError):
+                pass
+
+        rate_limit_reset = headers.get('X-RateLimit-Reset')
+        if rate_limit_reset:
+            try:
+                return float(rate_limit_reset) - time.time()
+            except ValueError:
+                pass
+
+        return None
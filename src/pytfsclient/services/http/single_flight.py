@@ -0,0 +1,136 @@
+import threading
+from typing import Callable, Dict, Hashable
+
+class SingleFlightStats:
+    '''
+    Snapshot of SingleFlight counters. Use HttpClient::single_flight.stats.
+    '''
+
+    def __init__(self, calls: int, executed: int, shared: int, in_flight: int) -> None:
+        self.__calls = calls
+        self.__executed = executed
+        self.__shared = shared
+        self.__in_flight = in_flight
+
+    @property
+    def calls(self) -> int:
+        '''
+        Returns:
+            Number of calls passed through SingleFlight
+        '''
+        return self.__calls
+
+    @property
+    def executed(self) -> int:
+        '''
+        Returns:
+            Number of calls which sent request
+        '''
+        return self.__executed
+
+    @property
+    def shared(self) -> int:
+        '''
+        Returns:
+            Number of calls which waited for identical in-flight call and got its result
+        '''
+        return self.__shared
+
+    @property
+    def in_flight(self) -> int:
+        '''
+        Returns:
+            Number of currently executed calls
+        '''
+        return self.__in_flight
+
+    @property
+    def shared_ratio(self) -> float:
+        '''
+        Returns:
+            Share of calls served by identical in-flight call
+        '''
+        return self.__shared / self.__calls if self.__calls else 0.0
+
+class _Call:
+    '''
+    In-flight call waited by duplicate callers
+    '''
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException = None
+
+class SingleFlight:
+    '''
+    Coalesces identical concurrent calls: the first caller executes call,
+    callers with the same key which come while it is in flight wait and get its result or exception.
+    Nothing is kept after call completes, so results are never stale.
+    '''
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__calls: Dict[Hashable, _Call] = dict()
+
+        self.__total = 0
+        self.__executed = 0
+        self.__shared = 0
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        '''
+        Returns:
+            Snapshot of counters: SingleFlightStats
+        '''
+
+        with self.__lock:
+            return SingleFlightStats(self.__total, self.__executed, self.__shared, len(self.__calls))
+
+    def do(self, key: Hashable, func: Callable, share: Callable = None):
+        '''
+        Executes func or waits for in-flight call with the same key.
+
+        Args:
+            key (Hashable): key of identical calls
+            func (Callable): function without arguments
+            share (Callable): function applied to result returned to waiting callers, e.g. copy. Default: None
+
+        Returns:
+            Result of func
+        '''
+
+        with self.__lock:
+            self.__total += 1
+
+            call = self.__calls.get(key)
+            if call is not None:
+                self.__shared += 1
+                leader = False
+            else:
+                call = _Call()
+                self.__calls[key] = call
+                self.__executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            return share(call.result) if share else call.result
+
+        try:
+            call.result = func()
+        except BaseException as ex:
+            call.error = ex
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+            call.done.set()
+
+        return call.result
@@ -2,6 +2,7 @@ from enum import Enum
 from ...models.workitems.tfs_workitem import UpdateFieldsResult, Workitem
 from ...models.project.tfs_team_member import TeamMember
 from ...models.client_error import ClientError
+from ..helpers.tracing import traced
 
 class MentionResult(Enum):
     '''
@@ -25,6 +26,7 @@ class MentionClient:
     _TFS_HISTORY_FIELD = 'System.History'
     
     @staticmethod
+    @traced()
     def send_mention(workitem: Workitem, to_user: TeamMember, \
                     message: str, from_user: TeamMember = None) -> MentionResult:
         '''
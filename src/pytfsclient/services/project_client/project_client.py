@@ -6,7 +6,9 @@ from ...models.project.tfs_team_member import TeamMember
 from ...models.board.tfs_board import Board
 from ...services.base_client import BaseClient
 from ...client_connection import ClientConnection
-from typing import List
+from ..helpers import tracing
+from ..helpers.tracing import traced
+from typing import List, Iterator
 
 class ProjectClient(BaseClient):
     '''
@@ -22,6 +24,7 @@ class ProjectClient(BaseClient):
     def __init__(self, client_connection: ClientConnection) -> None:
         super().__init__(client_connection)
     
+    @traced()
     def get_projects(self, skip: int = 0) -> List[Project]:
         '''
         Returns current list of Tfs/Azure projects.
@@ -46,14 +49,17 @@ class ProjectClient(BaseClient):
         try:
             projects = list()
 
+            page = 0
             hasNext = True
             while hasNext:
-                response = self.http_client.get(request_url, query_params=query_params)
+                with tracing.span('ProjectClient.get_projects.page', page=page, skip=int(query_params['$skip'])):
+                    response = self.http_client.get(request_url, query_params=query_params)
+                page += 1
 
                 if not response:
                     raise ClientError('ProjectClient::get_projects: can\'t get response from TFS server')
 
-                json_items = response.json()
+                json_items = self._read_json(response)
                 if ('count' in json_items) and (int(json_items['count']) == 0):
                     hasNext = False
                     continue
@@ -69,6 +75,7 @@ class ProjectClient(BaseClient):
         except Exception as ex:
             raise ClientError(f'ProjectClient::get_projects: exception raised. Msg: {ex}', ex)
 
+    @traced()
     def get_project(self, project_id: str, capabilities: bool = False, history: bool = False) -> Project:
         '''
         Returns TFS/Azure project instance.
@@ -102,11 +109,12 @@ class ProjectClient(BaseClient):
             if not response:
                 raise ClientError('ProjectClient::get_project: can\'t get response from TFS server')
             
-            json_item = response.json()
+            json_item = self._read_json(response)
             return Project.from_json(json_item)
         except Exception as ex:
             raise ClientError(f'ProjectClient::get_project: exception raised. Msg: {ex}', ex)
         
+    @traced()
     def get_team(self, project_id: str, team_id: str, expand: bool = False) -> Team:
         '''
         Returns TFS/Azure team instance.
@@ -140,11 +148,12 @@ class ProjectClient(BaseClient):
             if not response:
                 raise ClientError('ProjectClient::get_project: can\'t get response from TFS server')
             
-            json_item = response.json()
+            json_item = self._read_json(response)
             return Team.from_json(json_item)
         except Exception as ex:
             raise ClientError(f'ProjectClient::get_project: exception raised. Msg: {ex}', ex)
 
+    @traced()
     def get_all_teams(self, current_user: bool = False) -> List[Team]:
         '''
         Returns list of TFS/Azure teams.
@@ -172,7 +181,7 @@ class ProjectClient(BaseClient):
             if not response:
                 raise ClientError('ProjectClient::get_all_teams: can\'t get response from TFS server')
             
-            json_items = response.json()
+            json_items = self._read_json(response)
             if 'value' in json_items:
                 json_items = json_items['value']
                 return [Team.from_json(json_item) for json_item in json_items]
@@ -181,6 +190,7 @@ class ProjectClient(BaseClient):
         except Exception as ex:
             raise ClientError(f'ProjectClient::get_all_teams: exception raised. Msg: {ex}', ex)
     
+    @traced()
     def get_project_groups(self, project: Project) -> List[Identity]:
         '''
         Get a list of identities for the project
@@ -210,7 +220,7 @@ class ProjectClient(BaseClient):
             if not response:
                 raise ClientError('ProjectClient::get_project_groups: can\'t get response from TFS server')
             
-            json_items = response.json()
+            json_items = self._read_json(response)
             if 'identities' in json_items:
                 return [Identity.from_json(json_item) for json_item in json_items['identities']]
             else:
@@ -218,6 +228,7 @@ class ProjectClient(BaseClient):
         except Exception as ex:
             raise ClientError(f'ProjectClient::get_project_groups: exception raised. Msg: {ex}', ex)
     
+    @traced()
     def get_project_group_members(self, project: Project, identity: Identity) -> List[Identity]:
         '''
         Get a list of project group members
@@ -255,7 +266,7 @@ class ProjectClient(BaseClient):
             if not response:
                 raise ClientError('ProjectClient::get_project_group_members: can\'t get response from TFS server')
             
-            json_items = response.json()
+            json_items = self._read_json(response)
             if 'identities' in json_items:
                 return [Identity.from_json(json_item) for json_item in json_items['identities']]
             else:
@@ -263,6 +274,7 @@ class ProjectClient(BaseClient):
         except Exception as ex:
             raise ClientError(f'ProjectClient::get_project_group_members: exception raised. Msg: {ex}', ex)
 
+    @traced()
     def get_project_teams(self, project: Project, expand: bool = False, \
                           current_user: bool = False, skip: int = 0) -> List[Team]:
         '''
@@ -296,14 +308,17 @@ class ProjectClient(BaseClient):
         try:
             teams = list()
 
+            page = 0
             hasNext = True
             while hasNext:
-                response = self.http_client.get(request_url, query_params=query_params)
+                with tracing.span('ProjectClient.get_project_teams.page', page=page, skip=int(query_params['$skip'])):
+                    response = self.http_client.get(request_url, query_params=query_params)
+                page += 1
 
                 if not response:
                     raise ClientError('ProjectClient::get_project_teams: can\'t get response from TFS server')
                 
-                json_items = response.json()
+                json_items = self._read_json(response)
                 if ('count' in json_items) and (int(json_items['count']) == 0):
                     hasNext = False
                     continue
@@ -319,6 +334,7 @@ class ProjectClient(BaseClient):
         except Exception as ex:
             raise ClientError(f'ProjectClient::get_project_teams: exception raised. Msg: {ex}', ex)
 
+    @traced()
     def get_project_team_members(self, project: Project, team: Team) -> List[TeamMember]:
         '''
         Get a list of members for a specific team and a project.
@@ -352,14 +368,17 @@ class ProjectClient(BaseClient):
         try:
             members = list()
 
+            page = 0
             hasNext = True
             while hasNext:
-                response = self.http_client.get(request_url, query_params=query_params)
+                with tracing.span('ProjectClient.get_project_team_members.page', page=page, skip=int(query_params['$skip'])):
+                    response = self.http_client.get(request_url, query_params=query_params)
+                page += 1
 
                 if not response:
                     raise ClientError('ProjectClient::get_project_team_members: can\'t get response from TFS server')
                 
-                json_items = response.json()
+                json_items = self._read_json(response)
                 if ('count' in json_items) and (int(json_items['count']) == 0):
                     hasNext = False
                     continue
@@ -375,6 +394,62 @@ class ProjectClient(BaseClient):
         except Exception as ex:
             raise ClientError(f'ProjectClient::get_project_team_members: exception raised. Msg: {ex}', ex)
 
+    @traced()
+    def iter_project_team_members(self, project: Project, team: Team) -> Iterator[TeamMember]:
+        '''
+        Generator yields members of a specific team and a project page by page.
+        Every member is yielded as soon as it is parsed from response being downloaded.
+        Docs: https://docs.microsoft.com/en-us/rest/api/azure/devops/core/teams/get-team-members-with-extended-properties?view=azure-devops-rest-6.0
+
+        Args:
+            project (Project): project instance of the team project the team belongs to.
+            team (Team): team instance
+
+        Returns:
+            Iterator of team members: Iterator[TeamMember]
+        
+        Raises:
+            ClientError if project or team is None
+            ClientError if bad request
+        '''
+
+        if not project:
+            raise ClientError('ProjectClient::iter_project_team_members: project can\'t be None')
+        
+        if not team:
+            raise ClientError('ProjectClient::iter_project_team_members: team can\'t be None')
+
+        request_url = f'{self.client_connection.api_url}{self._URL_PROJECTS}/{project.id}/{self._URL_TEAMS}/{team.id}/{self._URL_TEAM_MEMBERS}'
+        query_params = {
+            'api-version' : self.api_version,
+            '$skip' : '0'
+        }
+
+        try:
+            count = 0
+
+            hasNext = True
+            while hasNext:
+                response = self.http_client.get(request_url, query_params=query_params, stream=True)
+
+                if not response:
+                    raise ClientError('ProjectClient::iter_project_team_members: can\'t get response from TFS server')
+
+                page_count = 0
+                for json_item in self._iter_json_items(response):
+                    page_count += 1
+                    yield TeamMember.from_json(json_item['identity'])
+
+                # empty page is the last one
+                count += page_count
+                hasNext = page_count > 0
+                query_params['$skip'] = str(count)
+        except ClientError:
+            raise
+        except Exception as ex:
+            raise ClientError(f'ProjectClient::iter_project_team_members: exception raised. Msg: {ex}', ex)
+
+    @traced()
     def get_project_team_board(self, project: Project, team: Team, board_id: str) -> Board:
         '''
         Get the board for a specific team and a project.
@@ -413,12 +488,13 @@ class ProjectClient(BaseClient):
             if not response:
                 raise ClientError('ProjectClient::get_project_team_board: can\'t get response from TFS server')
             
-            json_item = response.json()
+            json_item = self._read_json(response)
             return Board.from_json(json_item)
 
         except Exception as ex:
             raise ClientError(f'ProjectClient::get_project_team_board: exception raised. Msg: {ex}', ex)
 
+    @traced()
     def get_project_team_boards(self, project: Project, team: Team) -> List[Board]:
         '''
         Get a list of boards for a specific team and a project.
@@ -453,7 +529,7 @@ class ProjectClient(BaseClient):
             if not response:
                 raise ClientError('ProjectClient::get_project_team_boards: can\'t get response from TFS server')
             
-            json_items = response.json()
+            json_items = self._read_json(response)
             if 'value' in json_items:
                 boards: List[Board] = []
                 for json_item in json_items['value']:
@@ -0,0 +1,605 @@
+import asyncio
+from datetime import datetime
+from typing import List, Dict, Union
+from ...models.client_error import ClientError
+from ...models.workitems.tfs_wiql_result import WiqlResult
+from ...models.workitems.tfs_workitem import Workitem
+from ...models.workitems.tfs_workitem_relation import WorkitemRelation
+from ...models.workitems.tfs_workitem_changes import WorkitemChange
+from ..base_client import BaseClient
+from ...client_connection import ClientConnection
+from ..helpers.batch_iterable import batch
+from ..helpers import tracing
+from ..helpers.tracing import traced
+from .workitem_client import WorkitemClient
+
+class AsyncWorkitemClient(BaseClient):
+    '''
+    Asynchronous Workitem Client facade for managing workitems and relations.
+    Works over AsyncHttpClient, all public methods are coroutines.
+
+    NOTE: returned Workitem instances keep reference to this client, so Workitem::update_fields(),
+    Workitem::add_relation() and Workitem::get_changes() are not supported. Use methods of the client instead.
+    '''
+
+    _WORKITEM_URL = WorkitemClient._WORKITEM_URL
+    _WIQL_URL = WorkitemClient._WIQL_URL
+    _QUERY_URL = WorkitemClient._QUERY_URL
+    _WORKITEMS_BATCH_URL = WorkitemClient._WORKITEMS_BATCH_URL
+
+    _WORKITEMS_LIST_SIZE = WorkitemClient._WORKITEMS_LIST_SIZE
+    _WORKITEMS_BATCH_SIZE = WorkitemClient._WORKITEMS_BATCH_SIZE
+
+    # Constructor
+    def __init__(self, client_connection: ClientConnection) -> None:
+        super().__init__(client_connection)
+
+        # None - unknown, server is probed with the first get_workitems() call
+        self._workitems_batch_supported: bool = None
+
+    async def _get_items(self, request_url: str, query_params) -> List[Workitem]:
+        '''
+        Return list of Workitem from GET request or raise an exception
+        '''
+
+        url = f'{self.client_connection.api_url}{request_url}'
+
+        try:
+            http_response = await self.http_client.get(url, query_params=query_params)
+
+            json_items = self._read_json(http_response)
+            if 'value' in json_items:
+                # errorPolicy=omit returns null for items which can't be read
+                return [Workitem.from_json(self, json_item=json_item) for json_item in json_items['value'] if json_item]
+            else:
+                raise ClientError('AsyncWorkitemClient::get_items: json http response has no value attribute')
+        except ValueError as ex:
+            raise ClientError(f'AsyncWorkitemClient::get_items: EXCEPTION raised, http response is not json. Msg: {ex}', ex)
+        except ClientError:
+            raise
+        except Exception as ex:
+            raise ClientError(f'AsyncWorkitemClient::get_items: EXCEPTION raised. Msg: {ex}', ex)
+
+    async def _get_items_batch(self, item_ids: List[int], item_fields: List[str], expand: str, \
+        as_of: str, error_policy: str) -> List[Workitem]:
+        '''
+        Return list of Workitem from POST wit/workitemsbatch request or raise an exception.
+        Returns None if server doesn't support wit/workitemsbatch.
+        '''
+
+        url = f'{self.client_connection.api_url}{self._WORKITEMS_BATCH_URL}'
+        query_params = {
+            'api-version' : self.api_version
+        }
+
+        request_body = {
+            'ids' : item_ids
+        }
+
+        # workitemsbatch doesn't accept fields and $expand together
+        if item_fields:
+            request_body['fields'] = item_fields
+        elif expand:
+            request_body['$expand'] = expand
+
+        if as_of:
+            request_body['asOf'] = as_of
+        if error_policy:
+            request_body['errorPolicy'] = error_policy
+
+        try:
+            http_response = await self.http_client.post_json(url, request_body, query_params=query_params)
+
+            json_items = self._read_json(http_response)
+            if 'value' in json_items:
+                # errorPolicy=omit returns null for items which can't be read
+                return [Workitem.from_json(self, json_item=json_item) for json_item in json_items['value'] if json_item]
+            else:
+                raise ClientError('AsyncWorkitemClient::get_items_batch: json http response has no value attribute')
+        except ValueError as ex:
+            raise ClientError(f'AsyncWorkitemClient::get_items_batch: EXCEPTION raised, http response is not json. Msg: {ex}', ex)
+        except ClientError:
+            raise
+        except Exception as ex:
+            response = getattr(ex, 'response', None)
+            if WorkitemClient._is_batch_not_supported(response, self._read_json):
+                return None
+
+            raise ClientError(f'AsyncWorkitemClient::get_items_batch: EXCEPTION raised. Msg: {ex}', ex)
+
+    @traced()
+    async def get_workitems(self, item_ids, item_fields: List[str] = None, expand: str = 'All', batch_size: int = None, \
+        max_concurrency: int = 10, as_of: Union[datetime, str] = None, error_policy: str = None) -> List[Workitem]:
+        '''
+        Returns list of Workitems for given list of item ids. Batches are requested concurrently.
+        Uses POST wit/workitemsbatch (up to 200 ids per request) if server supports it, otherwise GET wit/workitems.
+
+        Args:
+            item_ids (List[int] | List[str] | int | str): list of ids of workitems to get
+            item_fields (List[str]): list of requested fields of workitems
+            expand (str): The expand parameters for work item attributes. Possible options are { None, Relations, Fields, Links, All }. Default: All
+            batch_size (int): batch size. Default: None (200 for workitemsbatch, 50 for GET)
+            max_concurrency (int): max number of batches requested at the same time. Default: 10
+            as_of (datetime | str): get workitems as they were at given date time. Default: None (current state)
+            error_policy (str): The flag to control error policy. Possible options are { Fail, Omit }. Default: None (Fail)
+
+        Returns:
+            List or workitems in order of requested ids: List[Workitem]
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        if not item_ids:
+            raise ClientError('AsyncWorkitemClient::get_workitems: item ids can\'t be None')
+
+        if isinstance(item_ids, int):
+            item_ids = [item_ids]
+        if isinstance(item_ids, str):
+            item_ids = [int(item_ids)]
+
+        item_ids = [int(item_id) for item_id in item_ids]
+
+        if isinstance(as_of, datetime):
+            as_of = as_of.isoformat()
+
+        # Http Query Params for GET wit/workitems
+        query_params = {
+            '$expand' : expand,
+            'api-version' : self.api_version
+        }
+
+        if item_fields:
+            query_params['fields'] = ','.join(item_fields)
+        if as_of:
+            query_params['asOf'] = as_of
+        if error_policy:
+            query_params['errorPolicy'] = error_policy
+
+        list_size = batch_size or self._WORKITEMS_LIST_SIZE
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or 1))
+
+        async def get_batch(items: List[int]) -> List[Workitem]:
+            async with semaphore:
+                with tracing.span('AsyncWorkitemClient.get_batch', id_count=len(items)):
+                    return await read_batch(items)
+
+        async def read_batch(items: List[int]) -> List[Workitem]:
+            if self._workitems_batch_supported is not False:
+                workitems = await self._get_items_batch(items, item_fields, expand, as_of, error_policy)
+
+                if workitems is not None:
+                    self._workitems_batch_supported = True
+                    return workitems
+
+                self._workitems_batch_supported = False
+
+            workitems = list()
+            for list_items in batch(items, list_size):
+                list_params = dict(query_params)
+                list_params['ids'] = ','.join(map(str, list_items))
+
+                workitems += await self._get_items(self._WORKITEM_URL, query_params=list_params)
+
+            return workitems
+
+        if not batch_size:
+            batch_size = self._WORKITEMS_LIST_SIZE \
+                if self._workitems_batch_supported is False else self._WORKITEMS_BATCH_SIZE
+
+        batches = list(batch(item_ids, batch_size))
+        tracing.set_attributes(id_count=len(item_ids), batch_size=batch_size, batch_count=len(batches))
+
+        workitems = list()
+
+        # Probe workitemsbatch endpoint with the first batch before going concurrent
+        if (self._workitems_batch_supported is None) and batches:
+            workitems += await get_batch(batches.pop(0))
+
+        # gather returns results in order of batches and raises first ClientError
+        for items in await asyncio.gather(*[get_batch(items) for items in batches]):
+            workitems += items
+
+        return workitems
+
+    @traced()
+    async def get_single_workitem(self, item_id, item_fields: List[str] = None) -> Workitem:
+        '''
+        Get single TFS/Azure workitem. Calls get_workitems().
+
+        Args:
+            item_id (int| str): workitem id
+            item_fields (List[str]): list of requested fields of workitems. Default: all fields
+
+        Returns:
+            Workitem instance
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        if not item_id:
+            raise ClientError('AsyncWorkitemClient::get_single_workitem: item_id can\'t be None')
+
+        items = await self.get_workitems(item_ids=item_id, item_fields=item_fields)
+        return items[0] if items else None
+
+    @traced()
+    async def get_workitem_changes(self, item_id: Union[int, Workitem], skip: int = 0, top: int = -1) -> List[WorkitemChange]:
+        '''
+        Get Workitem history changes (updates).
+
+        Args:
+            item_id (int, Workitem): workitem instance
+
+        Returns:
+            List of changes of workitem: List[WorkitemChange]
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        if not item_id:
+            raise ClientError('AsyncWorkitemClient::get_workitem_history: item_id can\'t be None')
+
+        if isinstance(item_id, Workitem):
+            item_id = item_id.id
+        if not isinstance(item_id, int):
+            raise ClientError('AsyncWorkitemClient::get_workitem_history: item_id should be instance of int or Workitem')
+
+        request_url = f'{self.client_connection.api_url}{self._WORKITEM_URL}/{item_id}/updates'
+
+        # Http Query Params
+        query_params = {
+            'api-version': self.api_version,
+            '$skip': str(skip),
+        }
+
+        if top > 0:
+            query_params['$top'] = str(top)
+
+        try:
+            changes: List[WorkitemChange] = list()
+
+            hasNext = True
+            while hasNext:
+                http_response = await self.http_client.get(request_url, query_params)
+
+                json_items = self._read_json(http_response)
+                if ('count' in json_items) and (int(json_items['count']) == 0):
+                    hasNext = False
+                    continue
+
+                if 'value' in json_items:
+                    query_params['$skip'] = str(int(query_params['$skip']) + int(json_items['count']))
+
+                    changes += [WorkitemChange.from_json(json_changes) for json_changes in json_items['value']]
+                else:
+                    raise ClientError('AsyncWorkitemClient::get_workitem_history: response doesn\'t have \'value\' attribute')
+
+            return changes
+        except Exception as ex:
+            raise ClientError(f'AsyncWorkitemClient::get_workitem_history: exception raised. Msg: {ex}', ex)
+
+    async def _send_patch(self, method_name: str, request_url: str, request_body, query_params, post: bool = False) -> Workitem:
+        '''
+        Sends json-patch document and returns Workitem from response or raise an exception
+        '''
+
+        # custom headers. Media Types: "application/json-patch+json"
+        custom_headers = {
+            'Content-Type' : 'application/json-patch+json'
+        }
+
+        try:
+            if post:
+                http_response = await self.http_client.post_json(request_url, request_body, \
+                    query_params=query_params, custom_headers=custom_headers)
+            else:
+                http_response = await self.http_client.patch_json(request_url, request_body, \
+                    query_params=query_params, custom_headers=custom_headers)
+
+            return Workitem.from_json(self, json_item=self._read_json(http_response))
+        except ValueError as ex:
+            raise ClientError(f'AsyncWorkitemClient::{method_name}: response is not json. Msg: {ex}', ex)
+        except Exception as ex:
+            raise ClientError(f'AsyncWorkitemClient::{method_name}: EXCEPTION raised. Msg: {ex}', ex)
+
+    @traced()
+    async def create_workitem(self, type_name: str, \
+        item_fields: Dict[str, str] = None, item_relations: List[WorkitemRelation] = None, \
+        project: str = None, \
+        expand: str = 'All', bypass_rules: bool = False, \
+        suppress_notifications: bool = False, validate_only: bool = False) -> Workitem:
+        '''
+        Creates workitem of given type, properties and relations.
+        Docs: https://docs.microsoft.com/en-us/rest/api/azure/devops/wit/work-items/create?view=azure-devops-rest-6.0
+
+        Args:
+            type_name (str): The work item type of the work item to create. Ex: Task, Change request
+            item_fields (Dict[str, str]): created workitems fields values
+            item_relations (List[WorkitemRelation]): workitem relations
+            expand (str): The expand parameters for work item attributes. Possible options are { None, Relations, Fields, Links, All }.
+            bypass_rules (bool): Do not enforce the work item type rules on this update
+            suppress_notifications (bool): Do not fire any notifications for this change
+            validate_only (bool): Indicate if you only want to validate the changes without saving the work item
+
+        Returns:
+            Workitem instance
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        if not type_name:
+            raise ClientError('AsyncWorkitemClient::create_workitem: item type name can\'t be None')
+
+        # request url
+        request_url = f'{self.client_connection.project_url}/{self._WORKITEM_URL}/${type_name}' \
+            if not project \
+            else f'{self.client_connection.collection}/{project}/_apis/{self._WORKITEM_URL}/${type_name}'
+
+        # query params
+        query_params = WorkitemClient._make_query_params(expand, bypass_rules, suppress_notifications, validate_only)
+
+        # request body
+        request_body = [dict(op='add', path='/fields/{}'.format(name), value=value) for name, value in item_fields.items()] \
+            if item_fields else []
+
+        if item_relations:
+            for relation in item_relations:
+                rel = dict(rel=relation.relation_name, url=relation.url, attributes=None)
+                request_body.append(dict(op='add', path='/relations/-', value=rel))
+
+        return await self._send_patch('create_workitem', request_url, request_body, query_params, post=True)
+
+    @traced()
+    async def copy_workitem(self, source_item, item_fields: List[str] = None, \
+                      item_ignore_fileds: List[str] = None) -> Workitem:
+        '''
+        Creates copy of given workitem.
+
+        Args:
+            source_item (int | Workitem): source workitem
+            item_fields (List[str]): fields of source workitem to copy. Default: None (all fields).
+            item_ignore_fileds (List[str]): fields of source workitem to ignore. Default: None
+
+        Returns:
+            Copied workitem instance
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        if not source_item:
+            raise ClientError('AsyncWorkitemClient::copy_workitem: source_item can\'t be None')
+
+        if isinstance(source_item, int):
+            source_item = await self.get_single_workitem(source_item)
+
+        if (not isinstance(source_item, Workitem)) or (source_item is None):
+            raise ClientError('AsyncWorkitemClient::copy_workitem: source item is None')
+
+        fields = WorkitemClient._copy_fields(source_item, item_fields, item_ignore_fileds)
+        return await self.create_workitem(source_item.type_name, item_fields=fields)
+
+    @traced()
+    async def update_workitem_fields(self, workitem, item_fields: Dict[str, str], \
+        expand: str='All', bypass_rules: bool = False, \
+        suppress_notifications: bool = False, validate_only: bool = False) -> Workitem:
+        '''
+        Updates fields values for given workitem.
+        Docs: https://docs.microsoft.com/en-us/rest/api/azure/devops/wit/work-items/update?view=azure-devops-rest-6.0
+
+        Args:
+            workitem (int, Workitem): workitem to update
+            item_fields: (Dict[str, str]) dictonary with values of updated fields
+            expand: The expand parameters for work item attributes. Possible options are { None, Relations, Fields, Links, All }.
+            bypass_rules: Do not enforce the work item type rules on this update
+            suppress_notifications: Do not fire any notifications for this change
+            validate_only: Indicate if you only want to validate the changes without saving the work item
+
+        Returns:
+            Workitem instance with updated fields
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        if not workitem:
+            raise ClientError('AsyncWorkitemClient::update_workitem_fields: workitem can\'t be None')
+
+        if not item_fields:
+            raise ClientError ('AsyncWorkitemClient::update_workitem_fields: item_fields can\'t be None')
+
+        # PATCH needs only id of workitem
+        item_id = workitem.id if isinstance(workitem, Workitem) else workitem
+        if not isinstance(item_id, int):
+            raise ClientError('AsyncWorkitemClient::update_workitem_fields: workitem should be instance of int or Workitem')
+
+        request_url = f'{self.client_connection.project_url}/{self._WORKITEM_URL}/{item_id}'
+        query_params = WorkitemClient._make_query_params(expand, bypass_rules, suppress_notifications, validate_only)
+        request_body = [dict(op='add', path='/fields/{}'.format(name), value=value) for name, value in item_fields.items()]
+
+        return await self._send_patch('update_workitem_fields', request_url, request_body, query_params)
+
+    ### REGION MANAGING RELATIONS ###
+
+    @traced()
+    async def add_relation(self, source_workitem, destination_workitem, relation_type_name: str, \
+        relation_attributes = None, \
+        expand: str = 'All', bypass_rules: bool = False, \
+        suppress_notifications: bool = False, validate_only: bool = False) -> Workitem:
+        '''
+        Adds relation link of given type for given workitem to another workitem.
+        Docs: https://docs.microsoft.com/en-us/rest/api/azure/devops/wit/work-items/update?view=azure-devops-rest-6.0#add-a-link
+
+        Args:
+            source_workitem (int, Workitem): source workitem
+            destination_workitem (int, Workitem): destination workitem
+            relation_type_name: relation type name (see RelationMap for default relations)
+            relation_attributes: relation attributes
+            expand: The expand parameters for work item attributes. Possible options are { None, Relations, Fields, Links, All }.
+            bypass_rules: Do not enforce the work item type rules on this update
+            suppress_notifications: Do not fire any notifications for this change
+            validate_only: Indicate if you only want to validate the changes without saving the work item
+
+        Returns:
+            Workitem with added relation
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        if not source_workitem:
+            raise ClientError('AsyncWorkitemClient::add_relation: source workitem can\'t be None')
+
+        if not destination_workitem:
+            raise ClientError('AsyncWorkitemClient::add_relation: destination workitem can\'t be None')
+
+        if not relation_type_name:
+            raise ClientError('AsyncWorkitemClient::add_relation: relation type name can\'t be None')
+
+        if isinstance(source_workitem, Workitem):
+            source_workitem = source_workitem.id
+
+        if (not isinstance(source_workitem, int)):
+            raise ClientError('AsyncWorkitemClient::add_relation: can\'t get id of source workitem')
+
+        if isinstance(destination_workitem, int):
+            destination_workitem = await self.get_single_workitem(destination_workitem)
+
+        if (not destination_workitem) or (not isinstance(destination_workitem, Workitem)):
+            raise ClientError('AsyncWorkitemClient::add_relation: can\'t get destination workitem')
+
+        request_url = f'{self.client_connection.project_url}/{self._WORKITEM_URL}/{source_workitem}'
+        query_params = WorkitemClient._make_query_params(expand, bypass_rules, suppress_notifications, validate_only)
+        request_body = [dict(op='Add', path='/relations/-', \
+            value=dict(rel=relation_type_name, url=destination_workitem.url, attributes=relation_attributes))]
+
+        return await self._send_patch('add_relation', request_url, request_body, query_params)
+
+    @traced()
+    async def remove_relation(self, workitem: Workitem, relation: WorkitemRelation, \
+        expand='All', bypass_rules=False, \
+        suppress_notifications=False, validate_only=False) -> Workitem:
+        '''
+        Removes relation from given workitem.
+        TFS/Azure api can remove relation only for given index
+        '''
+
+        if not workitem:
+            raise ClientError('AsyncWorkitemClient::remove_relation: workitem can\'t be None')
+
+        if not relation:
+            raise ClientError('AsyncWorkitemClient::remove_relation: relation can\'t be None')
+
+        # Find relation index
+        relation_idx = -1
+        for idx, rel in enumerate(workitem.relations):
+            if (rel.relation_name == relation.relation_name) and (rel.destination_id == relation.destination_id):
+                relation_idx = idx
+                break
+
+        if relation_idx < 0:
+            raise ClientError('AsyncWorkitemClient::remove_relation: can\'t find relation index')
+
+        request_url = f'{self.client_connection.project_url}/{self._WORKITEM_URL}/{workitem.id}'
+        query_params = WorkitemClient._make_query_params(expand, bypass_rules, suppress_notifications, validate_only)
+        request_body = [
+            dict(op='test', path='/rev', value=workitem.revision),
+            dict(op='remove', path='/relations/{}'.format(relation_idx))
+        ]
+
+        return await self._send_patch('remove_relation', request_url, request_body, query_params)
+
+    ### END REGION MANAGING RELATIONS ###
+
+    ### REGION QUERIES (WIQL) ###
+
+    @traced()
+    async def run_saved_query(self, query_id: str) -> WiqlResult:
+        '''
+        Retrieves an individual query and its children
+
+        Args:
+            query_id (str): query id (GUID)
+
+        Returns:
+            Query result: WiqlResult. Use get_workitems(result.item_ids) to get workitems.
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        if not query_id:
+            raise ClientError('AsyncWorkitemClient::run_saved_query: query id can\'t be None')
+
+        if not isinstance(query_id, str):
+            raise ClientError('AsyncWorkitemClient::run_saved_query: query_id must be string')
+
+        request_url = f'{self.client_connection.project_url}/{self._QUERY_URL}/{query_id}'
+        query_params = {
+            'api-version' : self.api_version,
+            '$expand' : 'clauses',
+        }
+
+        try:
+            http_response = await self.http_client.get(request_url, query_params=query_params)
+
+            response = self._read_json(http_response)
+            if 'wiql' in response:
+                return await self.run_wiql(str(response['wiql']))
+            else:
+                raise ClientError('AsyncWorkitemClient::run_saved_query: response doesn\'t have wiql attribute')
+        except ValueError as ex:
+            raise ClientError(f'AsyncWorkitemClient::run_saved_query: response is not json. Msg: {ex}', ex)
+        except Exception as ex:
+            raise ClientError(f'AsyncWorkitemClient::run_saved_query: EXCEPTION raised. Msg: {ex}', ex)
+
+    @traced()
+    async def run_wiql(self, query: str, max_top: int = -1, time_precision: bool = False) -> WiqlResult:
+        '''
+        Runs WIQL query.
+
+        Args:
+            query (str): WIQL query
+            max_top (int): max number of returned workitems. Default: -1 (server limit)
+            time_precision (bool): compare dates with time, e.g. [System.ChangedDate] >= '2024-01-01T10:00:00Z'. Default: False
+
+        Returns:
+            Query result: WiqlResult. Use get_workitems(result.item_ids) to get workitems.
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        if not query:
+            raise ClientError('AsyncWorkitemClient::run_wiql: query can\'t be None')
+
+        request_url = f'{self.client_connection.project_url}/{self._WIQL_URL}'
+        query_params = {
+            'api-version' : self.api_version
+        }
+
+        request_body = {
+            'query' : query
+        }
+
+        # server reads $top only from query string
+        if max_top > 0:
+            query_params['$top'] = str(max_top)
+
+        if time_precision:
+            query_params['timePrecision'] = 'true'
+
+        try:
+            http_response = await self.http_client.post_json(request_url, request_body, query_params=query_params)
+
+            return WiqlResult.from_json(self, self._read_json(http_response))
+        except ValueError as ex:
+            raise ClientError(f'AsyncWorkitemClient::run_wiql: response is not json. Msg: {ex}', ex)
+        except Exception as ex:
+            raise ClientError(f'AsyncWorkitemClient::run_wiql: EXCEPTION raised. Msg: {ex}', ex)
+
+    ### END REGION QUERIES (WIQL) ###
@@ -0,0 +1,256 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Set
+
+class WorkitemCacheStats:
+    '''
+    Snapshot of WorkitemCache counters. Use WorkitemClient::cache.stats.
+    '''
+
+    def __init__(self, hits: int, misses: int, evictions: int, expirations: int, invalidations: int, \
+        size: int, max_entries: int) -> None:
+        self.__hits = hits
+        self.__misses = misses
+        self.__evictions = evictions
+        self.__expirations = expirations
+        self.__invalidations = invalidations
+        self.__size = size
+        self.__max_entries = max_entries
+
+    @property
+    def hits(self) -> int:
+        '''
+        Returns:
+            Number of workitems served from cache
+        '''
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        '''
+        Returns:
+            Number of workitems requested from server
+        '''
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        '''
+        Returns:
+            Number of least recently used entries removed from cache
+        '''
+        return self.__evictions
+
+    @property
+    def expirations(self) -> int:
+        '''
+        Returns:
+            Number of entries removed after time to live
+        '''
+        return self.__expirations
+
+    @property
+    def invalidations(self) -> int:
+        '''
+        Returns:
+            Number of entries removed by invalidate() or newer revision of workitem
+        '''
+        return self.__invalidations
+
+    @property
+    def size(self) -> int:
+        '''
+        Returns:
+            Number of cached entries
+        '''
+        return self.__size
+
+    @property
+    def max_entries(self) -> int:
+        '''
+        Returns:
+            Max number of cached entries
+        '''
+        return self.__max_entries
+
+    @property
+    def hit_ratio(self) -> float:
+        '''
+        Returns:
+            Share of workitems served from cache
+        '''
+        total = self.__hits + self.__misses
+        return self.__hits / total if total else 0.0
+
+class _CacheEntry:
+    '''
+    JSON object of workitem with its revision and expiration time
+    '''
+
+    __slots__ = ('json_item', 'revision', 'expires')
+
+    def __init__(self, json_item: dict, revision: int, expires: float) -> None:
+        self.json_item = json_item
+        self.revision = revision
+        self.expires = expires
+
+class WorkitemCache:
+    '''
+    In-memory cache of workitems of WorkitemClient with LRU eviction and time to live.
+    Entries are keyed by workitem id, requested fields and expand parameter.
+    Responses of update_workitem_fields(), add_relation() and remove_relation() drop entries of older
+    revisions and refresh cached workitem. Use WorkitemClient::enable_cache().
+    '''
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic) -> None:
+        '''
+        WorkitemCache constructor.
+
+        Args:
+            max_entries (int): max number of cached entries. Default: 10000
+            ttl (float): time to live of entry in seconds, 0 or None - entries don't expire. Default: 300.0
+            clock (Callable): monotonic clock. Default: time.monotonic
+        '''
+
+        self.__max_entries = max(1, max_entries)
+        self.__ttl = ttl or None
+        self.__clock = clock
+
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict = OrderedDict()
+        # keys of cached entries of every workitem id
+        self.__keys: Dict[int, Set[tuple]] = dict()
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
+        self.__invalidations = 0
+
+    @property
+    def stats(self) -> WorkitemCacheStats:
+        '''
+        Returns:
+            Snapshot of cache counters: WorkitemCacheStats
+        '''
+
+        with self.__lock:
+            return WorkitemCacheStats(self.__hits, self.__misses, self.__evictions, self.__expirations, \
+                self.__invalidations, len(self.__entries), self.__max_entries)
+
+    @staticmethod
+    def make_key(item_id: int, item_fields: List[str] = None, expand: str = None) -> tuple:
+        '''
+        Returns cache key of workitem
+        '''
+
+        fields = tuple(sorted(item_fields)) if item_fields else None
+        return (int(item_id), fields, str(expand).lower() if expand else None)
+
+    def get(self, item_id: int, item_fields: List[str] = None, expand: str = None) -> dict:
+        '''
+        Returns cached JSON object of workitem or None
+        '''
+
+        key = WorkitemCache.make_key(item_id, item_fields, expand)
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if (entry is not None) and (entry.expires is not None) and (entry.expires <= self.__clock()):
+                self.__remove(key)
+                self.__expirations += 1
+                entry = None
+
+            if entry is None:
+                self.__misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+
+            return entry.json_item
+
+    def put(self, json_item: dict, item_fields: List[str] = None, expand: str = None) -> None:
+        '''
+        Stores JSON object of workitem. Entries of older revisions of workitem are removed
+        '''
+
+        item_id = int(json_item['id'])
+        revision = WorkitemCache._get_revision(json_item)
+        key = WorkitemCache.make_key(item_id, item_fields, expand)
+
+        with self.__lock:
+            self.__remove_older(item_id, revision)
+
+            expires = self.__clock() + self.__ttl if self.__ttl else None
+            self.__entries[key] = _CacheEntry(json_item, revision, expires)
+            self.__entries.move_to_end(key)
+            self.__keys.setdefault(item_id, set()).add(key)
+
+            while len(self.__entries) > self.__max_entries:
+                oldest_key = next(iter(self.__entries))
+                self.__remove(oldest_key)
+                self.__evictions += 1
+
+    def update_revision(self, item_id: int, revision: int) -> None:
+        '''
+        Removes entries of workitem older than given revision. Removes all entries of workitem if revision is None
+        '''
+
+        with self.__lock:
+            if revision is None:
+                self.__invalidate_ids([int(item_id)])
+            else:
+                self.__remove_older(int(item_id), revision)
+
+    def invalidate(self, item_ids: List[int] = None) -> None:
+        '''
+        Removes entries of given workitems or all entries if item_ids is None
+        '''
+
+        with self.__lock:
+            if item_ids is None:
+                self.__invalidations += len(self.__entries)
+                self.__entries.clear()
+                self.__keys.clear()
+            else:
+                self.__invalidate_ids([int(item_id) for item_id in item_ids])
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    ### PRIVATE REGION (called under lock) ###
+
+    def __remove(self, key: tuple) -> None:
+        self.__entries.pop(key, None)
+
+        keys = self.__keys.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.__keys[key[0]]
+
+    def __remove_older(self, item_id: int, revision: int) -> None:
+        for key in list(self.__keys.get(item_id, ())):
+            entry = self.__entries[key]
+            if (revision is None) or (entry.revision is None) or (entry.revision < revision):
+                self.__remove(key)
+                self.__invalidations += 1
+
+    def __invalidate_ids(self, item_ids: List[int]) -> None:
+        for item_id in item_ids:
+            for key in list(self.__keys.get(item_id, ())):
+                self.__remove(key)
+                self.__invalidations += 1
+
+    ### END OF PRIVATE REGION ###
+
+    @staticmethod
+    def _get_revision(json_item: dict) -> int:
+        revision = json_item.get('rev')
+        if revision is None:
+            revision = (json_item.get('fields') or {}).get('System.Rev')
+
+        return int(revision) if revision is not None else None
@@ -1,13 +1,33 @@
-from typing import List, Dict, Union
+import threading
+from datetime import datetime
+from typing import List, Dict, Tuple, Union, Iterator
+from urllib.parse import urlencode, quote
+from itertools import chain
+from concurrent.futures import Executor, ThreadPoolExecutor
 from requests import HTTPError
 from ...models.client_error import ClientError
 from ...models.workitems.tfs_wiql_result import WiqlResult
 from ...models.workitems.tfs_workitem import Workitem
 from ...models.workitems.tfs_workitem_relation import WorkitemRelation
 from ...models.workitems.tfs_workitem_changes import WorkitemChange
+from ...models.workitems.tfs_reporting import ReportingBatch, WorkitemRevision, WorkitemLink
+from ...models.workitems.tfs_batch_result import BatchItemResult, BatchResult
+from ...models.workitems.tfs_workitem_spec import WorkitemSpec
 from ..base_client import BaseClient
+from .workitem_loader import WorkitemLoader
+from .workitem_cache import WorkitemCache
+from .workitem_store import WorkitemStore
+from .workitem_session import WorkitemSession
 from ...client_connection import ClientConnection
 from ..helpers.batch_iterable import batch
+from ..helpers import tracing
+from ..helpers.tracing import traced
+
+class _BatchNotSupportedError(ClientError):
+    '''
+    Raised if TFS/Azure server doesn't support POST wit/workitemsbatch endpoint
+    '''
+    pass
 
 class WorkitemClient(BaseClient):
     '''
@@ -17,84 +37,620 @@ class WorkitemClient(BaseClient):
     _WORKITEM_URL = 'wit/workitems'
     _WIQL_URL = 'wit/wiql'
     _QUERY_URL = 'wit/queries'
+    _WORKITEMS_BATCH_URL = 'wit/workitemsbatch'
+    _RECYCLEBIN_URL = 'wit/recyclebin'
+    _REPORTING_REVISIONS_URL = 'wit/reporting/workitemrevisions'
+    _REPORTING_LINKS_URL = 'wit/reporting/workitemlinks'
+    _BATCH_URL = 'wit/$batch'
+
+    # Max count of ids for one request
+    _WORKITEMS_LIST_SIZE = 50
+    _WORKITEMS_BATCH_SIZE = 200
+
+    _REVISION_FIELD = 'System.Rev'
 
     # Constructor
     def __init__(self, client_connection: ClientConnection) -> None:
         super().__init__(client_connection)
 
-    def _get_items(self, request_url: str, query_params, under_project: bool = False) -> List[Workitem]:
+        # None - unknown, server is probed with the first get_workitems() call
+        self._workitems_batch_supported: bool = None
+
+        # optional micro-batching of get_single_workitem() calls
+        self.__batch_loader: WorkitemLoader = None
+
+        # optional in-memory cache of workitems
+        self.__cache: WorkitemCache = None
+
+        # optional persistent store of workitems
+        self.__store: WorkitemStore = None
+
+        # active WorkitemSession of every thread
+        self.__sessions = threading.local()
+
+    @property
+    def cache(self) -> WorkitemCache:
+        '''
+        Returns:
+            In-memory cache of workitems or None: WorkitemCache
+        '''
+        return self.__cache
+
+    def enable_cache(self, max_entries: int = 10000, ttl: float = 300.0) -> WorkitemCache:
+        '''
+        Enables in-memory cache of get_workitems() and get_single_workitem() results.
+        Cached workitems are refreshed by responses of update_workitem_fields(), add_relation() and remove_relation()
+        of this client, changes made by other clients are seen after time to live.
+
+        Args:
+            max_entries (int): max number of cached workitems. Default: 10000
+            ttl (float): time to live of cached workitem in seconds. Default: 300.0
+
+        Returns:
+            WorkitemCache instance
+        '''
+
+        self.__cache = WorkitemCache(max_entries, ttl)
+        return self.__cache
+
+    def disable_cache(self) -> None:
+        self.__cache = None
+
+    def invalidate_cache(self, item_ids = None) -> None:
+        '''
+        Removes given workitems (or all workitems if item_ids is None) from cache
+        '''
+
+        if self.__cache:
+            if isinstance(item_ids, (int, str, Workitem)):
+                item_ids = [item_ids]
+
+            self.__cache.invalidate([item_id.id if isinstance(item_id, Workitem) else item_id for item_id in item_ids] \
+                if item_ids is not None else None)
+
+    def _refresh_cache(self, workitem: Workitem, expand: str, validate_only: bool, related_ids: List[int] = None) -> None:
+        '''
+        Stores workitem from response of update request in cache and drops older revisions.
+        Related workitems get new revision on server too (e.g. reverse link), so they are dropped.
+        '''
+
+        cache = self.__cache
+        if (not cache) or validate_only or (workitem is None):
+            return
+
+        cache.put(workitem.raw, None, expand)
+        for related_id in related_ids or []:
+            cache.update_revision(related_id, None)
+
+    @property
+    def store(self) -> WorkitemStore:
+        '''
+        Returns:
+            Persistent store of workitems or None: WorkitemStore
+        '''
+        return self.__store
+
+    def attach_store(self, store) -> WorkitemStore:
+        '''
+        Attaches persistent store to get_workitems() and get_single_workitem().
+        Stored workitems are served if their revisions didn't change: revisions are checked with one light request
+        per batch (System.Rev field only), only changed and missing workitems are downloaded and stored.
+
+        Args:
+            store (WorkitemStore | str): store or path of SQLite file
+
+        Returns:
+            WorkitemStore instance
+        '''
+
+        self.__store = store if isinstance(store, WorkitemStore) else WorkitemStore(store)
+        return self.__store
+
+    def detach_store(self) -> None:
+        self.__store = None
+
+    @property
+    def batch_loader(self) -> WorkitemLoader:
+        '''
+        Returns:
+            Micro-batching loader of get_single_workitem() calls or None: WorkitemLoader
         '''
-        Return list of Workitem or raise an exception
+        return self.__batch_loader
+
+    def enable_batch_loader(self, max_batch_size: int = 200, batch_window: float = 0.005) -> WorkitemLoader:
+        '''
+        Enables micro-batching of get_single_workitem() calls (also used by copy_workitem(), update_workitem_fields()
+        and add_relation() with workitem ids). Ids requested by concurrent threads within batch window
+        are read with one get_workitems() call.
+
+        Args:
+            max_batch_size (int): max number of ids in one batch. Default: 200
+            batch_window (float): time in seconds the first caller waits for other ids. Default: 0.005
+
+        Returns:
+            WorkitemLoader instance
+        '''
+
+        self.__batch_loader = WorkitemLoader(self, max_batch_size, batch_window)
+        return self.__batch_loader
+
+    def disable_batch_loader(self) -> None:
+        self.__batch_loader = None
+
+    def session(self, expand: str = 'Fields', bypass_rules: bool = False, suppress_notifications: bool = False, \
+        batch_size: int = None, max_workers: int = None) -> WorkitemSession:
+        '''
+        Returns unit of work: workitems of this client edited inside "with client.session():" block of current thread
+        are written with wit/$batch requests on exit of block or on session.flush(). Responses are applied back to
+        workitem instances. Workitems edited before session can be added with session.add().
+
+        Args:
+            expand (str): The expand parameters of responses applied to workitems. None - no relations and links. Default: Fields
+            bypass_rules (bool): Do not enforce the work item type rules on this update. Default: False
+            suppress_notifications (bool): Do not fire any notifications for this change. Default: False
+            batch_size (int): max number of updates of one request. Default: None (200)
+            max_workers (int): max number of concurrent requests. Default: None (sequential)
+
+        Returns:
+            WorkitemSession instance
+        '''
+
+        return WorkitemSession(self, expand, bypass_rules, suppress_notifications, batch_size, max_workers)
+
+    def _set_session(self, session: WorkitemSession) -> WorkitemSession:
+        '''
+        Sets active session of current thread and returns previous one
+        '''
+
+        previous = getattr(self.__sessions, 'session', None)
+        self.__sessions.session = session
+        return previous
+
+    def _track_dirty(self, workitem: Workitem) -> None:
+        '''
+        Called by edited Workitem, registers it in active session of current thread
+        '''
+
+        session = getattr(self.__sessions, 'session', None)
+        if session is not None:
+            session.add(workitem)
+
+    def _iter_streamed_items(self, method_name: str, http_response) -> Iterator[Workitem]:
+        '''
+        Yields Workitem as soon as it is parsed from streamed response or raise an exception
+        '''
+
+        try:
+            for json_item in self._iter_json_items(http_response):
+                # errorPolicy=omit returns null for items which can't be read
+                if json_item:
+                    yield Workitem.from_json(self, json_item=json_item)
+        except ValueError as ex:
+            raise ClientError(f'WorkitemClient::{method_name}: EXCEPTION raised, http response is not json. Msg: {ex}', ex)
+        except Exception as ex:
+            raise ClientError(f'WorkitemClient::{method_name}: EXCEPTION raised. Msg: {ex}', ex)
+
+    def _get_items(self, request_url: str, query_params, under_project: bool = False, stream: bool = False) -> List[Workitem]:
+        '''
+        Return list of Workitem or raise an exception.
+        Returns iterator of Workitem parsed while response is being downloaded if stream is True.
         '''
         
         url = f'{self.client_connection.project_url}{request_url}' if under_project else f'{self.client_connection.api_url}{request_url}'
         
         try:
-            http_response = self.http_client.get(url, query_params=query_params)
+            if stream:
+                http_response = self.http_client.get(url, query_params=query_params, stream=True)
+            else:
+                http_response = self.http_client.get(url, query_params=query_params)
 
             if not http_response:
                 raise ClientError('WorkitemClient::get_items: can\'t get response from TFS server')
+
+            if stream:
+                return self._iter_streamed_items('get_items', http_response)
             
-            json_items = http_response.json()
+            json_items = self._read_json(http_response)
             if 'value' in json_items:
-                json_items = json_items['value']
-                return [Workitem.from_json(self, json_item=json_item) for json_item in json_items]
+                # errorPolicy=omit returns null for items which can't be read
+                return [Workitem.from_json(self, json_item=json_item) for json_item in json_items['value'] if json_item]
             else:
                 raise ClientError('WorkitemClient::get_items: json http response has no value attribute')
         except ValueError as ex:
             raise ClientError(f'WorkitemClient::get_items: EXCEPTION raised, http response is not json. Msg: {ex}', ex)
         except HTTPError as ex:
-            raise ClientError(f'WorkitemClient::get_items: EXCEPTION raised. Got http error', ex)
+            raise ClientError('WorkitemClient::get_items: EXCEPTION raised. Got http error', ex)
         except Exception as ex:
             raise ClientError(f'WorkitemClient::get_items: EXCEPTION raised. Msg: {ex}', ex)
 
-    def get_workitems(self, item_ids, item_fields: List[str] = None, expand: str = 'All', batch_size: int = 50) -> List[Workitem]:
+    def _get_items_batch(self, item_ids: List[int], item_fields: List[str], expand: str, \
+        as_of: str, error_policy: str, stream: bool = False) -> List[Workitem]:
+        '''
+        Return list of Workitem from POST wit/workitemsbatch request or raise an exception.
+        Returns iterator of Workitem parsed while response is being downloaded if stream is True.
+        '''
+
+        url = f'{self.client_connection.api_url}{self._WORKITEMS_BATCH_URL}'
+        query_params = {
+            'api-version' : self.api_version
+        }
+
+        request_body = {
+            'ids' : item_ids
+        }
+
+        # workitemsbatch doesn't accept fields and $expand together
+        if item_fields:
+            request_body['fields'] = item_fields
+        elif expand:
+            request_body['$expand'] = expand
+
+        if as_of:
+            request_body['asOf'] = as_of
+        if error_policy:
+            request_body['errorPolicy'] = error_policy
+
+        try:
+            if stream:
+                http_response = self.http_client.post_json(url, request_body, query_params=query_params, stream=True)
+            else:
+                http_response = self.http_client.post_json(url, request_body, query_params=query_params)
+
+            if not http_response:
+                raise ClientError('WorkitemClient::get_items_batch: can\'t get response from TFS server')
+
+            if stream:
+                return self._iter_streamed_items('get_items_batch', http_response)
+
+            json_items = self._read_json(http_response)
+            if 'value' in json_items:
+                # errorPolicy=omit returns null for items which can't be read
+                return [Workitem.from_json(self, json_item=json_item) for json_item in json_items['value'] if json_item]
+            else:
+                raise ClientError('WorkitemClient::get_items_batch: json http response has no value attribute')
+        except ValueError as ex:
+            raise ClientError(f'WorkitemClient::get_items_batch: EXCEPTION raised, http response is not json. Msg: {ex}', ex)
+        except HTTPError as ex:
+            if WorkitemClient._is_batch_not_supported(ex.response, self._read_json):
+                raise _BatchNotSupportedError(f'WorkitemClient::get_items_batch: server doesn\'t support {self._WORKITEMS_BATCH_URL}', ex)
+            raise ClientError('WorkitemClient::get_items_batch: EXCEPTION raised. Got http error', ex)
+        except ClientError:
+            raise
+        except Exception as ex:
+            raise ClientError(f'WorkitemClient::get_items_batch: EXCEPTION raised. Msg: {ex}', ex)
+
+    @staticmethod
+    def _is_batch_not_supported(response, read_json) -> bool:
+        '''
+        Returns True if error response means that server doesn't have wit/workitemsbatch endpoint.
+        404 of workitem error (TF401232: workitem doesn't exist, errorPolicy=Fail) is error of request, not of endpoint.
+        Error body is decoded with read_json, codec of client.
+        '''
+
+        if response is None:
+            return False
+
+        if response.status_code == 405:
+            return True
+
+        if response.status_code != 404:
+            return False
+
+        try:
+            json_error = read_json(response)
+        except Exception:
+            return True
+
+        if not isinstance(json_error, dict):
+            return True
+
+        message = str(json_error.get('message') or '')
+        type_key = str(json_error.get('typeKey') or '')
+
+        return ('TF401232' not in message) and (not type_key.startswith('WorkItem'))
+
+    def _make_batch_reader(self, item_ids, item_fields: List[str], expand: str, batch_size: int, \
+        as_of: Union[datetime, str], error_policy: str, stream: bool = False):
+        '''
+        Returns function to read one batch of workitems and list of batches of item ids.
+        Reader uses POST wit/workitemsbatch and falls back to GET wit/workitems if server doesn't support it.
+        If stream is True reader returns iterator of workitems parsed while response is being downloaded.
+        '''
+
+        item_ids = WorkitemClient._normalize_ids(item_ids)
+
+        if isinstance(as_of, datetime):
+            as_of = as_of.isoformat()
+
+        # Http Query Params for GET wit/workitems
+        query_params = {
+            '$expand' : expand,
+            'api-version' : self.api_version
+        }
+
+        # Request filelds
+        if item_fields:
+            query_params['fields'] = ','.join(item_fields)
+        if as_of:
+            query_params['asOf'] = as_of
+        if error_policy:
+            query_params['errorPolicy'] = error_policy
+
+        list_size = batch_size or self._WORKITEMS_LIST_SIZE
+
+        def get_batch(items: List[int]) -> List[Workitem]:
+            with tracing.span('WorkitemClient.get_batch', id_count=len(items), stream=stream):
+                return read_batch(items)
+
+        def read_batch(items: List[int]) -> List[Workitem]:
+            if self._workitems_batch_supported is not False:
+                try:
+                    workitems = self._get_items_batch(items, item_fields, expand, as_of, error_policy, stream)
+                    self._workitems_batch_supported = True
+
+                    return workitems
+                except _BatchNotSupportedError:
+                    self._workitems_batch_supported = False
+
+            # Each request gets its own copy of query params, so batches can be requested concurrently
+            def make_params(list_items: List[int]) -> dict:
+                list_params = dict(query_params)
+                list_params['ids'] = ','.join(map(str, list_items))
+                return list_params
+
+            if stream:
+                return chain.from_iterable(self._get_items(self._WORKITEM_URL, query_params=make_params(list_items), stream=True) \
+                    for list_items in batch(items, list_size))
+
+            workitems = list()
+            for list_items in batch(items, list_size):
+                workitems += self._get_items(self._WORKITEM_URL, query_params=make_params(list_items))
+
+            return workitems
+
+        if not batch_size:
+            batch_size = self._WORKITEMS_LIST_SIZE \
+                if self._workitems_batch_supported is False else self._WORKITEMS_BATCH_SIZE
+
+        batches = list(batch(item_ids, batch_size))
+        tracing.set_attributes(id_count=len(item_ids), batch_size=batch_size, batch_count=len(batches))
+
+        # spans of batches requested in executor threads are children of span of caller
+        return tracing.bind_context(get_batch), batches
+
+    @staticmethod
+    def _normalize_ids(item_ids) -> List[int]:
+        '''
+        Returns list of int ids for id or list of ids or raise an exception
+        '''
+
+        if not item_ids:
+            raise ClientError('WorkitemClient::get_workitems: item ids can\'t be None')
+
+        if isinstance(item_ids, int):
+            item_ids = [item_ids]
+        if isinstance(item_ids, str):
+            item_ids = [int(item_ids)]
+
+        return [int(item_id) for item_id in item_ids]
+
+    @traced()
+    def get_workitems(self, item_ids, item_fields: List[str] = None, expand: str = 'All', batch_size: int = None, \
+        max_workers: int = None, executor: Executor = None, \
+        as_of: Union[datetime, str] = None, error_policy: str = None) -> List[Workitem]:
         '''
         Returns list of Workitems for given list of item ids.
+        Uses POST wit/workitemsbatch (up to 200 ids per request) if server supports it, otherwise GET wit/workitems.
+        If cache is enabled (see enable_cache()) only workitems missing in cache are requested.
+        If store is attached (see attach_store()) only workitems which revisions changed are downloaded.
+        Docs: https://docs.microsoft.com/en-us/rest/api/azure/devops/wit/work-items/get-work-items-batch?view=azure-devops-rest-6.0
         Docs: https://docs.microsoft.com/en-us/rest/api/azure/devops/wit/work-items/list?view=azure-devops-rest-6.0
 
         Args:
             item_ids (List[int] | List[str] | int | str): list of ids of workitems to get
             item_fields (List[str]): list of requested fields of workitems
             expand (str): The expand parameters for work item attributes. Possible options are { None, Relations, Fields, Links, All }. Default: All
-            batch_size (int): batch size
+            batch_size (int): batch size. Default: None (200 for workitemsbatch, 50 for GET)
+            max_workers (int): number of batches requested concurrently over the shared HttpClient. Default: None (sequential)
+            executor (Executor): executor used to request batches concurrently. Overrides max_workers. Default: None
+            as_of (datetime | str): get workitems as they were at given date time. Default: None (current state)
+            error_policy (str): The flag to control error policy. Possible options are { Fail, Omit }. Default: None (Fail)
 
         Returns:
-            List or workitems: List[Workitem]
+            List or workitems in order of requested ids: List[Workitem]
 
         Raises:
             ClientError with information about exception
         '''
 
-        if not item_ids:
-            raise ClientError('WorkitemClient::get_workitems: item ids can\'t be None')
+        if as_of:
+            return self._read_workitems(item_ids, item_fields, expand, batch_size, max_workers, executor, as_of, error_policy)
 
-        if isinstance(item_ids, int):
-            item_ids = [item_ids]
-        if isinstance(item_ids, str):
-            item_ids = [int(item_ids)]
+        cache = self.__cache
+        if cache:
+            return self._get_cached_workitems(cache, item_ids, item_fields, expand, batch_size, max_workers, executor, error_policy)
 
-        # Http Query Params
-        query_params = {
-            '$expand' : expand,
-            'api-version' : self.api_version
-        }
+        return self._load_workitems(item_ids, item_fields, expand, batch_size, max_workers, executor, error_policy)
 
-        # Request filelds
-        if item_fields:
-            query_params['fields'] = ','.join(item_fields)
+    @traced()
+    def read_workitems(self, item_ids, item_fields: List[str] = None, expand: str = 'All', batch_size: int = None, \
+        max_workers: int = None, executor: Executor = None, \
+        as_of: Union[datetime, str] = None, error_policy: str = None) -> List[Workitem]:
+        '''
+        Returns list of Workitems for given list of item ids read from server. Cache and store aren't used,
+        e.g. when ids are known to be changed and revision check of store would be wasted.
+        Arguments are the same as of get_workitems().
+
+        Returns:
+            List or workitems in order of requested ids: List[Workitem]
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        return self._read_workitems(item_ids, item_fields, expand, batch_size, max_workers, executor, as_of, error_policy)
+
+    def _load_workitems(self, item_ids, item_fields: List[str], expand: str, batch_size: int, \
+        max_workers: int, executor: Executor, error_policy: str) -> List[Workitem]:
+        '''
+        Returns current workitems from persistent store if it is attached, otherwise reads them from server
+        '''
+
+        store = self.__store
+        if store:
+            return self._get_stored_workitems(store, item_ids, item_fields, expand, batch_size, max_workers, executor, error_policy)
+
+        return self._read_workitems(item_ids, item_fields, expand, batch_size, max_workers, executor, None, error_policy)
+
+    def _get_stored_workitems(self, store: WorkitemStore, item_ids, item_fields: List[str], expand: str, batch_size: int, \
+        max_workers: int, executor: Executor, error_policy: str) -> List[Workitem]:
+        '''
+        Returns workitems from store if their revisions didn't change on server, reads changed and missing ones from server
+        '''
+
+        item_ids = WorkitemClient._normalize_ids(item_ids)
+        unique_ids = list(dict.fromkeys(item_ids))
+
+        stored = store.get(unique_ids, item_fields, expand)
+
+        # revisions of stored workitems are checked with light request of System.Rev field only
+        current_revisions = dict()
+        if stored:
+            for workitem in self._read_workitems(list(stored.keys()), [self._REVISION_FIELD], None, batch_size, \
+                max_workers, executor, None, 'Omit'):
+                current_revisions[workitem.id] = WorkitemStore._get_revision(workitem.raw)
+
+        json_items: Dict[int, dict] = dict()
+        for item_id, (revision, json_item) in stored.items():
+            if current_revisions.get(item_id) == revision:
+                json_items[item_id] = json_item
+
+        # deleted workitems are requested again, so error policy of caller is applied
+        changed_ids = [item_id for item_id in unique_ids if item_id not in json_items]
+        store._record(len(json_items), len(unique_ids) - len(stored), len(stored) - len(json_items))
+
+        workitems: Dict[int, Workitem] = dict()
+        if changed_ids:
+            changed_items = self._read_workitems(changed_ids, item_fields, expand, batch_size, max_workers, executor, None, error_policy)
+            store.put([workitem.raw for workitem in changed_items], item_fields, expand)
+
+            for workitem in changed_items:
+                workitems[workitem.id] = workitem
+
+        for item_id, json_item in json_items.items():
+            workitems[item_id] = Workitem.from_json(self, json_item=json_item)
+
+        return [workitems[item_id] for item_id in item_ids if item_id in workitems]
+
+    def _get_cached_workitems(self, cache: WorkitemCache, item_ids, item_fields: List[str], expand: str, batch_size: int, \
+        max_workers: int, executor: Executor, error_policy: str) -> List[Workitem]:
+        '''
+        Returns workitems from cache and reads missing ones from server
+        '''
+
+        item_ids = WorkitemClient._normalize_ids(item_ids)
+
+        json_items: Dict[int, dict] = dict()
+        missing_ids = list()
+        for item_id in dict.fromkeys(item_ids):
+            json_item = cache.get(item_id, item_fields, expand)
+            if json_item is not None:
+                json_items[item_id] = json_item
+            else:
+                missing_ids.append(item_id)
+
+        workitems: Dict[int, Workitem] = dict()
+        if missing_ids:
+            for workitem in self._load_workitems(missing_ids, item_fields, expand, batch_size, max_workers, executor, error_policy):
+                cache.put(workitem.raw, item_fields, expand)
+                workitems[workitem.id] = workitem
+
+        # every call gets its own Workitem instances, so changes of one caller don't leak to cache
+        for item_id, json_item in json_items.items():
+            workitems[item_id] = Workitem.from_json(self, json_item=json_item)
+
+        return [workitems[item_id] for item_id in item_ids if item_id in workitems]
+
+    def _read_workitems(self, item_ids, item_fields: List[str], expand: str, batch_size: int, \
+        max_workers: int, executor: Executor, as_of: Union[datetime, str], error_policy: str) -> List[Workitem]:
+        '''
+        Reads workitems from server batch by batch, sequentially or concurrently
+        '''
+
+        get_batch, batches = self._make_batch_reader(item_ids, item_fields, expand, batch_size, as_of, error_policy)
 
         workitems = list()
-        for items in batch(list(item_ids), batch_size):
-            query_params['ids'] = ','.join(map(str, items))
 
-            workitems += self._get_items(self._WORKITEM_URL, query_params=query_params)
+        # Probe workitemsbatch endpoint with the first batch before going concurrent
+        if (self._workitems_batch_supported is None) and batches:
+            workitems += get_batch(batches.pop(0))
+
+        if (len(batches) > 1) and (executor or (max_workers and max_workers > 1)):
+            # Executor.map returns results in order of batches and re-raises first ClientError
+            if executor:
+                for items in executor.map(get_batch, batches):
+                    workitems += items
+            else:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as pool:
+                    for items in pool.map(get_batch, batches):
+                        workitems += items
+        else:
+            for items in batches:
+                workitems += get_batch(items)
         
         return workitems
 
+    @traced()
+    def iter_workitems(self, item_ids, item_fields: List[str] = None, expand: str = 'All', batch_size: int = None, \
+        prefetch: bool = False, as_of: Union[datetime, str] = None, error_policy: str = None, \
+        stream: bool = False) -> Iterator[Workitem]:
+        '''
+        Generator yields Workitems for given list of item ids batch by batch.
+        Only current batch (and next batch if prefetch is True) is kept in memory.
+        If stream is True, every workitem is yielded as soon as it is parsed from response being downloaded
+        and only current workitem is kept in memory.
+
+        Args:
+            item_ids (List[int] | List[str] | int | str): list of ids of workitems to get
+            item_fields (List[str]): list of requested fields of workitems
+            expand (str): The expand parameters for work item attributes. Possible options are { None, Relations, Fields, Links, All }. Default: All
+            batch_size (int): batch size. Default: None (200 for workitemsbatch, 50 for GET)
+            prefetch (bool): request next batch in background while current batch is consumed. Default: False
+            as_of (datetime | str): get workitems as they were at given date time. Default: None (current state)
+            error_policy (str): The flag to control error policy. Possible options are { Fail, Omit }. Default: None (Fail)
+            stream (bool): parse responses incrementally while they are downloaded. Prefetch is ignored. Default: False
+
+        Returns:
+            Iterator of workitems in order of requested ids: Iterator[Workitem]
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        get_batch, batches = self._make_batch_reader(item_ids, item_fields, expand, batch_size, as_of, error_policy, stream)
+
+        if stream or (not prefetch) or (len(batches) < 2):
+            for items in batches:
+                yield from get_batch(items)
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(get_batch, batches[0])
+
+            for next_items in batches[1:]:
+                workitems = future.result()
+                future = pool.submit(get_batch, next_items)
+
+                yield from workitems
+
+            # Drop reference to consumed batch before waiting for the last one
+            workitems = None
+            yield from future.result()
+
+    @traced()
     def get_single_workitem(self, item_id, item_fields: List[str] = None) -> Workitem:
         '''
-        Get single TFS/Azure workitem. Calls get_workitems().
+        Get single TFS/Azure workitem. Calls get_workitems() or batch loader if it is enabled.
         
         Args:
             item_id (int| str): workitem id
@@ -110,9 +666,14 @@ class WorkitemClient(BaseClient):
         if not item_id:
             raise ClientError('WorkitemClient::get_single_workitem: item_id can\'t be None')
 
+        batch_loader = self.__batch_loader
+        if batch_loader:
+            return batch_loader.load(item_id, item_fields)
+
         items = self.get_workitems(item_ids=item_id, item_fields=item_fields)
         return items[0] if items else None
 
+    @traced()
     def get_workitem_changes(self, item_id: Union[int, Workitem], skip: int = 0, top: int = -1) -> List[WorkitemChange]:
         '''
         Get Workitem history changes (updates).
@@ -149,20 +710,23 @@ class WorkitemClient(BaseClient):
         try:
             changes: List[WorkitemChange] = list()
 
+            page = 0
             hasNext = True
             while hasNext:
-                http_response = self.http_client.get(request_url, query_params)
+                with tracing.span('WorkitemClient.get_workitem_changes.page', page=page, skip=int(query_params['$skip'])):
+                    http_response = self.http_client.get(request_url, query_params)
+                page += 1
 
                 if not http_response:
                     raise ClientError('WorkitemClient::get_workitem_history: can\'t get response from TFS server')
                 
-                json_items = http_response.json()
+                json_items = self._read_json(http_response)
                 if ('count' in json_items) and (int(json_items['count']) == 0):
                     hasNext = False
                     continue
 
                 if 'value' in json_items:
-                    query_params['$skip'] = str(json_items['count'])
+                    query_params['$skip'] = str(int(query_params['$skip']) + int(json_items['count']))
                     
                     changes += [WorkitemChange.from_json(json_changes) for json_changes in json_items['value']]
                 else:
@@ -172,6 +736,149 @@ class WorkitemClient(BaseClient):
         except Exception as ex:
             raise ClientError(f'WorkitemClient::get_workitem_history: exception raised. Msg: {ex}', ex)
 
+    ### REGION REPORTING ###
+
+    # https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/reporting-work-item-revisions/read-reporting-revisions-get?view=azure-devops-rest-6.0
+    @traced()
+    def iter_reporting_revisions(self, fields: List[str] = None, start_datetime: Union[datetime, str] = None, \
+        types: List[str] = None, continuation_token: str = None, include_deleted: bool = False, \
+        include_latest_only: bool = False, max_page_size: int = None) -> Iterator[ReportingBatch]:
+        '''
+        Generator yields pages of revisions of all workitems of project (bulk export for data warehouse).
+        Follows continuation token until the last batch. Only current page is kept in memory.
+        To resume export save continuation_token of processed page and pass it to the next call.
+
+        Args:
+            fields (List[str]): list of returned fields. Default: None (all fields)
+            start_datetime (datetime | str): return revisions changed since this date. Ignored with continuation_token. Default: None
+            types (List[str]): list of workitem types. Default: None (all types)
+            continuation_token (str): token of page to start from. Default: None (the first page)
+            include_deleted (bool): return revisions of deleted workitems. Default: False
+            include_latest_only (bool): return only the latest revision of every workitem. Default: False
+            max_page_size (int): max number of revisions of one page. Default: None (server default)
+
+        Returns:
+            Iterator of pages of WorkitemRevision: Iterator[ReportingBatch]
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        request_url = f'{self.client_connection.project_url}{self._REPORTING_REVISIONS_URL}'
+
+        query_params = {
+            'api-version' : self.api_version
+        }
+
+        if fields:
+            query_params['fields'] = ','.join(fields)
+
+        if types:
+            query_params['types'] = ','.join(types)
+
+        if isinstance(start_datetime, datetime):
+            start_datetime = start_datetime.isoformat()
+
+        if start_datetime and (not continuation_token):
+            query_params['startDateTime'] = start_datetime
+
+        if include_deleted:
+            query_params['includeDeleted'] = 'true'
+
+        if include_latest_only:
+            query_params['includeLatestOnly'] = 'true'
+
+        if max_page_size:
+            query_params['$maxPageSize'] = str(max_page_size)
+
+        yield from self._iter_reporting_pages('iter_reporting_revisions', request_url, query_params, \
+            continuation_token, WorkitemRevision.from_json)
+
+    # https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/reporting-work-item-links/get?view=azure-devops-rest-6.0
+    @traced()
+    def iter_reporting_links(self, link_types: List[str] = None, types: List[str] = None, \
+        start_datetime: Union[datetime, str] = None, continuation_token: str = None) -> Iterator[ReportingBatch]:
+        '''
+        Generator yields pages of link changes of project as compact WorkitemLink records
+        (source_id, target_id, rel, changed_date, is_active) without fields of workitems.
+        Removed links come with is_active False. Follows continuation token until the last batch.
+        Continuation token of the last page is a watermark: pass it to the next call to get only later link changes.
+
+        Args:
+            link_types (List[str]): list of link types, e.g. System.LinkTypes.Hierarchy-Forward. Default: None (all types)
+            types (List[str]): list of workitem types. Default: None (all types)
+            start_datetime (datetime | str): return links changed since this date. Ignored with continuation_token. Default: None
+            continuation_token (str): token of page to start from. Default: None (the first page)
+
+        Returns:
+            Iterator of pages of WorkitemLink: Iterator[ReportingBatch]
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        request_url = f'{self.client_connection.project_url}{self._REPORTING_LINKS_URL}'
+
+        query_params = {
+            'api-version' : self.api_version
+        }
+
+        if link_types:
+            query_params['linkTypes'] = ','.join(link_types)
+
+        if types:
+            query_params['types'] = ','.join(types)
+
+        if isinstance(start_datetime, datetime):
+            start_datetime = start_datetime.isoformat()
+
+        if start_datetime and (not continuation_token):
+            query_params['startDateTime'] = start_datetime
+
+        yield from self._iter_reporting_pages('iter_reporting_links', request_url, query_params, \
+            continuation_token, WorkitemLink.from_json)
+
+    def _iter_reporting_pages(self, method_name: str, request_url: str, query_params: dict, \
+        continuation_token: str, from_json) -> Iterator[ReportingBatch]:
+        '''
+        Yields pages of reporting endpoint until isLastBatch
+        '''
+
+        page = 0
+        is_last_batch = False
+
+        while not is_last_batch:
+            if continuation_token:
+                query_params['continuationToken'] = continuation_token
+
+            try:
+                with tracing.span(f'WorkitemClient.{method_name}.page', page=page):
+                    http_response = self.http_client.get(request_url, query_params=query_params)
+                page += 1
+
+                if not http_response:
+                    raise ClientError(f'WorkitemClient::{method_name}: can\'t get response from TFS server')
+
+                json_items = self._read_json(http_response)
+                if 'values' not in json_items:
+                    raise ClientError(f'WorkitemClient::{method_name}: response doesn\'t have \'values\' attribute')
+
+                items = [from_json(json_item) for json_item in json_items['values']]
+                next_token = json_items.get('continuationToken')
+                # server without isLastBatch is done when token doesn't move
+                is_last_batch = bool(json_items.get('isLastBatch', (not next_token) or (next_token == continuation_token)))
+            except ValueError as ex:
+                raise ClientError(f'WorkitemClient::{method_name}: response is not json. Msg: {ex}', ex)
+            except ClientError:
+                raise
+            except Exception as ex:
+                raise ClientError(f'WorkitemClient::{method_name}: EXCEPTION raised. Msg: {ex}', ex)
+
+            continuation_token = next_token or continuation_token
+            yield ReportingBatch(items, continuation_token, is_last_batch)
+
+    ### END REGION REPORTING ###
+
     # return dictonary with standart query params
     @staticmethod
     def _make_query_params(expand: str, bypass_rules: bool, suppress_notifications: bool, validate_only: bool) -> dict:
@@ -183,10 +890,11 @@ class WorkitemClient(BaseClient):
             'api-version' : BaseClient.api_version,
             '$expand' : expand,
             'bypassRules' : str(bypass_rules),
-            'suppressNotifications' : str(bypass_rules),
+            'suppressNotifications' : str(suppress_notifications),
             'validateOnly' : str(validate_only)
         }
     
+    @traced()
     def create_workitem(self, type_name: str, \
         item_fields: Dict[str, str] = None, item_relations: List[WorkitemRelation] = None, \
         project: str = None, \
@@ -245,12 +953,64 @@ class WorkitemClient(BaseClient):
                 query_params=query_params, custom_headers=custom_headers)
             
             if http_response:
-                return Workitem.from_json(self, http_response.json())
+                return Workitem.from_json(self, self._read_json(http_response))
             else:
                 raise ClientError('WorkitemClient::create_workitem: can\'t create workitem')
         except Exception as ex:
             raise ClientError(f'WorkitemClient::create_workitem: EXCEPTION raised. Msg: {ex}', ex)
 
+    @staticmethod
+    def _copy_fields(source_item: Workitem, item_fields: List[str] = None, item_ignore_fileds: List[str] = None) -> Dict[str, str]:
+        '''
+        Returns dictonary of fields of source workitem to copy
+        '''
+
+        ignore_fields = [
+            'System.TeamProject',
+            'System.AreaId',
+            'System.AreaPath',
+            'System.AreaLevel1',
+            'System.AreaLevel2',
+            'System.AreaLevel3',
+            'System.AreaLevel4',
+            'System.Id',
+            'System.NodeName',
+            'System.Rev',
+            'System.AutorizedDate',
+            'System.RevisedDate',
+            'System.IterationId',
+            'System.IterationLevel1',
+            'System.IterationLevel2',
+            'System.IterationLevel3',
+            'System.IterationLevel4',
+            'System.CreatedBy',
+            'System.ChangedDate',
+            'System.ChangedBy',
+            'System.AuthorizedAs',
+            'System.AuthorizedDate',
+            'System.Watermark',
+            'System.BoardColumn',
+        ]
+
+        source_item_fields = source_item.fields
+
+        fields = {}
+        for fld_name, fld_value in source_item_fields.items():
+            if item_ignore_fileds:
+                if fld_name in item_ignore_fileds:
+                    continue
+
+            if fld_name in ignore_fields:
+                continue
+
+            if item_fields:
+                fields[fld_name] = item_fields[fld_name] if (fld_name in item_fields) else fld_value
+            else:
+                fields[fld_name] = fld_value
+
+        return fields
+
+    @traced()
     def copy_workitem(self, source_item, item_fields: List[str] = None, \
                       item_ignore_fileds: List[str] = None) -> Workitem:
         '''
@@ -277,53 +1037,7 @@ class WorkitemClient(BaseClient):
         if (not isinstance(source_item, Workitem)) or (source_item is None):
             raise ClientError('WorkitemClient::copy_workitem: source item is None')
         
-        def copy_wi_fields():
-            ignore_fields = [
-                'System.TeamProject',
-                'System.AreaId',
-                'System.AreaPath',
-                'System.AreaLevel1',
-                'System.AreaLevel2',
-                'System.AreaLevel3',
-                'System.AreaLevel4',
-                'System.Id',
-                'System.NodeName',
-                'System.Rev',
-                'System.AutorizedDate',
-                'System.RevisedDate',
-                'System.IterationId',
-                'System.IterationLevel1',
-                'System.IterationLevel2',
-                'System.IterationLevel3',
-                'System.IterationLevel4',
-                'System.CreatedBy',
-                'System.ChangedDate',
-                'System.ChangedBy',
-                'System.AuthorizedAs',
-                'System.AuthorizedDate',
-                'System.Watermark',
-                'System.BoardColumn',
-            ]
-
-            source_item_fields = source_item.fields
-
-            fields = {}
-            for fld_name, fld_value in source_item_fields.items():
-                if item_ignore_fileds:
-                    if fld_name in item_ignore_fileds:
-                        continue
-
-                if fld_name in ignore_fields:
-                    continue
-
-                if item_fields:
-                    fields[fld_name] = item_fields[fld_name] if (fld_name in item_fields) else fld_value
-                else:
-                    fields[fld_name] = fld_value
-
-            return fields
-
-        fields = copy_wi_fields()
+        fields = WorkitemClient._copy_fields(source_item, item_fields, item_ignore_fileds)
         item_type_name = source_item.type_name
 
         try:
@@ -331,6 +1045,45 @@ class WorkitemClient(BaseClient):
         except Exception as ex:
             raise ClientError(f'WorkitemClient::copy_workitem: EXCEPTION raised. Msg: {ex}', ex)
 
+    @traced()
+    def copy_workitems(self, source_items, item_fields: List[str] = None, item_ignore_fileds: List[str] = None, \
+        max_workers: int = None) -> BatchResult:
+        '''
+        Creates copies of given workitems: source workitems are read with get_workitems(), copies are created
+        with create_workitems() through wit/$batch.
+
+        Args:
+            source_items (List[int | Workitem]): source workitems
+            item_fields (List[str]): fields of source workitems to copy. Default: None (all fields).
+            item_ignore_fileds (List[str]): fields of source workitems to ignore. Default: None
+            max_workers (int): max number of concurrent requests. Default: None (sequential)
+
+        Returns:
+            Results of creation in order of source workitems: BatchResult
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        if not source_items:
+            raise ClientError('WorkitemClient::copy_workitems: source_items can\'t be empty')
+
+        read_ids = [source_item for source_item in source_items if not isinstance(source_item, Workitem)]
+        read_items = {workitem.id: workitem for workitem in self.get_workitems(read_ids, max_workers=max_workers)} if read_ids else {}
+
+        specs = list()
+        for source_item in source_items:
+            if not isinstance(source_item, Workitem):
+                source_item = read_items.get(int(source_item))
+                if source_item is None:
+                    raise ClientError('WorkitemClient::copy_workitems: source item is None')
+
+            fields = WorkitemClient._copy_fields(source_item, item_fields, item_ignore_fileds)
+            specs.append(WorkitemSpec(source_item.type_name, fields))
+
+        return self.create_workitems(specs, max_workers=max_workers)
+
+    @traced()
     def update_workitem_fields(self, workitem, item_fields: Dict[str, str], \
         expand: str='All', bypass_rules: bool = False, \
         suppress_notifications: bool = False, validate_only: bool = False) -> Workitem:
@@ -385,14 +1138,390 @@ class WorkitemClient(BaseClient):
                 query_params=query_params, custom_headers=custom_headers)
             
             if http_response:
-                return Workitem.from_json(self, http_response.json())
+                updated_workitem = Workitem.from_json(self, self._read_json(http_response))
+                self._refresh_cache(updated_workitem, expand, validate_only)
+
+                return updated_workitem
             else:
                 raise ClientError('WorkitemClient::update_workitem_fields: can\'t update workitem fields. Response has error')
         except Exception as ex:
             raise ClientError(f'WorkitemClient::update_workitem_fields: EXCEPTION raised. Msg: {ex}', ex)
 
+    ### REGION BATCH REQUESTS ###
+
+    # Max count of requests of one wit/$batch request
+    _BATCH_MAX_REQUESTS = 200
+
+    @traced()
+    def update_workitems_batch(self, updates: Dict[Union[int, Workitem], Dict[str, str]], \
+        expand: str = None, bypass_rules: bool = False, suppress_notifications: bool = False, \
+        validate_only: bool = False, batch_size: int = None, max_workers: int = None) -> BatchResult:
+        '''
+        Updates fields of many workitems with wit/$batch: up to 200 workitem updates per request.
+        Workitems aren't read before update. Updates are independent: failed updates are reported per workitem
+        and can be sent again with update_workitems_batch(result.failed_updates).
+        Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/work-items/update?view=azure-devops-rest-6.0
+
+        Args:
+            updates (Dict[int | Workitem, Dict[str, str]]): dictonary { workitem: { field: value } }
+            expand: The expand parameters for returned workitems. Possible options are { None, Relations, Fields, Links, All }. Default: None
+            bypass_rules: Do not enforce the work item type rules on this update
+            suppress_notifications: Do not fire any notifications for this change
+            validate_only: Indicate if you only want to validate the changes without saving the work item
+            batch_size (int): max number of updates of one request. Default: None (200)
+            max_workers (int): max number of concurrent requests. Default: None (sequential)
+
+        Returns:
+            Results of updates in order of input: BatchResult
+
+        Raises:
+            ClientError if updates are invalid
+        '''
+
+        if not updates:
+            raise ClientError('WorkitemClient::update_workitems_batch: updates can\'t be empty')
+
+        query_params = WorkitemClient._make_query_params(expand, bypass_rules, suppress_notifications, validate_only)
+
+        item_updates, batch_requests = list(), list()
+        for workitem, item_fields in updates.items():
+            item_id = workitem.id if isinstance(workitem, Workitem) else int(workitem)
+            if not item_fields:
+                raise ClientError(f'WorkitemClient::update_workitems_batch: fields of workitem {item_id} can\'t be empty')
+
+            operations = [dict(op='add', path='/fields/{}'.format(name), value=value) for name, value in item_fields.items()]
+
+            item_updates.append((item_id, item_fields))
+            batch_requests.append(self._make_batch_request('PATCH', f'{self._WORKITEM_URL}/{item_id}', query_params, operations))
+
+        responses, requests = self._send_batch('update_workitems_batch', batch_requests, batch_size, max_workers)
+
+        results = list()
+        for (item_id, item_fields), (status_code, json_item, error) in zip(item_updates, responses):
+            workitem = self._read_batch_workitem(json_item, error, expand, validate_only)
+            results.append(BatchItemResult(item_fields, item_id, status_code, workitem, error))
+
+        return BatchResult(results, requests)
+
+    @traced()
+    def create_workitems(self, specs: List[WorkitemSpec], project: str = None, \
+        expand: str = None, bypass_rules: bool = False, suppress_notifications: bool = False, \
+        validate_only: bool = False, use_batch: bool = True, batch_size: int = None, max_workers: int = None) -> BatchResult:
+        '''
+        Creates many workitems with wit/$batch (up to 200 workitems per request) or, if use_batch is False,
+        with concurrent create requests. Specs may link to each other by negative temporary ids
+        (e.g. parent and its children): linked workitems are created first and temporary ids are replaced by real ids,
+        inside one $batch request server resolves them itself.
+        Specs which link to workitem that failed to be created fail too.
+
+        Args:
+            specs (List[WorkitemSpec]): specifications of new workitems
+            project (str): project name. Default: None (project of client connection)
+            expand: The expand parameters for returned workitems. Possible options are { None, Relations, Fields, Links, All }. Default: None
+            bypass_rules: Do not enforce the work item type rules on this update
+            suppress_notifications: Do not fire any notifications for this change
+            validate_only: Indicate if you only want to validate the changes without saving the work item
+            use_batch (bool): send workitems with wit/$batch, otherwise one create request per workitem. Default: True
+            batch_size (int): max number of workitems of one $batch request. Default: None (200)
+            max_workers (int): max number of concurrent requests. Default: None (sequential)
+
+        Returns:
+            Results of creation in order of specs: BatchResult
+
+        Raises:
+            ClientError if specs are invalid: unknown or duplicated temporary id, cyclic links
+        '''
+
+        if not specs:
+            raise ClientError('WorkitemClient::create_workitems: specs can\'t be empty')
+
+        waves = WorkitemClient._order_specs(specs)
+        query_params = WorkitemClient._make_query_params(expand, bypass_rules, suppress_notifications, validate_only)
+
+        results: List[BatchItemResult] = [None] * len(specs)
+        # temporary id -> id of created workitem
+        created: Dict[int, int] = dict()
+
+        if use_batch:
+            requests = self._create_batched(specs, waves, created, results, project, query_params, expand, \
+                validate_only, batch_size, max_workers)
+        else:
+            requests = self._create_concurrently(specs, waves, created, results, project, query_params, expand, \
+                validate_only, max_workers)
+
+        return BatchResult(results, requests)
+
+    @staticmethod
+    def _order_specs(specs: List[WorkitemSpec]) -> List[List[int]]:
+        '''
+        Returns indexes of specs grouped in waves: specs of wave link only to specs of previous waves
+        '''
+
+        temp_ids = set()
+        for spec in specs:
+            if not isinstance(spec, WorkitemSpec):
+                raise ClientError('WorkitemClient::create_workitems: spec should be instance of WorkitemSpec')
+
+            if spec.temp_id is not None:
+                if spec.temp_id in temp_ids:
+                    raise ClientError(f'WorkitemClient::create_workitems: temporary id {spec.temp_id} is duplicated')
+                temp_ids.add(spec.temp_id)
+
+        for spec in specs:
+            for temp_id in spec.dependencies:
+                if temp_id not in temp_ids:
+                    raise ClientError(f'WorkitemClient::create_workitems: unknown temporary id {temp_id}')
+
+        waves, ordered, pending = list(), set(), list(range(len(specs)))
+        while pending:
+            wave = [index for index in pending if all(temp_id in ordered for temp_id in specs[index].dependencies)]
+            if not wave:
+                raise ClientError('WorkitemClient::create_workitems: specs have cyclic links')
+
+            waves.append(wave)
+            ordered.update(specs[index].temp_id for index in wave if specs[index].temp_id is not None)
+
+            wave = set(wave)
+            pending = [index for index in pending if index not in wave]
+
+        return waves
+
+    def _make_create_operations(self, spec: WorkitemSpec, created: Dict[int, int], keep_temp_ids: bool) -> List[dict]:
+        '''
+        Returns json patch operations of new workitem. Temporary ids of created workitems are replaced by real ids
+        '''
+
+        operations = list()
+        if keep_temp_ids and (spec.temp_id is not None):
+            operations.append(dict(op='add', path='/id', value=spec.temp_id))
+
+        operations += [dict(op='add', path='/fields/{}'.format(name), value=value) for name, value in spec.fields.items()]
+
+        for relation_name, target_id in spec.relations:
+            target_id = created.get(target_id, target_id)
+            operations.append(dict(op='add', path='/relations/-', \
+                value=dict(rel=relation_name, url=f'{self.client_connection.api_url}{self._WORKITEM_URL}/{target_id}', attributes=None)))
+
+        return operations
+
+    @staticmethod
+    def _check_dependencies(spec: WorkitemSpec, available: set) -> str:
+        '''
+        Returns error if spec links to workitem which wasn't created
+        '''
+
+        for temp_id in spec.dependencies:
+            if temp_id not in available:
+                return f'WorkitemClient::create_workitems: linked workitem {temp_id} wasn\'t created'
+
+        return None
+
+    def _create_batched(self, specs: List[WorkitemSpec], waves: List[List[int]], created: Dict[int, int], \
+        results: List[BatchItemResult], project: str, query_params: dict, expand: str, validate_only: bool, \
+        batch_size: int, max_workers: int) -> int:
+        '''
+        Creates workitems with wit/$batch. Chunks are sent one by one if specs link to each other, so
+        temporary ids of previous chunks can be replaced. Returns number of HTTP requests
+        '''
+
+        order = [index for wave in waves for index in wave]
+        batch_size = min(max(1, batch_size or self._BATCH_MAX_REQUESTS), self._BATCH_MAX_REQUESTS)
+
+        if any(spec.dependencies for spec in specs):
+            groups = [order[index:index + batch_size] for index in range(0, len(order), batch_size)]
+        else:
+            groups = [order]
+
+        requests = 0
+        for group in groups:
+            # temporary ids of the same $batch request are resolved by server
+            available = set(created) | {specs[index].temp_id for index in group if specs[index].temp_id is not None}
+
+            indexes, batch_requests = list(), list()
+            for index in group:
+                error = WorkitemClient._check_dependencies(specs[index], available)
+                if error:
+                    results[index] = BatchItemResult(specs[index], error=error)
+                    continue
+
+                indexes.append(index)
+                batch_requests.append(self._make_batch_request('PATCH', f'{self._WORKITEM_URL}/${specs[index].type_name}', \
+                    query_params, self._make_create_operations(specs[index], created, True), project))
+
+            if not batch_requests:
+                continue
+
+            responses, sent = self._send_batch('create_workitems', batch_requests, batch_size, max_workers)
+            requests += sent
+
+            for index, (status_code, json_item, error) in zip(indexes, responses):
+                workitem = self._read_batch_workitem(json_item, error, expand, validate_only)
+                results[index] = BatchItemResult(specs[index], workitem.id if workitem else None, status_code, workitem, error)
+
+                if workitem and (specs[index].temp_id is not None):
+                    created[specs[index].temp_id] = workitem.id
+
+        return requests
+
+    def _create_concurrently(self, specs: List[WorkitemSpec], waves: List[List[int]], created: Dict[int, int], \
+        results: List[BatchItemResult], project: str, query_params: dict, expand: str, validate_only: bool, \
+        max_workers: int) -> int:
+        '''
+        Creates workitems with one request per workitem wave by wave, workitems of wave are created concurrently.
+        Returns number of HTTP requests
+        '''
+
+        custom_headers = {
+            'Content-Type' : 'application/json-patch+json'
+        }
+
+        def create(index: int) -> BatchItemResult:
+            spec = specs[index]
+            request_url = f'{self.client_connection.project_url}/{self._WORKITEM_URL}/${spec.type_name}' \
+                if not project \
+                else f'{self.client_connection.collection}/{project}/_apis/{self._WORKITEM_URL}/${spec.type_name}'
+
+            try:
+                http_response = self.http_client.post_json(resource=request_url, json_data=self._make_create_operations(spec, created, False), \
+                    query_params=query_params, custom_headers=custom_headers)
+
+                if not http_response:
+                    return BatchItemResult(spec, status_code=getattr(http_response, 'status_code', None), \
+                        error='WorkitemClient::create_workitems: can\'t create workitem')
+
+                workitem = self._read_batch_workitem(self._read_json(http_response), None, expand, validate_only)
+                return BatchItemResult(spec, workitem.id if workitem else None, http_response.status_code, workitem)
+            except HTTPError as ex:
+                status_code = ex.response.status_code if ex.response is not None else None
+                return BatchItemResult(spec, status_code=status_code, error=f'WorkitemClient::create_workitems: EXCEPTION raised. Msg: {ex}')
+            except Exception as ex:
+                return BatchItemResult(spec, error=f'WorkitemClient::create_workitems: EXCEPTION raised. Msg: {ex}')
+
+        requests = 0
+        for wave in waves:
+            indexes = list()
+            for index in wave:
+                error = WorkitemClient._check_dependencies(specs[index], set(created))
+                if error:
+                    results[index] = BatchItemResult(specs[index], error=error)
+                else:
+                    indexes.append(index)
+
+            if max_workers and (max_workers > 1) and (len(indexes) > 1):
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(indexes))) as pool:
+                    wave_results = list(pool.map(create, indexes))
+            else:
+                wave_results = [create(index) for index in indexes]
+
+            requests += len(indexes)
+
+            # temporary ids are resolved after the whole wave, workers only read them
+            for index, result in zip(indexes, wave_results):
+                results[index] = result
+                if result.workitem and (specs[index].temp_id is not None):
+                    created[specs[index].temp_id] = result.workitem.id
+
+        return requests
+
+    def _make_batch_request(self, method: str, request_url: str, query_params: dict, operations: List[dict], \
+        project: str = None) -> dict:
+        '''
+        Returns request of wit/$batch. Uri is relative to collection
+        '''
+
+        project_name = project or self.client_connection.project_name
+        uri = f'/{quote(project_name)}/_apis/{request_url}' if project_name else f'/_apis/{request_url}'
+        query = urlencode({name: value for name, value in query_params.items() if value is not None})
+
+        return {
+            'method': method,
+            'uri': f'{uri}?{query}',
+            'headers': {
+                'Content-Type': 'application/json-patch+json'
+            },
+            'body': operations
+        }
+
+    def _send_batch(self, method_name: str, batch_requests: List[dict], batch_size: int = None, \
+        max_workers: int = None) -> Tuple[List[tuple], int]:
+        '''
+        Sends requests with wit/$batch in chunks, sequentially or concurrently.
+        Returns list of (status code, JSON body, error) in order of requests and number of HTTP requests.
+        Requests of chunk which failed as a whole get status None and error message.
+        '''
+
+        batch_size = min(max(1, batch_size or self._BATCH_MAX_REQUESTS), self._BATCH_MAX_REQUESTS)
+        chunks = [batch_requests[index:index + batch_size] for index in range(0, len(batch_requests), batch_size)]
+
+        request_url = f'{self.client_connection.api_url}{self._BATCH_URL}'
+        query_params = {
+            'api-version' : self.api_version
+        }
+
+        def send_chunk(chunk: List[dict]) -> List[tuple]:
+            try:
+                http_response = self.http_client.post_json(request_url, chunk, query_params=query_params)
+                if not http_response:
+                    raise ClientError(f'WorkitemClient::{method_name}: can\'t get response from TFS server')
+
+                json_items = self._read_json(http_response)
+                values = json_items.get('value') if isinstance(json_items, dict) else None
+                if (values is None) or (len(values) != len(chunk)):
+                    raise ClientError(f'WorkitemClient::{method_name}: response doesn\'t have result of every request')
+
+                return [self._read_batch_response(value) for value in values]
+            except Exception as ex:
+                error = f'WorkitemClient::{method_name}: EXCEPTION raised. Msg: {ex}'
+                return [(None, None, error)] * len(chunk)
+
+        responses = list()
+        if max_workers and (max_workers > 1) and (len(chunks) > 1):
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+                for chunk_responses in pool.map(send_chunk, chunks):
+                    responses += chunk_responses
+        else:
+            for chunk in chunks:
+                responses += send_chunk(chunk)
+
+        return responses, len(chunks)
+
+    def _read_batch_response(self, value: dict) -> tuple:
+        '''
+        Returns (status code, JSON body, error) of one response of wit/$batch. Body is JSON encoded to string
+        '''
+
+        status_code = int(value.get('code') or 0)
+        body = value.get('body')
+
+        try:
+            json_body = self.http_client.json_codec.loads(body) if isinstance(body, (str, bytes)) and body else body
+        except ValueError:
+            json_body = None
+
+        if 200 <= status_code < 300:
+            return status_code, json_body, None
+
+        message = json_body.get('message') if isinstance(json_body, dict) else None
+        return status_code, json_body, message or f'request failed with status code {status_code}'
+
+    def _read_batch_workitem(self, json_item: dict, error: str, expand: str, validate_only: bool) -> Workitem:
+        '''
+        Returns Workitem of succeeded request of wit/$batch and refreshes cache, None for failed request
+        '''
+
+        if (error is not None) or (not isinstance(json_item, dict)) or ('id' not in json_item):
+            return None
+
+        workitem = Workitem.from_json(self, json_item)
+        self._refresh_cache(workitem, expand, validate_only)
+
+        return workitem
+
+    ### END REGION BATCH REQUESTS ###
+
     ### REGION MANAGING RELATIONS ###
 
+    @traced()
     def add_relation(self, source_workitem, destination_workitem, relation_type_name: str, \
         relation_attributes = None, \
         expand: str = 'All', bypass_rules: bool = False, \
@@ -461,13 +1590,17 @@ class WorkitemClient(BaseClient):
             if not response:
                 raise ClientError('TfsWorkitemClient::add_relation: can\'t get response from TFS server')
             
-            json_item = response.json()
-            return Workitem.from_json(self, json_item=json_item)
+            json_item = self._read_json(response)
+            updated_workitem = Workitem.from_json(self, json_item=json_item)
+            self._refresh_cache(updated_workitem, expand, validate_only, [destination_workitem.id])
+
+            return updated_workitem
         except ValueError as ex:
             raise ClientError(f'TfsWorkitemClient::add_relation: response is not json. Msg: {ex}', ex)
         except Exception as ex:
             raise ClientError(f'TfsWorkitemClient::add_relation: EXCEPTION raised. Msg: {ex}', ex)
 
+    @traced()
     def remove_relation(self, workitem: Workitem, relation: WorkitemRelation, \
         expand='All', bypass_rules=False, \
         suppress_notifications=False, validate_only=False) -> Workitem:
@@ -516,8 +1649,11 @@ class WorkitemClient(BaseClient):
             if not http_response:
                 raise ClientError('WorkitemClient::remove_relation: can\'t get response from TFS server')
             
-            json_item = http_response.json()
-            return Workitem.from_json(self, json_item=json_item)
+            json_item = self._read_json(http_response)
+            updated_workitem = Workitem.from_json(self, json_item=json_item)
+            self._refresh_cache(updated_workitem, expand, validate_only, [relation.destination_id])
+
+            return updated_workitem
         except ValueError as ex:
             raise ClientError(f'WorkitemClient::remove_relation: response is not json. Msg: {ex}', ex)
         except Exception as ex:
@@ -525,9 +1661,46 @@ class WorkitemClient(BaseClient):
 
     ### END REGION MANAGING RELATIONS ###
 
+    @traced()
+    def get_deleted_workitem_ids(self) -> List[int]:
+        '''
+        Returns ids of deleted workitems of project (workitems in recycle bin).
+        Docs: https://learn.microsoft.com/en-us/rest/api/azure/devops/wit/recycle-bin/get-deleted-work-item-shallow-references?view=azure-devops-rest-6.0
+
+        Returns:
+            List of ids of deleted workitems: List[int]
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        request_url = f'{self.client_connection.project_url}{self._RECYCLEBIN_URL}'
+        query_params = {
+            'api-version' : self.api_version
+        }
+
+        try:
+            http_response = self.http_client.get(request_url, query_params=query_params)
+
+            if not http_response:
+                raise ClientError('WorkitemClient::get_deleted_workitem_ids: can\'t get response from TFS server')
+
+            json_items = self._read_json(http_response)
+            if 'value' in json_items:
+                return [int(json_item['id']) for json_item in json_items['value']]
+            else:
+                raise ClientError('WorkitemClient::get_deleted_workitem_ids: response doesn\'t have \'value\' attribute')
+        except ValueError as ex:
+            raise ClientError(f'WorkitemClient::get_deleted_workitem_ids: response is not json. Msg: {ex}', ex)
+        except ClientError:
+            raise
+        except Exception as ex:
+            raise ClientError(f'WorkitemClient::get_deleted_workitem_ids: EXCEPTION raised. Msg: {ex}', ex)
+
     ### REGION QUERIES (WIQL) ###
 
     # https://docs.microsoft.com/en-us/rest/api/azure/devops/wit/queries/get?view=azure-devops-rest-6.0
+    @traced()
     def run_saved_query(self, query_id: str) -> WiqlResult:
         '''
         Retrieves an individual query and its children
@@ -563,7 +1736,7 @@ class WorkitemClient(BaseClient):
             if not http_response:
                 raise ClientError('WorkitemClient::run_saved_query: can\'t get response from TFS Server')
             
-            response = http_response.json()
+            response = self._read_json(http_response)
             if 'wiql' in response:
                 return self.run_wiql(str(response['wiql']))
             else:
@@ -574,12 +1747,15 @@ class WorkitemClient(BaseClient):
             raise ClientError(f'WorkitemClient::run_saved_query: EXCEPTION raised. Msg: {ex}', ex)
 
     # https://docs.microsoft.com/en-us/rest/api/azure/devops/wit/wiql/query-by-wiql?view=azure-devops-rest-6.0
-    def run_wiql(self, query: str, max_top: int = -1) -> WiqlResult:
+    @traced()
+    def run_wiql(self, query: str, max_top: int = -1, time_precision: bool = False) -> WiqlResult:
         '''
         Runs WIQL query.
 
         Args:
             query (str): WIQL query
+            max_top (int): max number of returned workitems. Default: -1 (server limit)
+            time_precision (bool): compare dates with time, e.g. [System.ChangedDate] >= '2024-01-01T10:00:00Z'. Default: False
         
         Returns:
             Query result: WiqlResult
@@ -604,8 +1780,12 @@ class WorkitemClient(BaseClient):
             'query' : query
         }
 
+        # server reads $top only from query string
         if max_top > 0:
-            request_body['$top'] = str(max_top)
+            query_params['$top'] = str(max_top)
+
+        if time_precision:
+            query_params['timePrecision'] = 'true'
 
         try:
             http_response = self.http_client.post_json(request_url, request_body, query_params=query_params)
@@ -613,7 +1793,7 @@ class WorkitemClient(BaseClient):
             if not http_response:
                 raise ClientError('WorkitemClient::run_wiql: can\'t get response from TFS Server')
             
-            return WiqlResult.from_json(self, http_response.json())
+            return WiqlResult.from_json(self, self._read_json(http_response))
         except ValueError as ex:
             raise ClientError(f'WorkitemClient::run_wiql: response is not json. Msg: {ex}', ex)    
         except Exception as ex:
@@ -0,0 +1,185 @@
+import threading
+from typing import Dict, List, Tuple
+from concurrent.futures import Future
+from ...models.client_error import ClientError
+from ...models.workitems.tfs_workitem import Workitem
+
+class WorkitemLoaderStats:
+    '''
+    Snapshot of WorkitemLoader counters. Use WorkitemClient::batch_loader.stats.
+    '''
+
+    def __init__(self, loads: int, batches: int, requested_ids: int) -> None:
+        self.__loads = loads
+        self.__batches = batches
+        self.__requested_ids = requested_ids
+
+    @property
+    def loads(self) -> int:
+        '''
+        Returns:
+            Number of load() calls
+        '''
+        return self.__loads
+
+    @property
+    def batches(self) -> int:
+        '''
+        Returns:
+            Number of get_workitems() calls sent by loader
+        '''
+        return self.__batches
+
+    @property
+    def requested_ids(self) -> int:
+        '''
+        Returns:
+            Number of unique ids requested by loader
+        '''
+        return self.__requested_ids
+
+    @property
+    def mean_batch_size(self) -> float:
+        '''
+        Returns:
+            Average number of ids in one batch
+        '''
+        return self.__requested_ids / self.__batches if self.__batches else 0.0
+
+class _PendingBatch:
+    '''
+    Ids with the same requested fields collected during batch window
+    '''
+
+    __slots__ = ('futures', 'full')
+
+    def __init__(self) -> None:
+        self.futures: Dict[int, Future] = dict()
+        self.full = threading.Event()
+
+class WorkitemLoader:
+    '''
+    Micro-batching of single workitem lookups (DataLoader pattern).
+    Ids requested by concurrent load() calls within batch window (or until max_batch_size ids are collected)
+    are read with one WorkitemClient::get_workitems() call and returned to every waiting caller.
+    Use WorkitemClient::enable_batch_loader().
+    '''
+
+    def __init__(self, workitem_client, max_batch_size: int = 200, batch_window: float = 0.005) -> None:
+        '''
+        WorkitemLoader constructor.
+
+        Args:
+            workitem_client (WorkitemClient): client used to read batches
+            max_batch_size (int): max number of ids in one batch. Default: 200
+            batch_window (float): time in seconds the first caller waits for other ids. Default: 0.005
+        '''
+
+        if not workitem_client:
+            raise ClientError('WorkitemLoader: workitem_client can\'t be None')
+
+        self.__client = workitem_client
+        self.__max_batch_size = max(1, max_batch_size)
+        self.__batch_window = max(0.0, batch_window)
+
+        self.__lock = threading.Lock()
+        self.__pending: Dict[Tuple[str], _PendingBatch] = dict()
+
+        self.__loads = 0
+        self.__batches = 0
+        self.__requested_ids = 0
+
+    @property
+    def max_batch_size(self) -> int:
+        return self.__max_batch_size
+
+    @property
+    def batch_window(self) -> float:
+        return self.__batch_window
+
+    @property
+    def stats(self) -> WorkitemLoaderStats:
+        '''
+        Returns:
+            Snapshot of loader counters: WorkitemLoaderStats
+        '''
+
+        with self.__lock:
+            return WorkitemLoaderStats(self.__loads, self.__batches, self.__requested_ids)
+
+    def load(self, item_id, item_fields: List[str] = None) -> Workitem:
+        '''
+        Returns workitem read in batch with ids requested by other threads at the same time.
+
+        Args:
+            item_id (int | str): workitem id
+            item_fields (List[str]): list of requested fields of workitem. Default: all fields
+
+        Returns:
+            Workitem instance
+
+        Raises:
+            ClientError if workitem can't be read
+        '''
+
+        item_id = int(item_id)
+        fields_key = tuple(item_fields) if item_fields else ()
+
+        with self.__lock:
+            self.__loads += 1
+
+            pending = self.__pending.get(fields_key)
+            # the first caller of batch waits for batch window and sends batch
+            leader = pending is None
+            if leader:
+                pending = _PendingBatch()
+                self.__pending[fields_key] = pending
+
+            future = pending.futures.get(item_id)
+            if future is None:
+                future = Future()
+                pending.futures[item_id] = future
+
+            # full batch is closed, next ids go to new batch
+            if len(pending.futures) >= self.__max_batch_size:
+                del self.__pending[fields_key]
+                pending.full.set()
+
+        if leader:
+            pending.full.wait(self.__batch_window)
+
+            with self.__lock:
+                if self.__pending.get(fields_key) is pending:
+                    del self.__pending[fields_key]
+
+                self.__batches += 1
+                self.__requested_ids += len(pending.futures)
+
+            self.__dispatch(pending, item_fields)
+
+        # every caller gets its own Workitem instance, so edits of one caller don't leak to others
+        return Workitem.from_json(self.__client, json_item=future.result().raw)
+
+    def __dispatch(self, pending: _PendingBatch, item_fields: List[str]) -> None:
+        '''
+        Reads batch of workitems and sets results of waiting callers
+        '''
+
+        item_ids = list(pending.futures.keys())
+
+        try:
+            # missing ids fail only their callers
+            workitems = self.__client.get_workitems(item_ids, item_fields=item_fields, \
+                batch_size=self.__max_batch_size, error_policy='Omit')
+        except Exception as ex:
+            error = ex if isinstance(ex, ClientError) else ClientError(f'WorkitemLoader::load: EXCEPTION raised. Msg: {ex}', ex)
+            for future in pending.futures.values():
+                future.set_exception(error)
+            return
+
+        found = {workitem.id: workitem for workitem in workitems}
+        for item_id, future in pending.futures.items():
+            if item_id in found:
+                future.set_result(found[item_id])
+            else:
+                future.set_exception(ClientError(f'WorkitemLoader::load: workitem {item_id} can\'t be read'))
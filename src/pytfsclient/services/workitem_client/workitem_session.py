@@ -0,0 +1,126 @@
+from typing import Dict, List
+from ...models.client_error import ClientError
+from ...models.workitems.tfs_workitem import Workitem
+from ...models.workitems.tfs_batch_result import BatchResult
+
+class WorkitemSession:
+    '''
+    Unit of work of WorkitemClient: workitems edited while session is active (workitem[field] = value,
+    title, description) are tracked and written with as few wit/$batch requests as possible on flush()
+    or on exit of session. Responses are applied back to tracked workitem instances.
+    Use WorkitemClient::session().
+
+    Usage:
+        with workitem_client.session():
+            for workitem in workitem_client.get_workitems(item_ids):
+                workitem['System.State'] = 'Closed'
+    '''
+
+    def __init__(self, workitem_client, expand: str = 'Fields', bypass_rules: bool = False, \
+        suppress_notifications: bool = False, batch_size: int = None, max_workers: int = None) -> None:
+        '''
+        WorkitemSession constructor.
+
+        Args:
+            workitem_client (WorkitemClient): client of session
+            expand (str): The expand parameters of responses applied to workitems. None - no relations and links. Default: Fields
+            bypass_rules (bool): Do not enforce the work item type rules on this update. Default: False
+            suppress_notifications (bool): Do not fire any notifications for this change. Default: False
+            batch_size (int): max number of updates of one request. Default: None (200)
+            max_workers (int): max number of concurrent requests. Default: None (sequential)
+        '''
+
+        if not workitem_client:
+            raise ClientError('WorkitemSession: workitem_client can\'t be None')
+
+        self.__client = workitem_client
+        self.__expand = expand
+        self.__bypass_rules = bypass_rules
+        self.__suppress_notifications = suppress_notifications
+        self.__batch_size = batch_size
+        self.__max_workers = max_workers
+
+        # tracked instances by id(), several instances can be of the same workitem
+        self.__tracked: Dict[int, Workitem] = dict()
+        self.__previous = None
+
+    @property
+    def dirty(self) -> List[Workitem]:
+        '''
+        Returns:
+            Tracked workitems with edited fields which are not updated on server yet
+        '''
+
+        return [workitem for workitem in self.__tracked.values() if workitem.is_dirty]
+
+    def add(self, workitem: Workitem) -> None:
+        '''
+        Tracks workitem edited before session was started
+        '''
+
+        if not isinstance(workitem, Workitem):
+            raise ClientError('WorkitemSession::add: workitem should be instance of Workitem')
+
+        self.__tracked[id(workitem)] = workitem
+
+    def flush(self) -> BatchResult:
+        '''
+        Writes edited fields of all dirty workitems with wit/$batch.
+        Failed workitems keep their edits and are written again by the next flush().
+        Edits of several instances of the same workitem are merged into one update.
+
+        Returns:
+            Results of updates: BatchResult
+
+        Raises:
+            ClientError if instances of the same workitem have different values of the same field, nothing is written
+        '''
+
+        dirty = self.dirty
+        if not dirty:
+            return BatchResult([], 0)
+
+        instances: Dict[int, List[Workitem]] = dict()
+        updates: Dict[int, Dict[str, str]] = dict()
+        conflicts: List[str] = list()
+        for workitem in dirty:
+            instances.setdefault(workitem.id, []).append(workitem)
+            item_updates = updates.setdefault(workitem.id, {})
+
+            for fld_name, fld_value in workitem.updated_fields.items():
+                if (fld_name in item_updates) and (item_updates[fld_name] != fld_value):
+                    conflicts.append(f'{workitem.id}: {fld_name}')
+                item_updates[fld_name] = fld_value
+
+        # value of one instance would be written and value of other one would stay dirty
+        if conflicts:
+            raise ClientError(f'WorkitemSession::flush: instances of the same workitem have different values of fields. {", ".join(conflicts)}')
+
+        result = self.__client.update_workitems_batch(updates, expand=self.__expand, bypass_rules=self.__bypass_rules, \
+            suppress_notifications=self.__suppress_notifications, batch_size=self.__batch_size, max_workers=self.__max_workers)
+
+        for item_result in result:
+            if not item_result.is_success:
+                continue
+
+            for workitem in instances[item_result.item_id]:
+                workitem._apply_update(item_result.workitem, item_result.request)
+
+        return result
+
+    def __enter__(self) -> 'WorkitemSession':
+        self.__previous = self.__client._set_session(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.__client._set_session(self.__previous)
+        self.__previous = None
+
+        # edits are kept on instances if session body failed
+        if exc_type is not None:
+            return
+
+        result = self.flush()
+        if not result.is_success:
+            failed = ', '.join(f'{item.item_id}: {item.error}' for item in result.failed)
+            raise ClientError(f'WorkitemSession: can\'t update workitems. {failed}')
@@ -0,0 +1,293 @@
+import os
+import time
+import sqlite3
+import threading
+from typing import Dict, List, Tuple
+from ..http.json_codec import JsonCodec, get_json_codec
+
+class WorkitemStoreStats:
+    '''
+    Snapshot of WorkitemStore counters of current process. Use WorkitemClient::store.stats.
+    '''
+
+    def __init__(self, hits: int, misses: int, stale: int, writes: int) -> None:
+        self.__hits = hits
+        self.__misses = misses
+        self.__stale = stale
+        self.__writes = writes
+
+    @property
+    def hits(self) -> int:
+        '''
+        Returns:
+            Number of workitems served from store (revision didn't change)
+        '''
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        '''
+        Returns:
+            Number of requested workitems which were not in store
+        '''
+        return self.__misses
+
+    @property
+    def stale(self) -> int:
+        '''
+        Returns:
+            Number of stored workitems which revision changed on server
+        '''
+        return self.__stale
+
+    @property
+    def writes(self) -> int:
+        '''
+        Returns:
+            Number of workitems written to store
+        '''
+        return self.__writes
+
+    @property
+    def hit_ratio(self) -> float:
+        '''
+        Returns:
+            Share of workitems served from store
+        '''
+        total = self.__hits + self.__misses + self.__stale
+        return self.__hits / total if total else 0.0
+
+class WorkitemStore:
+    '''
+    Persistent single-file store of workitem JSON objects (SQLite in WAL mode).
+    Keeps the latest known revision of every workitem for requested fields and expand parameter.
+    Several threads and processes can share one store file. Use WorkitemClient::attach_store().
+    '''
+
+    # SQLite limits number of host parameters of one statement
+    _MAX_PARAMS = 500
+
+    _SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS workitems (
+            id INTEGER NOT NULL,
+            fields_key TEXT NOT NULL,
+            expand TEXT NOT NULL,
+            rev INTEGER NOT NULL,
+            json TEXT NOT NULL,
+            stored_at REAL NOT NULL,
+            PRIMARY KEY (id, fields_key, expand)
+        ) WITHOUT ROWID
+    '''
+
+    _STATE_SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS store_state (
+            name TEXT NOT NULL PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+    '''
+
+    def __init__(self, path: str, timeout: float = 30.0, json_codec: JsonCodec = None) -> None:
+        '''
+        WorkitemStore constructor. Creates store file if it doesn't exist.
+
+        Args:
+            path (str): path of SQLite file
+            timeout (float): time in seconds to wait for lock of other process. Default: 30.0
+            json_codec (JsonCodec): codec of stored json. Default: None (fastest installed)
+        '''
+
+        self.__path = path
+        self.__timeout = timeout
+        self.__json_codec = json_codec or get_json_codec()
+
+        # sqlite connection can't be shared between threads, every thread opens its own
+        self.__local = threading.local()
+        self.__connections: List[sqlite3.Connection] = list()
+        self.__lock = threading.Lock()
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__stale = 0
+        self.__writes = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        connection = self.__connection()
+        with connection:
+            connection.execute(self._SCHEMA)
+            connection.execute(self._STATE_SCHEMA)
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def stats(self) -> WorkitemStoreStats:
+        '''
+        Returns:
+            Snapshot of store counters of current process: WorkitemStoreStats
+        '''
+
+        with self.__lock:
+            return WorkitemStoreStats(self.__hits, self.__misses, self.__stale, self.__writes)
+
+    @staticmethod
+    def make_key(item_fields: List[str] = None, expand: str = None) -> Tuple[str, str]:
+        '''
+        Returns (fields_key, expand) columns of stored workitem
+        '''
+
+        fields_key = ','.join(sorted(item_fields)) if item_fields else ''
+        return (fields_key, str(expand).lower() if expand else '')
+
+    def get(self, item_ids: List[int], item_fields: List[str] = None, expand: str = None) -> Dict[int, Tuple[int, dict]]:
+        '''
+        Returns stored workitems: dictonary { id: (revision, JSON object) }
+        '''
+
+        fields_key, expand_key = WorkitemStore.make_key(item_fields, expand)
+        connection = self.__connection()
+
+        stored = dict()
+        for chunk in WorkitemStore.__chunks(item_ids):
+            rows = connection.execute(
+                f'SELECT id, rev, json FROM workitems WHERE fields_key = ? AND expand = ? AND id IN ({",".join("?" * len(chunk))})',
+                (fields_key, expand_key, *chunk))
+
+            for item_id, revision, json_text in rows:
+                stored[item_id] = (revision, self.__json_codec.loads(json_text))
+
+        return stored
+
+    def put(self, json_items: List[dict], item_fields: List[str] = None, expand: str = None) -> None:
+        '''
+        Stores JSON objects of workitems. Workitem isn't replaced by older revision written by other process
+        '''
+
+        if not json_items:
+            return
+
+        fields_key, expand_key = WorkitemStore.make_key(item_fields, expand)
+        stored_at = time.time()
+
+        rows = list()
+        for json_item in json_items:
+            json_text = self.__json_codec.dumps(json_item)
+            if isinstance(json_text, bytes):
+                json_text = json_text.decode('utf-8')
+
+            rows.append((int(json_item['id']), fields_key, expand_key, WorkitemStore._get_revision(json_item), json_text, stored_at))
+
+        connection = self.__connection()
+        with connection:
+            connection.executemany('''
+                INSERT INTO workitems (id, fields_key, expand, rev, json, stored_at) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id, fields_key, expand) DO UPDATE SET rev = excluded.rev, json = excluded.json, stored_at = excluded.stored_at
+                WHERE excluded.rev >= workitems.rev
+            ''', rows)
+
+        with self.__lock:
+            self.__writes += len(rows)
+
+    def delete(self, item_ids: List[int]) -> int:
+        '''
+        Removes all stored versions of given workitems and returns number of removed workitems
+        '''
+
+        removed = 0
+        connection = self.__connection()
+        with connection:
+            for chunk in WorkitemStore.__chunks(item_ids):
+                removed += connection.execute(f'SELECT COUNT(DISTINCT id) FROM workitems WHERE id IN ({",".join("?" * len(chunk))})', \
+                    tuple(chunk)).fetchone()[0]
+                connection.execute(f'DELETE FROM workitems WHERE id IN ({",".join("?" * len(chunk))})', tuple(chunk))
+
+        return removed
+
+    def get_state(self, name: str) -> str:
+        '''
+        Returns stored value of named state (e.g. sync watermark) or None
+        '''
+
+        row = self.__connection().execute('SELECT value FROM store_state WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, name: str, value: str) -> None:
+        '''
+        Stores value of named state. None removes state
+        '''
+
+        connection = self.__connection()
+        with connection:
+            if value is None:
+                connection.execute('DELETE FROM store_state WHERE name = ?', (name,))
+            else:
+                connection.execute('INSERT OR REPLACE INTO store_state (name, value) VALUES (?, ?)', (name, str(value)))
+
+    def clear(self) -> None:
+        connection = self.__connection()
+        with connection:
+            connection.execute('DELETE FROM workitems')
+
+    def count(self) -> int:
+        '''
+        Returns:
+            Number of stored workitems (all fields and expand variants)
+        '''
+
+        return self.__connection().execute('SELECT COUNT(*) FROM workitems').fetchone()[0]
+
+    def close(self) -> None:
+        '''
+        Closes connections of all threads
+        '''
+
+        with self.__lock:
+            connections, self.__connections = self.__connections, list()
+
+        for connection in connections:
+            connection.close()
+
+        self.__local = threading.local()
+
+    def __enter__(self) -> 'WorkitemStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _record(self, hits: int, misses: int, stale: int) -> None:
+        with self.__lock:
+            self.__hits += hits
+            self.__misses += misses
+            self.__stale += stale
+
+    def __connection(self) -> sqlite3.Connection:
+        connection = getattr(self.__local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.__path, timeout=self.__timeout, check_same_thread=False)
+            # readers don't block writer of other process and vice versa
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+
+            self.__local.connection = connection
+            with self.__lock:
+                self.__connections.append(connection)
+
+        return connection
+
+    @staticmethod
+    def __chunks(item_ids: List[int]):
+        item_ids = [int(item_id) for item_id in item_ids]
+        for index in range(0, len(item_ids), WorkitemStore._MAX_PARAMS):
+            yield item_ids[index:index + WorkitemStore._MAX_PARAMS]
+
+    @staticmethod
+    def _get_revision(json_item: dict) -> int:
+        revision = json_item.get('rev')
+        if revision is None:
+            revision = (json_item.get('fields') or {}).get('System.Rev')
+
+        return int(revision) if revision is not None else 0
@@ -0,0 +1,221 @@
+import time
+from datetime import datetime, timedelta
+from typing import List, Tuple
+from ...models.client_error import ClientError
+from .workitem_store import WorkitemStore
+
+class SyncResult:
+    '''
+    Result of one WorkitemSync::run()
+    '''
+
+    def __init__(self, changed: int, deleted: int, queries: int, watermark: str, elapsed: float) -> None:
+        self.__changed = changed
+        self.__deleted = deleted
+        self.__queries = queries
+        self.__watermark = watermark
+        self.__elapsed = elapsed
+
+    @property
+    def changed(self) -> int:
+        '''
+        Returns:
+            Number of changed (and new) workitems written to store
+        '''
+        return self.__changed
+
+    @property
+    def deleted(self) -> int:
+        '''
+        Returns:
+            Number of deleted workitems removed from store
+        '''
+        return self.__deleted
+
+    @property
+    def queries(self) -> int:
+        '''
+        Returns:
+            Number of WIQL queries (more than one if time window was split because of WIQL size limit)
+        '''
+        return self.__queries
+
+    @property
+    def watermark(self) -> str:
+        '''
+        Returns:
+            Max System.ChangedDate of synchronized workitems, start of the next run
+        '''
+        return self.__watermark
+
+    @property
+    def elapsed(self) -> float:
+        '''
+        Returns:
+            Duration of run in seconds
+        '''
+        return self.__elapsed
+
+class WorkitemSync:
+    '''
+    Incremental synchronization of workitems of project to WorkitemStore.
+    Every run queries ids of workitems with System.ChangedDate after watermark of previous run, downloads
+    only them and removes workitems found in recycle bin. Watermark is kept in the store.
+    Time window is split in halves while WIQL result reaches max_results (20000 is the server limit).
+    '''
+
+    _CHANGED_DATE_FIELD = 'System.ChangedDate'
+    _DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+    _EPOCH = datetime(1900, 1, 1)
+    # window can't be split below one second
+    _MIN_WINDOW = timedelta(seconds=1)
+
+    _QUERY = 'SELECT [System.Id] FROM workitems WHERE [System.TeamProject] = @project ' \
+        'AND [System.ChangedDate] >= \'{start}\' AND [System.ChangedDate] < \'{end}\' ORDER BY [System.ChangedDate]'
+
+    def __init__(self, workitem_client, store: WorkitemStore = None, item_fields: List[str] = None, expand: str = 'All', \
+        max_results: int = 20000, overlap: float = 60.0, state_name: str = None) -> None:
+        '''
+        WorkitemSync constructor.
+
+        Args:
+            workitem_client (WorkitemClient): client of synchronized project
+            store (WorkitemStore | str): store or path of SQLite file. Default: None (store attached to client)
+            item_fields (List[str]): stored fields (System.ChangedDate is added), None - all fields. Default: None
+            expand (str): expand parameter of stored workitems. Default: 'All'
+            max_results (int): max number of ids of one WIQL query. Default: 20000
+            overlap (float): time in seconds before watermark read again, catches workitems saved
+                with earlier System.ChangedDate during previous run. Default: 60.0
+            state_name (str): name of watermark in store. Default: None (sync.<project>.<fields>.<expand>)
+        '''
+
+        if not workitem_client:
+            raise ClientError('WorkitemSync: workitem_client can\'t be None')
+
+        store = store or workitem_client.store
+        if not store:
+            raise ClientError('WorkitemSync: store can\'t be None, attach store to client or pass it')
+
+        self.__workitem_client = workitem_client
+        self.__store = store if isinstance(store, WorkitemStore) else WorkitemStore(store)
+        # watermark is taken from System.ChangedDate of synchronized workitems
+        if item_fields and (WorkitemSync._CHANGED_DATE_FIELD not in item_fields):
+            item_fields = list(item_fields) + [WorkitemSync._CHANGED_DATE_FIELD]
+        self.__item_fields = item_fields
+        self.__expand = expand
+        self.__max_results = max(1, max_results)
+        self.__overlap = timedelta(seconds=max(0.0, overlap))
+
+        if not state_name:
+            fields_key, expand_key = WorkitemStore.make_key(item_fields, expand)
+            state_name = f'sync.{workitem_client.client_connection.project_name}.{fields_key}.{expand_key}'
+        self.__state_name = state_name
+
+    @property
+    def store(self) -> WorkitemStore:
+        return self.__store
+
+    @property
+    def watermark(self) -> str:
+        '''
+        Returns:
+            Watermark of the last run or None if project wasn't synchronized
+        '''
+        return self.__store.get_state(self.__state_name)
+
+    def reset(self) -> None:
+        '''
+        Removes watermark, the next run downloads all workitems of project
+        '''
+        self.__store.set_state(self.__state_name, None)
+
+    def run(self) -> SyncResult:
+        '''
+        Synchronizes store with project.
+
+        Returns:
+            Result of synchronization: SyncResult
+
+        Raises:
+            ClientError with information about exception
+        '''
+
+        started = time.perf_counter()
+
+        watermark = self.watermark
+        start = WorkitemSync._parse_date(watermark) - self.__overlap if watermark else WorkitemSync._EPOCH
+        # end is set ahead to catch workitems saved during run, their dates are checked by the next run anyway
+        end = datetime.utcnow() + timedelta(days=1)
+
+        changed, queries, max_changed = 0, 0, None
+        windows: List[Tuple[datetime, datetime]] = [(start, end)]
+
+        while windows:
+            window_start, window_end = windows.pop()
+
+            item_ids = self.__query(window_start, window_end)
+            queries += 1
+
+            if len(item_ids) >= self.__max_results:
+                if window_end - window_start <= WorkitemSync._MIN_WINDOW:
+                    raise ClientError(f'WorkitemSync::run: more than {self.__max_results} workitems changed ' \
+                        f'from {WorkitemSync._format_date(window_start)} to {WorkitemSync._format_date(window_end)}')
+
+                middle = window_start + (window_end - window_start) / 2
+                # older half is synchronized first
+                windows.append((middle, window_end))
+                windows.append((window_start, middle))
+                continue
+
+            if not item_ids:
+                continue
+
+            # changed workitems are read from server directly, revision check of attached store would be wasted
+            workitems = self.__workitem_client.read_workitems(item_ids, self.__item_fields, self.__expand, error_policy='Omit')
+            self.__store.put([workitem.raw for workitem in workitems], self.__item_fields, self.__expand)
+            changed += len(workitems)
+
+            for workitem in workitems:
+                changed_date = WorkitemSync.__get_changed_date(workitem.raw)
+                if (changed_date is not None) and ((max_changed is None) or (changed_date > max_changed)):
+                    max_changed = changed_date
+
+        deleted_ids = self.__workitem_client.get_deleted_workitem_ids()
+        deleted = self.__store.delete(deleted_ids) if deleted_ids else 0
+
+        if max_changed is not None:
+            new_watermark = WorkitemSync._format_date(max_changed)
+            # watermark never goes back, e.g. if overlap returned only older workitems
+            if (watermark is None) or (max_changed > WorkitemSync._parse_date(watermark)):
+                self.__store.set_state(self.__state_name, new_watermark)
+                watermark = new_watermark
+
+        return SyncResult(changed, deleted, queries, watermark, time.perf_counter() - started)
+
+    def __query(self, start: datetime, end: datetime) -> List[int]:
+        query = WorkitemSync._QUERY.format(start=WorkitemSync._format_date(start), end=WorkitemSync._format_date(end))
+        return self.__workitem_client.run_wiql(query, max_top=self.__max_results, time_precision=True).item_ids
+
+    @staticmethod
+    def __get_changed_date(json_item: dict) -> datetime:
+        changed_date = (json_item.get('fields') or {}).get(WorkitemSync._CHANGED_DATE_FIELD)
+        return WorkitemSync._parse_date(changed_date) if changed_date else None
+
+    @staticmethod
+    def _format_date(value: datetime) -> str:
+        return value.strftime(WorkitemSync._DATE_FORMAT)
+
+    @staticmethod
+    def _parse_date(text: str) -> datetime:
+        '''
+        Parses date of TFS/Azure DevOps, e.g. 2024-01-01T10:00:00.123Z or 2024-01-01T10:00:00Z
+        '''
+
+        text = text.rstrip('Z')
+        if '.' in text:
+            # server returns up to 7 digits of fraction
+            text, fraction = text.split('.', 1)
+            text = f'{text}.{fraction[:6]}'
+            return datetime.strptime(text, '%Y-%m-%dT%H:%M:%S.%f')
+
+        return datetime.strptime(text, '%Y-%m-%dT%H:%M:%S')
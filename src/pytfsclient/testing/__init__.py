@@ -0,0 +1,2 @@
+from .synthetic import SyntheticDataset, RevisionConflictError
+from .server import FakeAzureDevOpsServer, FakeServerStats
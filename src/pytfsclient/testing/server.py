@@ -0,0 +1,821 @@
+import re
+import json
+import base64
+import time
+import hashlib
+import threading
+from datetime import datetime
+from typing import Dict
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from ..services.http.metrics import endpoint_template
+from .synthetic import SyntheticDataset, RevisionConflictError
+
+class FakeServerStats:
+    '''
+    Snapshot of FakeAzureDevOpsServer counters
+    '''
+
+    def __init__(self, requests: int, throttled: int, not_modified: int, endpoints: Dict[str, int], \
+        max_concurrent: int, notifications: int = 0) -> None:
+        self.__requests = requests
+        self.__throttled = throttled
+        self.__not_modified = not_modified
+        self.__endpoints = endpoints
+        self.__max_concurrent = max_concurrent
+        self.__notifications = notifications
+
+    @property
+    def requests(self) -> int:
+        '''
+        Returns:
+            Number of received requests
+        '''
+        return self.__requests
+
+    @property
+    def throttled(self) -> int:
+        '''
+        Returns:
+            Number of requests answered with 429 Too Many Requests
+        '''
+        return self.__throttled
+
+    @property
+    def not_modified(self) -> int:
+        '''
+        Returns:
+            Number of requests answered with 304 Not Modified
+        '''
+        return self.__not_modified
+
+    @property
+    def endpoints(self) -> Dict[str, int]:
+        '''
+        Returns:
+            Number of requests by method and templated endpoint, e.g. "GET wit/workitems"
+        '''
+        return dict(self.__endpoints)
+
+    @property
+    def max_concurrent(self) -> int:
+        '''
+        Returns:
+            Max number of requests processed at the same time
+        '''
+        return self.__max_concurrent
+
+    @property
+    def notifications(self) -> int:
+        '''
+        Returns:
+            Number of workitem creates and updates sent without suppressNotifications=true
+        '''
+        return self.__notifications
+
+class _HttpError(Exception):
+    '''
+    Error answered to client with status code and message
+    '''
+
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+class _WiqlFilter:
+    '''
+    WHERE clause of flat WIQL query: conditions "[Field] op value" joined by AND.
+    Values are quoted strings and dates, numbers and @project.
+    '''
+
+    _WHERE = re.compile(r'\bwhere\b(?P<where>.*?)(\border\s+by\b|\basof\b|$)', re.IGNORECASE | re.DOTALL)
+    _AND = re.compile(r'\s+and\s+', re.IGNORECASE)
+    _CONDITION = re.compile(r'^\(?\s*\[(?P<field>[^\]]+)\]\s*(?P<op><>|>=|<=|=|>|<)\s*(?P<value>.+?)\s*\)?$')
+    _DATE = re.compile(r'^\d{4}-\d{2}-\d{2}(?P<time>[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?Z?)?$')
+
+    _OPERATORS = {
+        '=': lambda left, right: left == right,
+        '<>': lambda left, right: left != right,
+        '>': lambda left, right: left > right,
+        '>=': lambda left, right: left >= right,
+        '<': lambda left, right: left < right,
+        '<=': lambda left, right: left <= right,
+    }
+
+    @staticmethod
+    def parse(query: str, project: str, time_precision: bool) -> list:
+        '''
+        Returns list of (field, operator, value, is_date) or raises _HttpError for unsupported query
+        '''
+
+        match = _WiqlFilter._WHERE.search(query)
+        if not match:
+            return []
+
+        conditions = list()
+        for text in _WiqlFilter._AND.split(match.group('where').strip()):
+            condition = _WiqlFilter._CONDITION.match(text.strip())
+            if not condition:
+                raise _HttpError(400, f'Unsupported WIQL condition: {text}')
+
+            value = condition.group('value')
+            is_date = False
+
+            if value.lower() == '@project':
+                value = project
+            elif value[:1] in ('\'', '"'):
+                value = value[1:-1]
+
+                date = _WiqlFilter._DATE.match(value)
+                if date:
+                    if date.group('time') and not time_precision:
+                        raise _HttpError(400, 'VS402625: Dates must be specified without time when timePrecision is false.')
+
+                    value = _WiqlFilter._parse_date(value)
+                    is_date = True
+            else:
+                try:
+                    value = int(value)
+                except ValueError:
+                    raise _HttpError(400, f'Unsupported WIQL value: {value}')
+
+            conditions.append((condition.group('field'), condition.group('op'), value, is_date, time_precision))
+
+        return conditions
+
+    @staticmethod
+    def match(conditions: list, fields: dict) -> bool:
+        for field, op, value, is_date, time_precision in conditions:
+            actual = fields.get(field)
+            if actual is None:
+                return False
+
+            if is_date:
+                actual = _WiqlFilter._parse_date(actual)
+                if not time_precision:
+                    actual, value = actual.date(), value.date()
+            elif isinstance(value, str):
+                actual, value = str(actual).lower(), value.lower()
+
+            if not _WiqlFilter._OPERATORS[op](actual, value):
+                return False
+
+        return True
+
+    @staticmethod
+    def _parse_date(text: str) -> datetime:
+        text = text.rstrip('Z').replace(' ', 'T')
+        for date_format in ('%Y-%m-%dT%H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M', '%Y-%m-%d'):
+            try:
+                return datetime.strptime(text, date_format)
+            except ValueError:
+                continue
+
+        raise _HttpError(400, f'Invalid date {text}')
+
+class FakeAzureDevOpsServer:
+    '''
+    In-process HTTP server which emulates TFS/Azure DevOps endpoints used by the library over SyntheticDataset:
+    projects, teams, team members, boards, _api/_identity, wit/workitems, wit/workitemsbatch, updates,
+    wit/$batch, wit/wiql, wit/queries, wit/recyclebin, wit/reporting/workitemrevisions and wit/reporting/workitemlinks.
+    Supports latency, throttling, page sizes and ETags.
+
+    Usage:
+        with FakeAzureDevOpsServer(SyntheticDataset(workitem_count=100000)) as server:
+            client_connection = ClientFactory.create_pat('token', server.url, 'DefaultCollection/Project0')
+    '''
+
+    COLLECTION = 'DefaultCollection'
+
+    # Max number of ids of workitems requests like in Azure DevOps
+    _MAX_IDS = 200
+    # Max number of requests of wit/$batch
+    _MAX_BATCH_REQUESTS = 200
+
+    def __init__(self, dataset: SyntheticDataset = None, host: str = '127.0.0.1', port: int = 0, \
+        latency: float = 0.0, latency_per_item: float = 0.0, page_size: int = 100, updates_page_size: int = 200, \
+        throttle_every: int = 0, retry_after: float = 1.0, rate_limit_headers: bool = False, \
+        etag: bool = True, batch_supported: bool = True, wiql_max_results: int = 20000) -> None:
+        '''
+        FakeAzureDevOpsServer constructor.
+
+        Args:
+            dataset (SyntheticDataset): served data. Default: None (SyntheticDataset())
+            host (str): host to listen. Default: 127.0.0.1
+            port (int): port to listen. Default: 0 (free port)
+            latency (float): delay of every response in seconds. Default: 0.0
+            latency_per_item (float): additional delay per returned item in seconds. Default: 0.0
+            page_size (int): page size of projects, teams and team members. Default: 100
+            updates_page_size (int): page size of workitem updates. Default: 200
+            throttle_every (int): answer every N-th request with 429 Too Many Requests. Default: 0 (disabled)
+            retry_after (float): Retry-After of throttled responses in seconds. Default: 1.0
+            rate_limit_headers (bool): send X-RateLimit-* headers with every response. Default: False
+            etag (bool): send ETag and answer 304 Not Modified for If-None-Match. Default: True
+            batch_supported (bool): serve POST wit/workitemsbatch, otherwise answer 404. Default: True
+            wiql_max_results (int): max number of wiql results, larger results without $top are rejected. Default: 20000
+        '''
+
+        self.dataset = dataset or SyntheticDataset()
+        self.latency = latency
+        self.latency_per_item = latency_per_item
+        self.page_size = max(1, page_size)
+        self.updates_page_size = max(1, updates_page_size)
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.rate_limit_headers = rate_limit_headers
+        self.etag = etag
+        self.batch_supported = batch_supported
+        self.wiql_max_results = wiql_max_results
+
+        self.__lock = threading.Lock()
+        self.__requests = 0
+        self.__throttled = 0
+        self.__not_modified = 0
+        self.__concurrent = 0
+        self.__max_concurrent = 0
+        self.__notifications = 0
+        self.__endpoints: Dict[str, int] = dict()
+
+        server = self
+
+        class _Handler(_FakeRequestHandler):
+            fake_server = server
+
+        self.__httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.__httpd.daemon_threads = True
+        self.__thread: threading.Thread = None
+
+    ### PROPERTIES REGION ###
+
+    @property
+    def url(self) -> str:
+        '''
+        Returns:
+            Server url, use it as server_url of ClientFactory
+        '''
+
+        host, port = self.__httpd.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    @property
+    def collection_url(self) -> str:
+        return f'{self.url}{self.COLLECTION}/'
+
+    @property
+    def stats(self) -> FakeServerStats:
+        '''
+        Returns:
+            Snapshot of server counters: FakeServerStats
+        '''
+
+        with self.__lock:
+            return FakeServerStats(self.__requests, self.__throttled, self.__not_modified, \
+                dict(self.__endpoints), self.__max_concurrent, self.__notifications)
+
+    ### END OF PROPERTIES REGION ###
+
+    def start(self) -> 'FakeAzureDevOpsServer':
+        '''
+        Starts serving requests in background thread
+        '''
+
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__httpd.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+            self.__thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        '''
+        Stops server and closes socket
+        '''
+
+        if self.__thread is not None:
+            self.__httpd.shutdown()
+            self.__thread.join()
+            self.__thread = None
+
+        self.__httpd.server_close()
+
+    def reset_stats(self) -> None:
+        with self.__lock:
+            self.__requests = 0
+            self.__throttled = 0
+            self.__not_modified = 0
+            self.__max_concurrent = 0
+            self.__notifications = 0
+            self.__endpoints.clear()
+
+    def __enter__(self) -> 'FakeAzureDevOpsServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    ### REQUEST ACCOUNTING REGION ###
+
+    def _begin_request(self, method: str, path: str) -> bool:
+        '''
+        Counts request and returns True if request should be throttled
+        '''
+
+        with self.__lock:
+            self.__requests += 1
+            self.__concurrent += 1
+            self.__max_concurrent = max(self.__max_concurrent, self.__concurrent)
+
+            key = f'{method} {endpoint_template(path)}'
+            self.__endpoints[key] = self.__endpoints.get(key, 0) + 1
+
+            throttle = (self.throttle_every > 0) and (self.__requests % self.throttle_every == 0)
+            if throttle:
+                self.__throttled += 1
+
+            return throttle
+
+    def _end_request(self) -> None:
+        with self.__lock:
+            self.__concurrent -= 1
+
+    def _count_not_modified(self) -> None:
+        # counted before response is sent, so client sees it in stats right after response
+        with self.__lock:
+            self.__not_modified += 1
+
+    def _count_notification(self) -> None:
+        with self.__lock:
+            self.__notifications += 1
+
+    ### END OF REQUEST ACCOUNTING REGION ###
+
+class _FakeRequestHandler(BaseHTTPRequestHandler):
+    '''
+    Routes requests of FakeAzureDevOpsServer. Path prefix before _apis/_api is collection, project and team.
+    '''
+
+    protocol_version = 'HTTP/1.1'
+    # headers and body are written separately, Nagle's algorithm would delay every small response
+    disable_nagle_algorithm = True
+    fake_server: FakeAzureDevOpsServer = None
+
+    # (method, pattern of path after _apis/ or _api/, handler name)
+    _ROUTES = [
+        ('GET', r'projects', '_get_projects'),
+        ('GET', r'projects/(?P<project>[^/]+)', '_get_project'),
+        ('GET', r'projects/(?P<project>[^/]+)/teams', '_get_project_teams'),
+        ('GET', r'projects/(?P<project>[^/]+)/teams/(?P<team>[^/]+)', '_get_team'),
+        ('GET', r'projects/(?P<project>[^/]+)/teams/(?P<team>[^/]+)/members', '_get_team_members'),
+        ('GET', r'teams', '_get_all_teams'),
+        ('GET', r'work/boards', '_get_boards'),
+        ('GET', r'work/boards/(?P<board>[^/]+)', '_get_board'),
+        ('GET', r'_identity/ReadScopedApplicationGroupsJson', '_get_groups'),
+        ('GET', r'_identity/ReadGroupMembers', '_get_group_members'),
+        ('GET', r'wit/workitems', '_get_workitems'),
+        ('GET', r'wit/workitems/(?P<item>\d+)', '_get_workitem'),
+        ('PATCH', r'wit/workitems/(?P<item>\d+)', '_update_workitem'),
+        ('POST', r'wit/workitems/\$(?P<type>[^/]+)', '_create_workitem'),
+        ('PATCH', r'wit/workitems/\$(?P<type>[^/]+)', '_create_workitem'),
+        ('GET', r'wit/workitems/(?P<item>\d+)/updates', '_get_updates'),
+        ('POST', r'wit/workitemsbatch', '_get_workitems_batch'),
+        ('POST', r'wit/wiql', '_run_wiql'),
+        ('POST', r'wit/\$batch', '_run_batch'),
+        ('GET', r'wit/recyclebin', '_get_recyclebin'),
+        ('GET', r'wit/reporting/workitemrevisions', '_get_reporting_revisions'),
+        ('GET', r'wit/reporting/workitemlinks', '_get_reporting_links'),
+        ('GET', r'wit/queries/(?P<query>.+)', '_get_query'),
+    ]
+
+    _COMPILED_ROUTES = [(method, re.compile(f'^{pattern}$', re.IGNORECASE), handler) for method, pattern, handler in _ROUTES]
+    _API_PATTERN = re.compile(r'/_apis?/')
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PATCH(self):
+        self._handle('PATCH')
+
+    def _handle(self, method: str):
+        server = self.fake_server
+        parts = urlsplit(self.path)
+        path = re.sub('/+', '/', parts.path)
+
+        self.query = {name: values[-1] for name, values in parse_qs(parts.query, keep_blank_values=True).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        self.body = self.rfile.read(length) if length else b''
+
+        throttle = server._begin_request(method, path)
+        try:
+            if server.latency > 0:
+                time.sleep(server.latency)
+
+            if throttle:
+                self._send_json(429, {'message': 'Request was blocked due to exceeding usage of resource.'}, \
+                    {'Retry-After': str(server.retry_after), 'X-RateLimit-Remaining': '0', 'X-RateLimit-Limit': '200'})
+                return
+
+            try:
+                status_code, json_body = self._route(method, path)
+            except _HttpError as ex:
+                status_code, json_body = ex.status_code, {'message': str(ex)}
+            except (KeyError, ValueError) as ex:
+                status_code, json_body = 400, {'message': f'Bad request: {ex}'}
+
+            self._send_json(status_code, json_body, conditional=(method == 'GET'))
+        finally:
+            server._end_request()
+
+    def _route(self, method: str, path: str):
+        match = self._API_PATTERN.search(path)
+        if not match:
+            raise _HttpError(404, f'Unknown resource {path}')
+
+        self.prefix = [segment for segment in path[:match.start()].split('/') if segment]
+        resource = path[match.end():].strip('/')
+
+        for route_method, pattern, handler in self._COMPILED_ROUTES:
+            route_match = pattern.match(resource)
+            if route_match and (route_method == method):
+                return getattr(self, handler)(**route_match.groupdict())
+
+        raise _HttpError(404, f'Unknown resource {method} {resource}')
+
+    def _send_json(self, status_code: int, json_body, headers: dict = None, conditional: bool = False) -> None:
+        '''
+        Sends json response or 304 Not Modified if conditional request matches ETag
+        '''
+
+        server = self.fake_server
+        content = json.dumps(json_body, separators=(',', ':')).encode('utf-8') if json_body is not None else b''
+        headers = dict(headers or {})
+
+        if server.latency_per_item > 0 and isinstance(json_body, dict):
+            count = len(json_body.get('value') or json_body.get('values') or json_body.get('workItems') or [])
+            time.sleep(server.latency_per_item * count)
+
+        if server.rate_limit_headers:
+            headers.setdefault('X-RateLimit-Resource', 'Core')
+            headers.setdefault('X-RateLimit-Limit', '200')
+            headers.setdefault('X-RateLimit-Remaining', '150')
+
+        if conditional and server.etag and (status_code == 200):
+            etag = '"' + hashlib.sha1(content).hexdigest() + '"'
+            headers['ETag'] = etag
+
+            if self.headers.get('If-None-Match') == etag:
+                status_code, content = 304, b''
+                server._count_not_modified()
+
+        self.send_response(status_code)
+        if status_code != 304:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    ### HELPERS REGION ###
+
+    @property
+    def _base_url(self) -> str:
+        return self.fake_server.collection_url
+
+    def _collection_check(self) -> None:
+        if (not self.prefix) or (self.prefix[0].lower() != FakeAzureDevOpsServer.COLLECTION.lower()):
+            raise _HttpError(404, 'Unknown collection')
+
+    def _project_index(self, project: str) -> int:
+        index = self.fake_server.dataset.project_index(project)
+        if index is None:
+            raise _HttpError(404, f'Project {project} not found')
+        return index
+
+    def _team_index(self, project_index: int, team: str) -> int:
+        index = self.fake_server.dataset.team_index(project_index, team)
+        if index is None:
+            raise _HttpError(404, f'Team {team} not found')
+        return index
+
+    def _page(self, items: list, page_size: int) -> tuple:
+        skip = int(self.query.get('$skip') or 0)
+        top = int(self.query.get('$top') or page_size)
+        page = items[skip:skip + min(top, page_size)]
+
+        return 200, {'count': len(page), 'value': page}
+
+    def _reporting_page(self, records: list) -> tuple:
+        '''
+        Page of reporting endpoint over records ((changed date, id, ...), json) sorted by key.
+        Continuation token is key of the last returned record, so records changed later are returned after it.
+        '''
+
+        token = self.query.get('continuationToken')
+        start = self.query.get('startDateTime')
+        page_size = int(self.query.get('$maxPageSize') or self.fake_server.page_size)
+
+        if token:
+            try:
+                last_key = tuple(json.loads(base64.urlsafe_b64decode(token.encode('ascii'))))
+            except ValueError:
+                raise _HttpError(400, f'Invalid continuation token {token}')
+            records = [record for record in records if record[0] > last_key]
+        elif start:
+            start = _WiqlFilter._parse_date(start)
+            records = [record for record in records if _WiqlFilter._parse_date(record[0][0]) >= start]
+
+        page = records[:page_size]
+        if page:
+            token = base64.urlsafe_b64encode(json.dumps(list(page[-1][0])).encode('utf-8')).decode('ascii')
+
+        return 200, {
+            'values': [json_item for _, json_item in page],
+            'continuationToken': token,
+            'isLastBatch': len(records) <= page_size
+        }
+
+    def _item_ids(self, ids) -> list:
+        if isinstance(ids, str):
+            ids = [item_id for item_id in ids.split(',') if item_id]
+
+        ids = [int(item_id) for item_id in ids]
+        if not ids:
+            raise _HttpError(400, 'ids are required')
+        if len(ids) > FakeAzureDevOpsServer._MAX_IDS:
+            raise _HttpError(400, f'The maximum number of ids is {FakeAzureDevOpsServer._MAX_IDS}')
+
+        return ids
+
+    def _workitems(self, ids: list, fields, expand: str, error_policy: str) -> list:
+        dataset = self.fake_server.dataset
+
+        if isinstance(fields, str):
+            fields = [field for field in fields.split(',') if field]
+
+        value = list()
+        for item_id in ids:
+            json_item = dataset.workitem(item_id, self._base_url, fields, expand)
+            if json_item is None and (error_policy or '').lower() != 'omit':
+                raise _HttpError(404, f'TF401232: Work item {item_id} does not exist')
+            value.append(json_item)
+
+        return value
+
+    def _notify(self) -> None:
+        # workitem change notifies subscribers unless request suppresses it
+        if str(self.query.get('suppressNotifications', '')).lower() != 'true':
+            self.fake_server._count_notification()
+
+    def _json_body(self):
+        try:
+            return json.loads(self.body) if self.body else None
+        except ValueError:
+            raise _HttpError(400, 'Request body is not json')
+
+    ### END OF HELPERS REGION ###
+
+    ### PROJECTS REGION ###
+
+    def _get_projects(self):
+        self._collection_check()
+        return self._page(self.fake_server.dataset.projects(self._base_url), self.fake_server.page_size)
+
+    def _get_project(self, project: str):
+        return 200, self.fake_server.dataset.project(self._project_index(project), self._base_url)
+
+    def _get_project_teams(self, project: str):
+        project_index = self._project_index(project)
+        return self._page(self.fake_server.dataset.teams(project_index, self._base_url), self.fake_server.page_size)
+
+    def _get_team(self, project: str, team: str):
+        project_index = self._project_index(project)
+        return 200, self.fake_server.dataset.team(project_index, self._team_index(project_index, team), self._base_url)
+
+    def _get_team_members(self, project: str, team: str):
+        project_index = self._project_index(project)
+        members = self.fake_server.dataset.team_members(project_index, self._team_index(project_index, team), self._base_url)
+        return self._page(members, self.fake_server.page_size)
+
+    def _get_all_teams(self):
+        teams = self.fake_server.dataset.all_teams(self._base_url)
+        return 200, {'count': len(teams), 'value': teams}
+
+    def _get_boards(self):
+        # path: {collection}/{project}/{team}/_apis/work/boards
+        project_index = self._project_index(self.prefix[1])
+        team_index = self._team_index(project_index, self.prefix[2])
+        boards = self.fake_server.dataset.boards(project_index, team_index, self._base_url)
+        return 200, {'count': len(boards), 'value': boards}
+
+    def _get_board(self, board: str):
+        project_index = self._project_index(self.prefix[1])
+        team_index = self._team_index(project_index, self.prefix[2])
+        json_board = self.fake_server.dataset.board(project_index, team_index, board, self._base_url)
+        if json_board is None:
+            raise _HttpError(404, f'Board {board} not found')
+        return 200, json_board
+
+    def _get_groups(self):
+        # path: {collection}/{project}/_api/_identity/...
+        project_index = self._project_index(self.prefix[1])
+        return 200, {'identities': self.fake_server.dataset.groups(project_index)}
+
+    def _get_group_members(self):
+        project_index = self._project_index(self.prefix[1])
+        return 200, {'identities': self.fake_server.dataset.group_members(project_index, self.query.get('scope'))}
+
+    ### END OF PROJECTS REGION ###
+
+    ### WORKITEMS REGION ###
+
+    def _get_workitems(self):
+        ids = self._item_ids(self.query.get('ids', ''))
+        value = self._workitems(ids, self.query.get('fields'), self.query.get('$expand'), self.query.get('errorPolicy'))
+        return 200, {'count': len(value), 'value': value}
+
+    def _get_workitem(self, item: str):
+        value = self._workitems([int(item)], self.query.get('fields'), self.query.get('$expand'), None)
+        return 200, value[0]
+
+    def _get_workitems_batch(self):
+        if not self.fake_server.batch_supported:
+            raise _HttpError(404, 'Unknown resource wit/workitemsbatch')
+
+        body = self._json_body() or {}
+        if body.get('fields') and body.get('$expand'):
+            raise _HttpError(400, 'The expand parameter can not be used with the fields parameter.')
+
+        ids = self._item_ids(body.get('ids') or [])
+        value = self._workitems(ids, body.get('fields'), body.get('$expand'), body.get('errorPolicy'))
+        return 200, {'count': len(value), 'value': value}
+
+    def _get_updates(self, item: str):
+        updates = self.fake_server.dataset.updates(int(item), self._base_url)
+        if updates is None:
+            raise _HttpError(404, f'TF401232: Work item {item} does not exist')
+
+        return self._page(updates, self.fake_server.updates_page_size)
+
+    def _create_workitem(self, type: str):
+        project_index = self._project_index(self.prefix[1]) if len(self.prefix) > 1 else 0
+        operations = self._json_body() or []
+
+        item_id = self.fake_server.dataset.create_workitem(type, project_index, operations)
+        self._notify()
+        return 200, self.fake_server.dataset.workitem(item_id, self._base_url, expand=self.query.get('$expand') or 'All')
+
+    def _update_workitem(self, item: str):
+        item_id = int(item)
+        if not self.fake_server.dataset.has_workitem(item_id):
+            raise _HttpError(404, f'TF401232: Work item {item} does not exist')
+
+        try:
+            self.fake_server.dataset.update_workitem(item_id, self._json_body() or [])
+        except RevisionConflictError as ex:
+            raise _HttpError(412, str(ex))
+
+        self._notify()
+
+        return 200, self.fake_server.dataset.workitem(item_id, self._base_url, expand=self.query.get('$expand') or 'All')
+
+    def _run_wiql(self):
+        body = self._json_body() or {}
+        if not body.get('query'):
+            raise _HttpError(400, 'query is required')
+
+        project = self.prefix[1] if len(self.prefix) > 1 else None
+        time_precision = str(self.query.get('timePrecision', '')).lower() == 'true'
+        conditions = _WiqlFilter.parse(body['query'], project, time_precision)
+
+        dataset = self.fake_server.dataset
+        ids = dataset.query_workitems(lambda fields: _WiqlFilter.match(conditions, fields)) \
+            if conditions else dataset.workitem_ids()
+
+        max_results = self.fake_server.wiql_max_results
+        # like Azure DevOps, $top of request body is ignored
+        top = int(self.query.get('$top') or 0)
+        limit = min(top, max_results) if top > 0 else max_results
+
+        if (top <= 0) and (len(ids) > max_results):
+            raise _HttpError(400, f'VS402337: The number of work items returned exceeds the size limit of {max_results}.')
+
+        return 200, {
+            'queryType': 'flat',
+            'asOf': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'workItems': [{'id': item_id, 'url': f'{self._base_url}_apis/wit/workItems/{item_id}'} for item_id in ids[:limit]]
+        }
+
+    def _run_batch(self):
+        '''
+        Runs every request of wit/$batch with the same handlers, uri of request is relative to collection.
+        New workitem with /id operation (negative temporary id) can be linked by next requests of the batch.
+        '''
+
+        self._collection_check()
+
+        batch_requests = self._json_body()
+        if not isinstance(batch_requests, list):
+            raise _HttpError(400, 'Body of $batch should be a list of requests')
+        if len(batch_requests) > FakeAzureDevOpsServer._MAX_BATCH_REQUESTS:
+            raise _HttpError(400, f'The maximum number of requests is {FakeAzureDevOpsServer._MAX_BATCH_REQUESTS}')
+
+        query, body, prefix = self.query, self.body, self.prefix
+        values = list()
+        # temporary id -> id of created workitem
+        temp_ids = dict()
+
+        try:
+            for batch_request in batch_requests:
+                parts = urlsplit(batch_request.get('uri') or '')
+                self.query = {name: items[-1] for name, items in parse_qs(parts.query, keep_blank_values=True).items()}
+                temp_id = None
+
+                try:
+                    operations = batch_request.get('body')
+                    if isinstance(operations, list):
+                        temp_id, operations = self._resolve_temp_ids(operations, temp_ids)
+                    self.body = json.dumps(operations).encode('utf-8')
+
+                    status_code, json_body = self._route(str(batch_request.get('method', 'GET')).upper(), \
+                        f'/{FakeAzureDevOpsServer.COLLECTION}{parts.path}')
+                except _HttpError as ex:
+                    status_code, json_body = ex.status_code, {'message': str(ex)}
+                except (KeyError, ValueError) as ex:
+                    status_code, json_body = 400, {'message': f'Bad request: {ex}'}
+
+                if (temp_id is not None) and (status_code == 200):
+                    temp_ids[temp_id] = json_body['id']
+
+                values.append({
+                    'code': status_code,
+                    'headers': {'Content-Type': 'application/json; charset=utf-8'},
+                    'body': json.dumps(json_body)
+                })
+        finally:
+            self.query, self.body, self.prefix = query, body, prefix
+
+        return 200, {'count': len(values), 'value': values}
+
+    @staticmethod
+    def _resolve_temp_ids(operations: list, temp_ids: dict) -> tuple:
+        '''
+        Returns (temporary id of new workitem, operations without /id and with real ids in relation urls)
+        '''
+
+        temp_id, resolved = None, list()
+        for operation in operations:
+            path = operation.get('path') if isinstance(operation, dict) else None
+
+            if path == '/id':
+                temp_id = int(operation.get('value'))
+                continue
+
+            if (path == '/relations/-') and isinstance(operation.get('value'), dict):
+                url = operation['value'].get('url') or ''
+                target_id = int(url.rstrip('/').split('/')[-1])
+                if target_id < 0:
+                    if target_id not in temp_ids:
+                        raise _HttpError(400, f'Work item with temporary id {target_id} was not created')
+                    url = url.rstrip('/')[:-len(str(target_id))] + str(temp_ids[target_id])
+                    operation = dict(operation, value=dict(operation['value'], url=url))
+
+            resolved.append(operation)
+
+        return temp_id, resolved
+
+    def _get_recyclebin(self):
+        project_index = self._project_index(self.prefix[1]) if len(self.prefix) > 1 else None
+        value = self.fake_server.dataset.deleted_workitems(project_index, self._base_url)
+        return 200, {'count': len(value), 'value': value}
+
+    def _get_reporting_revisions(self):
+        project_index = self._project_index(self.prefix[1]) if len(self.prefix) > 1 else None
+        fields = [name for name in (self.query.get('fields') or '').split(',') if name]
+        types = [name for name in (self.query.get('types') or '').split(',') if name]
+        latest_only = str(self.query.get('includeLatestOnly', '')).lower() == 'true'
+
+        revisions = self.fake_server.dataset.revisions(project_index, fields, types, latest_only)
+        return self._reporting_page(revisions)
+
+    def _get_reporting_links(self):
+        project_index = self._project_index(self.prefix[1]) if len(self.prefix) > 1 else None
+        link_types = [name for name in (self.query.get('linkTypes') or '').split(',') if name]
+        types = [name for name in (self.query.get('types') or '').split(',') if name]
+
+        links = self.fake_server.dataset.links(project_index, link_types, types)
+        return self._reporting_page(links)
+
+    def _get_query(self, query: str):
+        return 200, {
+            'id': query,
+            'name': f'Query {query}',
+            'path': f'Shared Queries/{query}',
+            'wiql': 'SELECT [System.Id] FROM workitems ORDER BY [System.Id]'
+        }
+
+    ### END OF WORKITEMS REGION ###
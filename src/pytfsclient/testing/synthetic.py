@@ -0,0 +1,677 @@
+import uuid
+import random
+import threading
+from datetime import datetime, timedelta
+from typing import List, Dict
+
+_NAMESPACE = uuid.UUID('6ba7b811-9dad-11d1-80b4-00c04fd430c8')
+
+_WORKITEM_TYPES = ('User Story', 'Task', 'Bug', 'Feature')
+_STATES = ('New', 'Active', 'Resolved', 'Closed')
+_WORDS = ('client', 'server', 'query', 'board', 'team', 'release', 'build', 'sprint', 'backlog', 'report', \
+    'cache', 'index', 'login', 'export', 'import', 'sync', 'page', 'field', 'rule', 'alert')
+
+def _make_guid(*parts) -> str:
+    return str(uuid.uuid5(_NAMESPACE, '/'.join(str(part) for part in parts)))
+
+def _format_date(value: datetime) -> str:
+    return value.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+class RevisionConflictError(ValueError):
+    '''
+    Raised if test operation of /rev doesn't match current revision of workitem
+    '''
+    pass
+
+class SyntheticDataset:
+    '''
+    Deterministic synthetic TFS/Azure data for FakeAzureDevOpsServer.
+    Workitems, their histories and relations are generated on request from workitem id and seed,
+    so dataset of hundreds of thousands workitems doesn't take memory.
+    Workitems created or updated through server are kept in memory.
+    '''
+
+    # date of the first workitem
+    _START_DATE = datetime(2020, 1, 1)
+
+    def __init__(self, workitem_count: int = 1000, project_count: int = 1, teams_per_project: int = 3, \
+        members_per_team: int = 10, user_count: int = 50, updates_per_workitem: int = 5, \
+        relations_per_workitem: int = 2, hierarchy_fanout: int = 5, description_size: int = 200, seed: int = 0) -> None:
+        '''
+        SyntheticDataset constructor.
+
+        Args:
+            workitem_count (int): number of workitems, ids are 1..workitem_count. Default: 1000
+            project_count (int): number of projects. Default: 1
+            teams_per_project (int): number of teams in every project. Default: 3
+            members_per_team (int): number of members in every team. Default: 10
+            user_count (int): number of users. Default: 50
+            updates_per_workitem (int): max number of updates (revisions) of workitem. Default: 5
+            relations_per_workitem (int): max number of related links of workitem. Default: 2
+            hierarchy_fanout (int): number of children of parent workitem. Default: 5
+            description_size (int): approximate size of System.Description in characters. Default: 200
+            seed (int): random seed. Default: 0
+        '''
+
+        self.__workitem_count = workitem_count
+        self.__project_count = project_count
+        self.__teams_per_project = teams_per_project
+        self.__members_per_team = members_per_team
+        self.__user_count = max(1, user_count)
+        self.__updates_per_workitem = updates_per_workitem
+        self.__relations_per_workitem = relations_per_workitem
+        self.__hierarchy_fanout = max(1, hierarchy_fanout)
+        self.__description_size = description_size
+        self.__seed = seed
+
+        # workitems created or changed through server
+        self.__lock = threading.Lock()
+        self.__changed: Dict[int, dict] = dict()
+        self.__changed_updates: Dict[int, List[dict]] = dict()
+        # deleted workitem ids with date of deletion (recycle bin)
+        self.__deleted: Dict[int, str] = dict()
+        self.__next_id = workitem_count + 1
+
+    ### PROPERTIES REGION ###
+
+    @property
+    def workitem_count(self) -> int:
+        '''
+        Returns:
+            Number of workitems including created ones
+        '''
+        return self.__next_id - 1
+
+    @property
+    def project_count(self) -> int:
+        return self.__project_count
+
+    ### END OF PROPERTIES REGION ###
+
+    ### USERS, PROJECTS AND TEAMS REGION ###
+
+    def user(self, index: int, base_url: str = '') -> dict:
+        '''
+        Returns json of user (identity reference)
+        '''
+
+        index = index % self.__user_count
+        user_id = _make_guid('user', self.__seed, index)
+
+        return {
+            'id': user_id,
+            'displayName': f'User {index}',
+            'uniqueName': f'user{index}@example.com',
+            'url': f'{base_url}_apis/Identities/{user_id}',
+            'descriptor': f'aad.{user_id}'
+        }
+
+    def project_id(self, index: int) -> str:
+        return _make_guid('project', self.__seed, index)
+
+    def project_index(self, project_id: str) -> int:
+        '''
+        Returns index of project by id or name, None if project doesn't exist
+        '''
+
+        for index in range(self.__project_count):
+            if project_id in (self.project_id(index), self.project_name(index)):
+                return index
+
+        return None
+
+    @staticmethod
+    def project_name(index: int) -> str:
+        return f'Project{index}'
+
+    def projects(self, base_url: str = '') -> List[dict]:
+        return [self.project(index, base_url) for index in range(self.__project_count)]
+
+    def project(self, index: int, base_url: str = '') -> dict:
+        project_id = self.project_id(index)
+
+        return {
+            'id': project_id,
+            'name': self.project_name(index),
+            'description': f'Synthetic project {index}',
+            'url': f'{base_url}_apis/projects/{project_id}',
+            'state': 'wellFormed',
+            'revision': 1,
+            'visibility': 'private'
+        }
+
+    def team_id(self, project_index: int, team_index: int) -> str:
+        return _make_guid('team', self.__seed, project_index, team_index)
+
+    def team_index(self, project_index: int, team_id: str) -> int:
+        '''
+        Returns index of team by id or name, None if team doesn't exist
+        '''
+
+        for index in range(self.__teams_per_project):
+            if team_id in (self.team_id(project_index, index), self.team_name(project_index, index)):
+                return index
+
+        return None
+
+    def team_name(self, project_index: int, team_index: int) -> str:
+        return f'{self.project_name(project_index)} Team{team_index}'
+
+    def teams(self, project_index: int, base_url: str = '') -> List[dict]:
+        return [self.team(project_index, index, base_url) for index in range(self.__teams_per_project)]
+
+    def all_teams(self, base_url: str = '') -> List[dict]:
+        return [team for project_index in range(self.__project_count) for team in self.teams(project_index, base_url)]
+
+    def team(self, project_index: int, team_index: int, base_url: str = '') -> dict:
+        project_id = self.project_id(project_index)
+        team_id = self.team_id(project_index, team_index)
+
+        return {
+            'id': team_id,
+            'name': self.team_name(project_index, team_index),
+            'url': f'{base_url}_apis/projects/{project_id}/teams/{team_id}',
+            'description': f'Synthetic team {team_index}',
+            'projectName': self.project_name(project_index),
+            'projectId': project_id
+        }
+
+    def team_members(self, project_index: int, team_index: int, base_url: str = '') -> List[dict]:
+        first = (project_index * self.__teams_per_project + team_index) * self.__members_per_team
+        return [{'isTeamAdmin': index == 0, 'identity': self.user(first + index, base_url)} \
+            for index in range(self.__members_per_team)]
+
+    def groups(self, project_index: int) -> List[dict]:
+        '''
+        Returns identities of project groups (non-public _api/_identity format)
+        '''
+
+        groups = [self.__identity(_make_guid('group', self.__seed, project_index, name), name, 'group') \
+            for name in ('Project Administrators', 'Contributors', 'Readers')]
+        groups += [self.__identity(self.team_id(project_index, index), self.team_name(project_index, index), 'team') \
+            for index in range(self.__teams_per_project)]
+
+        return groups
+
+    def group_members(self, project_index: int, group_id: str) -> List[dict]:
+        '''
+        Returns identities of members of project group or team
+        '''
+
+        groups = self.groups(project_index)
+        for index, group in enumerate(groups):
+            if group['TeamFoundationId'] == group_id:
+                members = list()
+                for member_index in range(self.__members_per_team):
+                    user = self.user(project_index * 100 + index * self.__members_per_team + member_index)
+                    members.append(self.__identity(user['id'], user['displayName'], 'user'))
+                return members
+
+        return []
+
+    def boards(self, project_index: int, team_index: int, base_url: str = '') -> List[dict]:
+        return [{k: v for k, v in self.board(project_index, team_index, name, base_url).items() if k in ('id', 'name', 'url')} \
+            for name in ('Stories', 'Features')]
+
+    def board(self, project_index: int, team_index: int, board_id: str, base_url: str = '') -> dict:
+        '''
+        Returns board by id or name, None if board doesn't exist
+        '''
+
+        for name in ('Stories', 'Features'):
+            current_id = _make_guid('board', self.__seed, project_index, team_index, name)
+            if board_id not in (current_id, name):
+                continue
+
+            item_type = 'User Story' if name == 'Stories' else 'Feature'
+            return {
+                'id': current_id,
+                'name': name,
+                'url': f'{base_url}{self.project_id(project_index)}/{self.team_id(project_index, team_index)}/_apis/work/boards/{current_id}',
+                'revision': 1,
+                'isValid': True,
+                'canEdit': True,
+                'columns': [
+                    {'id': _make_guid('column', current_id, 0), 'name': 'New', 'itemLimit': 0, 'columnType': 'incoming', \
+                        'stateMappings': {item_type: 'New'}},
+                    {'id': _make_guid('column', current_id, 1), 'name': 'Active', 'itemLimit': 5, 'columnType': 'inProgress', \
+                        'stateMappings': {item_type: 'Active'}},
+                    {'id': _make_guid('column', current_id, 2), 'name': 'Closed', 'itemLimit': 0, 'columnType': 'outgoing', \
+                        'stateMappings': {item_type: 'Closed'}},
+                ],
+                'rows': [{'id': _make_guid('row', current_id, 0), 'name': None, 'color': None}]
+            }
+
+        return None
+
+    @staticmethod
+    def __identity(identity_id: str, name: str, identity_type: str) -> dict:
+        return {
+            'TeamFoundationId': identity_id,
+            'IdentityType': identity_type,
+            'DisplayName': name,
+            'FriendlyDisplayName': name,
+            'SubHeader': name
+        }
+
+    ### END OF USERS, PROJECTS AND TEAMS REGION ###
+
+    ### WORKITEMS REGION ###
+
+    def has_workitem(self, item_id: int) -> bool:
+        return (0 < item_id < self.__next_id) and (item_id not in self.__deleted)
+
+    def workitem_ids(self) -> List[int]:
+        '''
+        Returns ids of not deleted workitems
+        '''
+
+        with self.__lock:
+            deleted = set(self.__deleted)
+
+        item_ids = range(1, self.__next_id)
+        return [item_id for item_id in item_ids if item_id not in deleted] if deleted else item_ids
+
+    def query_workitems(self, predicate) -> List[int]:
+        '''
+        Returns ids of not deleted workitems which fields match predicate(fields)
+        '''
+
+        item_ids = list()
+        for item_id in self.workitem_ids():
+            json_item = self.workitem(item_id)
+            if (json_item is not None) and predicate(json_item['fields']):
+                item_ids.append(item_id)
+
+        return item_ids
+
+    def delete_workitem(self, item_id: int) -> None:
+        '''
+        Moves workitem to recycle bin
+
+        Raises:
+            KeyError if workitem doesn't exist
+        '''
+
+        if not self.has_workitem(item_id):
+            raise KeyError(item_id)
+
+        with self.__lock:
+            self.__deleted[item_id] = _format_date(datetime.utcnow())
+
+    def deleted_workitems(self, project_index: int = None, base_url: str = '') -> List[dict]:
+        '''
+        Returns shallow references of workitems in recycle bin
+        '''
+
+        with self.__lock:
+            deleted = dict(self.__deleted)
+
+        return [{
+            'id': item_id,
+            'url': f'{base_url}_apis/wit/recycleBin/{item_id}',
+            'deletedDate': deleted_date
+        } for item_id, deleted_date in sorted(deleted.items()) \
+            if (project_index is None) or (self.__project_of(item_id) == self.project_name(project_index))]
+
+    def workitem(self, item_id: int, base_url: str = '', fields: List[str] = None, expand: str = None) -> dict:
+        '''
+        Returns json of workitem or None if workitem doesn't exist
+
+        Args:
+            item_id (int): workitem id
+            base_url (str): url of collection for workitem and relation urls
+            fields (List[str]): requested fields. Default: None (all fields)
+            expand (str): None, Relations, Fields, Links or All. Default: None
+        '''
+
+        if not self.has_workitem(item_id):
+            return None
+
+        item = self.__get_item(item_id)
+
+        json_item = {
+            'id': item_id,
+            'rev': item['rev'],
+            'fields': {name: value for name, value in item['fields'].items() if (not fields) or (name in fields)},
+            'url': f'{base_url}_apis/wit/workItems/{item_id}'
+        }
+
+        if (not fields) and expand and (expand.lower() in ('relations', 'all')):
+            json_item['relations'] = [{
+                'rel': relation['rel'],
+                'url': f'{base_url}_apis/wit/workItems/{relation["id"]}',
+                'attributes': relation.get('attributes') or {'isLocked': False, 'name': relation['name']}
+            } for relation in item['relations']]
+
+        if expand and (expand.lower() in ('links', 'all')):
+            json_item['_links'] = {'self': {'href': json_item['url']}}
+
+        return json_item
+
+    def updates(self, item_id: int, base_url: str = '') -> List[dict]:
+        '''
+        Returns list of updates (history) of workitem
+        '''
+
+        if not self.has_workitem(item_id):
+            return None
+
+        with self.__lock:
+            changed = self.__changed_updates.get(item_id)
+
+        updates = changed if changed is not None else self.__generate_updates(item_id)
+
+        return [dict(update, url=f'{base_url}_apis/wit/workItems/{item_id}/updates/{update["id"]}') for update in updates]
+
+    def revisions(self, project_index: int = None, fields: List[str] = None, types: List[str] = None, \
+        latest_only: bool = False) -> List[tuple]:
+        '''
+        Returns revisions of not deleted workitems for reporting endpoint:
+        list of ((changed date, id, rev), json) sorted by changed date.
+        Fields of older revisions are built from the first generated state and revision history.
+        '''
+
+        types = {type_name.lower() for type_name in types} if types else None
+        project_name = self.project_name(project_index) if project_index is not None else None
+
+        revisions = list()
+        for item_id in self.workitem_ids():
+            item = self.__get_item(item_id)
+            item_fields = item['fields']
+
+            if (project_name is not None) and (item_fields.get('System.TeamProject') != project_name):
+                continue
+            if (types is not None) and (str(item_fields.get('System.WorkItemType')).lower() not in types):
+                continue
+
+            generated = None
+            updates = self.updates(item_id)
+            if latest_only:
+                updates = updates[-1:]
+
+            for update in updates:
+                if update['rev'] == item['rev']:
+                    revision_fields = dict(item_fields)
+                else:
+                    generated = generated or self.__generate_workitem(item_id)['fields']
+                    revision_fields = dict(generated)
+                    revision_fields['System.State'] = _STATES[min(update['rev'] - 1, len(_STATES) - 1)]
+
+                revision_fields['System.Rev'] = update['rev']
+                revision_fields['System.ChangedDate'] = update['revisedDate']
+
+                json_item = {
+                    'id': item_id,
+                    'rev': update['rev'],
+                    'fields': {name: value for name, value in revision_fields.items() if (not fields) or (name in fields)}
+                }
+                revisions.append(((update['revisedDate'], item_id, update['rev']), json_item))
+
+        revisions.sort(key=lambda revision: revision[0])
+        return revisions
+
+    def links(self, project_index: int = None, link_types: List[str] = None, types: List[str] = None) -> List[tuple]:
+        '''
+        Returns link changes of not deleted workitems for reporting endpoint:
+        list of ((changed date, source id, target id, rel, is active), json) sorted by changed date.
+        Reverse links aren't reported, they are the same links seen from target workitem.
+        '''
+
+        link_types = {link_type.lower() for link_type in link_types} if link_types else None
+        types = {type_name.lower() for type_name in types} if types else None
+        project_name = self.project_name(project_index) if project_index is not None else None
+
+        links = list()
+
+        def add_link(source_id: int, target_id: int, rel: str, changed_date: str, is_active: bool) -> None:
+            if (not rel) or rel.endswith('-Reverse') or ((link_types is not None) and (rel.lower() not in link_types)):
+                return
+
+            links.append(((changed_date, source_id, target_id, rel, is_active), {
+                'rel': rel,
+                'sourceId': source_id,
+                'targetId': target_id,
+                'changedDate': changed_date,
+                'isActive': is_active,
+                'changedOperation': 'create' if is_active else 'remove'
+            }))
+
+        for item_id in self.workitem_ids():
+            item = self.__get_item(item_id)
+            item_fields = item['fields']
+
+            if (project_name is not None) and (item_fields.get('System.TeamProject') != project_name):
+                continue
+            if (types is not None) and (str(item_fields.get('System.WorkItemType')).lower() not in types):
+                continue
+
+            # links added and removed by updates, other links exist since creation
+            added_dates = dict()
+            for update in self.updates(item_id):
+                for change, is_active in (('added', True), ('removed', False)):
+                    for relation in (update.get('relations') or {}).get(change, []):
+                        target_id = int(relation['url'].rstrip('/').split('/')[-1])
+                        if is_active:
+                            added_dates[(relation['rel'], target_id)] = update['revisedDate']
+                        else:
+                            add_link(item_id, target_id, relation['rel'], update['revisedDate'], False)
+
+            for relation in item['relations']:
+                changed_date = added_dates.get((relation['rel'], relation['id']), item_fields.get('System.CreatedDate'))
+                add_link(item_id, relation['id'], relation['rel'], changed_date, True)
+
+        links.sort(key=lambda link: link[0])
+        return links
+
+    def create_workitem(self, type_name: str, project_index: int, operations: List[dict]) -> int:
+        '''
+        Creates workitem from json patch operations and returns its id
+        '''
+
+        with self.__lock:
+            item_id = self.__next_id
+            self.__next_id += 1
+
+        now = _format_date(datetime.utcnow())
+        item = {
+            'rev': 0,
+            'fields': {
+                'System.Id': item_id,
+                'System.WorkItemType': type_name,
+                'System.TeamProject': self.project_name(project_index),
+                'System.State': 'New',
+                'System.CreatedDate': now,
+                'System.ChangedDate': now,
+                'System.CreatedBy': self.user(0),
+            },
+            'relations': []
+        }
+
+        with self.__lock:
+            self.__changed[item_id] = item
+            self.__changed_updates[item_id] = []
+
+        try:
+            self.update_workitem(item_id, operations)
+        except Exception:
+            # workitem isn't created if any operation fails
+            with self.__lock:
+                self.__deleted[item_id] = now
+            raise
+
+        return item_id
+
+    def update_workitem(self, item_id: int, operations: List[dict]) -> None:
+        '''
+        Applies json patch operations to workitem.
+
+        Raises:
+            KeyError if workitem doesn't exist
+            RevisionConflictError if test of /rev failed
+            ValueError if operation is invalid
+        '''
+
+        if not self.has_workitem(item_id):
+            raise KeyError(item_id)
+
+        with self.__lock:
+            item = self.__changed.get(item_id)
+            if item is None:
+                item = self.__generate_workitem(item_id)
+                self.__changed_updates[item_id] = self.__generate_updates(item_id)
+
+            fields = dict(item['fields'])
+            relations = list(item['relations'])
+            field_changes = dict()
+            added, removed = list(), list()
+
+            for operation in operations:
+                op = str(operation.get('op', '')).lower()
+                path = operation.get('path', '')
+
+                if path == '/rev':
+                    if (op == 'test') and (int(operation.get('value')) != item['rev']):
+                        raise RevisionConflictError(f'rev test failed: expected {operation.get("value")}, actual {item["rev"]}')
+                    continue
+
+                if path.startswith('/fields/'):
+                    name = path[len('/fields/'):]
+                    old_value = fields.get(name)
+                    if op in ('add', 'replace'):
+                        fields[name] = operation.get('value')
+                    elif op == 'remove':
+                        fields.pop(name, None)
+                    else:
+                        raise ValueError(f'unsupported operation {op} for {path}')
+                    field_changes[name] = {'oldValue': old_value, 'newValue': fields.get(name)}
+                elif path == '/relations/-' and op == 'add':
+                    value = operation.get('value') or {}
+                    url = value.get('url', '')
+                    relation = {'rel': value.get('rel'), 'id': int(url.rstrip('/').split('/')[-1]), \
+                        'name': value.get('rel'), 'attributes': value.get('attributes')}
+                    if not self.has_workitem(relation['id']):
+                        raise ValueError(f'TF201036: linked work item {relation["id"]} does not exist')
+                    relations.append(relation)
+                    added.append(value)
+                elif path.startswith('/relations/') and op == 'remove':
+                    index = int(path[len('/relations/'):])
+                    if not 0 <= index < len(relations):
+                        raise ValueError(f'relation index {index} is out of range')
+                    removed.append({'rel': relations[index]['rel'], 'url': f'_apis/wit/workItems/{relations[index]["id"]}'})
+                    del relations[index]
+                else:
+                    raise ValueError(f'unsupported operation {op} for {path}')
+
+            rev = item['rev'] + 1
+            changed_date = _format_date(datetime.utcnow())
+            fields['System.Rev'] = rev
+            fields['System.ChangedDate'] = changed_date
+
+            self.__changed[item_id] = {'rev': rev, 'fields': fields, 'relations': relations}
+
+            update = {
+                'id': len(self.__changed_updates[item_id]) + 1,
+                'workItemId': item_id,
+                'rev': rev,
+                'revisedBy': self.user(0),
+                'revisedDate': changed_date,
+                'fields': field_changes
+            }
+            if added or removed:
+                update['relations'] = {key: value for key, value in (('added', added), ('removed', removed)) if value}
+
+            self.__changed_updates[item_id].append(update)
+
+    def __get_item(self, item_id: int) -> dict:
+        with self.__lock:
+            changed = self.__changed.get(item_id)
+
+        return changed if changed is not None else self.__generate_workitem(item_id)
+
+    def __project_of(self, item_id: int) -> str:
+        return self.__get_item(item_id)['fields'].get('System.TeamProject')
+
+    def __random(self, item_id: int) -> random.Random:
+        return random.Random(self.__seed * 1000003 + item_id)
+
+    def __generate_workitem(self, item_id: int) -> dict:
+        rnd = self.__random(item_id)
+
+        type_name = _WORKITEM_TYPES[rnd.randrange(len(_WORKITEM_TYPES))]
+        project_index = item_id % self.__project_count
+        update_count = rnd.randint(0, self.__updates_per_workitem)
+
+        created = self._START_DATE + timedelta(minutes=item_id)
+        changed = created + timedelta(hours=update_count)
+
+        title = ' '.join(rnd.choice(_WORDS) for _ in range(5))
+        description = ' '.join(rnd.choice(_WORDS) for _ in range(max(0, self.__description_size // 7)))
+
+        fields = {
+            'System.Id': item_id,
+            'System.AreaPath': self.project_name(project_index),
+            'System.TeamProject': self.project_name(project_index),
+            'System.IterationPath': f'{self.project_name(project_index)}\\Sprint {item_id % 10 + 1}',
+            'System.WorkItemType': type_name,
+            'System.State': _STATES[min(update_count, len(_STATES) - 1)],
+            'System.Reason': 'New',
+            'System.AssignedTo': self.user(rnd.randrange(self.__user_count)),
+            'System.CreatedDate': _format_date(created),
+            'System.CreatedBy': self.user(rnd.randrange(self.__user_count)),
+            'System.ChangedDate': _format_date(changed),
+            'System.ChangedBy': self.user(rnd.randrange(self.__user_count)),
+            'System.Rev': update_count + 1,
+            'System.Title': f'{type_name} {item_id}: {title}',
+            'System.Description': description,
+            'Microsoft.VSTS.Common.Priority': rnd.randint(1, 4),
+        }
+
+        # hierarchy: parent of workitem is (id - 1) // fanout, children are fanout items after it
+        relations = list()
+        parent_id = (item_id - 1) // self.__hierarchy_fanout
+        if parent_id > 0:
+            relations.append({'rel': 'System.LinkTypes.Hierarchy-Reverse', 'id': parent_id, 'name': 'Parent'})
+
+        first_child = item_id * self.__hierarchy_fanout + 1
+        for child_id in range(first_child, min(first_child + self.__hierarchy_fanout, self.__workitem_count + 1)):
+            relations.append({'rel': 'System.LinkTypes.Hierarchy-Forward', 'id': child_id, 'name': 'Child'})
+
+        for _ in range(rnd.randint(0, self.__relations_per_workitem)):
+            related_id = rnd.randint(1, self.__workitem_count)
+            if related_id != item_id:
+                relations.append({'rel': 'System.LinkTypes.Related', 'id': related_id, 'name': 'Related'})
+
+        return {'rev': update_count + 1, 'fields': fields, 'relations': relations}
+
+    def __generate_updates(self, item_id: int) -> List[dict]:
+        item = self.__generate_workitem(item_id)
+        rnd = self.__random(-item_id)
+
+        created = self._START_DATE + timedelta(minutes=item_id)
+        updates = list()
+
+        for rev in range(1, item['rev'] + 1):
+            revised = created + timedelta(hours=rev - 1)
+
+            if rev == 1:
+                field_changes = {name: {'newValue': value} for name, value in item['fields'].items() \
+                    if name in ('System.Title', 'System.State', 'System.WorkItemType', 'System.AssignedTo')}
+            else:
+                field_changes = {
+                    'System.State': {'oldValue': _STATES[min(rev - 2, len(_STATES) - 1)], 'newValue': _STATES[min(rev - 1, len(_STATES) - 1)]},
+                    'System.ChangedDate': {'oldValue': _format_date(revised - timedelta(hours=1)), 'newValue': _format_date(revised)},
+                }
+
+            updates.append({
+                'id': rev,
+                'workItemId': item_id,
+                'rev': rev,
+                'revisedBy': self.user(rnd.randrange(self.__user_count)),
+                'revisedDate': _format_date(revised),
+                'fields': field_changes
+            })
+
+        return updates
+
+    ### END OF WORKITEMS REGION ###
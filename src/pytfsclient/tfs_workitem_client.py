@@ -26,7 +26,7 @@ class TfsWorkitemClient:
         """
         return self.__client
 
-    def get_workitems(self, item_ids, item_fields: List[str] = None, expand: str = 'All', batch_size: int = 50) -> List[TfsWorkitem]:
+    def get_workitems(self, item_ids, item_fields: List[str] = None, expand: str = 'All', batch_size: int = None) -> List[TfsWorkitem]:
         """
         Return list of TfsWorkitems for given list of item ids.
 
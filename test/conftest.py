@@ -0,0 +1,34 @@
+import pytest
+from pytfsclient.client_factory import ClientFactory
+from pytfsclient.testing import FakeAzureDevOpsServer, SyntheticDataset
+
+### Shared fixtures of tests over FakeAzureDevOpsServer.
+### Module overrides workitem_count or server_options fixture to change the server.
+
+@pytest.fixture()
+def workitem_count() -> int:
+    return 100
+
+@pytest.fixture()
+def server_options() -> dict:
+    '''
+    Keyword arguments of FakeAzureDevOpsServer, e.g. latency, page_size, wiql_max_results
+    '''
+    return {}
+
+@pytest.fixture()
+def server(workitem_count: int, server_options: dict):
+    with FakeAzureDevOpsServer(SyntheticDataset(workitem_count=workitem_count), **server_options) as fake_server:
+        yield fake_server
+
+@pytest.fixture()
+def create_workitem_client(server: FakeAzureDevOpsServer):
+    '''
+    Returns function creating new WorkitemClient of Project0 of server
+    '''
+
+    def create():
+        client_connection = ClientFactory.create_pat('token', server.url, 'DefaultCollection/Project0')
+        return ClientFactory.get_workitem_client(client_connection)
+
+    return create
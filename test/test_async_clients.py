@@ -0,0 +1,122 @@
+import json
+import asyncio
+import threading
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pytfsclient.client_factory import ClientFactory
+from pytfsclient.models.client_error import ClientError
+from pytfsclient.testing import FakeAzureDevOpsServer, SyntheticDataset
+
+httpx = pytest.importorskip('httpx')
+
+### COMMAND
+# pytest .\test\test_async_clients.py
+
+class _Handler(BaseHTTPRequestHandler):
+    '''
+    Answers workitemsbatch and projects requests
+    '''
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, json_body, status_code: int = 200):
+        content = json.dumps(json_body).encode('utf-8')
+
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        if '/_apis/projects' in self.path:
+            if '%24skip=0' in self.path or '$skip=0' in self.path:
+                self._send_json({'count': 2, 'value': [
+                    {'id': 'p1', 'name': 'First', 'url': 'http://localhost/p1'},
+                    {'id': 'p2', 'name': 'Second', 'url': 'http://localhost/p2'},
+                ]})
+            else:
+                self._send_json({'count': 0, 'value': []})
+        else:
+            self._send_json({'message': 'not found'}, 404)
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+
+        if self.path.startswith('/DefaultCollection/_apis/wit/workitemsbatch'):
+            self._send_json({'count': len(body['ids']), 'value': [
+                {'id': item_id, 'url': f'http://localhost/_apis/wit/workItems/{item_id}', 'fields': {'System.Title': f'Item {item_id}'}}
+                for item_id in body['ids']
+            ]})
+        else:
+            self._send_json({'message': 'not found'}, 404)
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_address[1]}/'
+
+    server.shutdown()
+
+def test_async_get_workitems(server_url: str):
+    # Arrange
+    item_ids = list(range(1, 501))
+
+    async def run():
+        client_connection = ClientFactory.create_pat_async('fakepat', server_url, 'DefaultCollection/TestProject')
+        async with client_connection.http_client:
+            client = ClientFactory.get_async_workitem_client(client_connection)
+            return await client.get_workitems(item_ids)
+
+    # Act
+    items = asyncio.run(run())
+
+    # Assert
+    assert [item.id for item in items] == item_ids
+    assert items[0].title == 'Item 1'
+
+def test_async_missing_workitem_does_not_disable_workitemsbatch():
+    # Arrange
+    async def run(server_url: str):
+        client_connection = ClientFactory.create_pat_async('fakepat', server_url, 'DefaultCollection/Project0')
+        async with client_connection.http_client:
+            client = ClientFactory.get_async_workitem_client(client_connection)
+            with pytest.raises(ClientError):
+                await client.get_workitems([1, 99999])
+
+            return client, await client.get_workitems(list(range(1, 51)))
+
+    with FakeAzureDevOpsServer(SyntheticDataset(workitem_count=50)) as server:
+        # Act
+        client, items = asyncio.run(run(server.url))
+
+        # Assert
+        assert len(items) == 50
+        assert client._workitems_batch_supported is not False
+        assert 'GET wit/workitems' not in server.stats.endpoints
+
+def test_async_get_projects(server_url: str):
+    # Arrange
+    async def run():
+        client_connection = ClientFactory.create_pat_async('fakepat', server_url, 'DefaultCollection')
+        async with client_connection.http_client:
+            client = ClientFactory.get_async_project_client(client_connection)
+            return await client.get_projects()
+
+    # Act
+    projects = asyncio.run(run())
+
+    # Assert
+    assert [project.name for project in projects] == ['First', 'Second']
+
+def test_async_client_requires_async_connection():
+    # Arrange
+    client_connection = ClientFactory.create_pat('fakepat', 'http://localhost/')
+
+    # Act & Assert
+    with pytest.raises(ClientError):
+        ClientFactory.get_async_workitem_client(client_connection)
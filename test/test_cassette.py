@@ -0,0 +1,137 @@
+import gzip
+import json
+import time
+import threading
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pytfsclient.client_factory import ClientFactory
+from pytfsclient.services.http.http_client import HttpClient
+from pytfsclient.services.http.cassette import CassetteTransport, CassetteMissError
+
+### COMMAND
+# pytest .\test\test_cassette.py
+
+class _Handler(BaseHTTPRequestHandler):
+    '''
+    Answers json with request path and number of request
+    '''
+
+    protocol_version = 'HTTP/1.1'
+    calls = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _answer(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+
+        _Handler.calls += 1
+        content = json.dumps({'path': self.path, 'call': _Handler.calls, 'body': body}).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Set-Cookie', 'session=secret')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = _answer
+    do_POST = _answer
+
+@pytest.fixture()
+def base_url():
+    _Handler.calls = 0
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_address[1]}/DefaultCollection/'
+
+    server.shutdown()
+    server.server_close()
+
+def record(base_url: str, path: str):
+    with CassetteTransport(path) as transport:
+        http_client = HttpClient(base_url, transport=transport)
+        http_client.authentificate_with_pat('token')
+
+        responses = [
+            http_client.get('_apis/projects', query_params={'api-version': '6.0', '$skip': '0'}).json(),
+            http_client.get('_apis/projects', query_params={'api-version': '6.0', '$skip': '0'}).json(),
+            http_client.post_json('_apis/wit/wiql', {'query': 'SELECT [System.Id] FROM workitems'}).json(),
+        ]
+
+    return responses
+
+def test_replay_without_server(base_url: str, tmp_path):
+    # Arrange
+    path = str(tmp_path / 'projects.json.gz')
+    recorded = record(base_url, path)
+
+    # Act: query params in other order, server is not called
+    calls = _Handler.calls
+    http_client = HttpClient(base_url, transport=CassetteTransport(path))
+    replayed = [
+        http_client.get('_apis/projects', query_params={'$skip': '0', 'api-version': '6.0'}).json(),
+        http_client.get('_apis/projects', query_params={'$skip': '0', 'api-version': '6.0'}).json(),
+        http_client.post_json('_apis/wit/wiql', {'query': 'SELECT [System.Id] FROM workitems'}).json(),
+        # the last recorded response of request is repeated
+        http_client.get('_apis/projects', query_params={'$skip': '0', 'api-version': '6.0'}).json(),
+    ]
+
+    # Assert
+    assert http_client.transport.mode == CassetteTransport.MODE_REPLAY
+    assert _Handler.calls == calls
+    assert replayed == recorded + [recorded[1]]
+
+def test_cassette_has_no_secrets(base_url: str, tmp_path):
+    # Arrange
+    path = str(tmp_path / 'secrets.json.gz')
+
+    # Act
+    record(base_url, path)
+
+    with gzip.open(path, 'rt', encoding='utf-8') as file:
+        content = file.read()
+
+    # Assert
+    assert 'secret' not in content
+    assert 'Authorization' not in content
+    assert len(json.loads(content)['interactions']) == 3
+
+def test_replay_miss_raises_error(base_url: str, tmp_path):
+    # Arrange
+    path = str(tmp_path / 'miss.json.gz')
+    record(base_url, path)
+    http_client = HttpClient(base_url, transport=CassetteTransport(path, mode=CassetteTransport.MODE_REPLAY))
+
+    # Act & Assert
+    with pytest.raises(CassetteMissError):
+        http_client.get('_apis/teams')
+
+def test_replay_latency_and_streaming(base_url: str, tmp_path):
+    # Arrange
+    path = str(tmp_path / 'latency.json.gz')
+    record(base_url, path)
+    http_client = HttpClient(base_url, transport=CassetteTransport(path, latency=0.1))
+
+    # Act
+    started = time.monotonic()
+    response = http_client.get('_apis/projects', query_params={'api-version': '6.0', '$skip': '0'}, stream=True)
+    elapsed = time.monotonic() - started
+
+    # Assert
+    assert elapsed >= 0.1
+    assert json.loads(b''.join(response.iter_content(4)))['call'] == 1
+
+def test_factory_passes_transport(base_url: str, tmp_path):
+    # Arrange
+    transport = CassetteTransport(str(tmp_path / 'factory.json.gz'), mode=CassetteTransport.MODE_RECORD)
+
+    # Act
+    client_connection = ClientFactory.create_pat('token', base_url, transport=transport)
+
+    # Assert
+    assert client_connection.http_client.transport is transport
@@ -0,0 +1,147 @@
+import pytest
+from pytfsclient.client_factory import ClientFactory
+from pytfsclient.models.client_error import ClientError
+from pytfsclient.services.http.retry_policy import RetryPolicy
+from pytfsclient.services.http.http_cache import HttpCache
+from pytfsclient.testing import FakeAzureDevOpsServer, SyntheticDataset
+
+### COMMAND
+# pytest .\test\test_fake_server.py
+
+@pytest.fixture(scope="module")
+def server():
+    dataset = SyntheticDataset(workitem_count=100000, updates_per_workitem=8, teams_per_project=3, members_per_team=12)
+    with FakeAzureDevOpsServer(dataset, page_size=5, updates_page_size=3) as fake_server:
+        yield fake_server
+
+def create_connection(server: FakeAzureDevOpsServer, **http_options):
+    project_name = f'{FakeAzureDevOpsServer.COLLECTION}/{SyntheticDataset.project_name(0)}'
+    return ClientFactory.create_pat('token', server.url, project_name, **http_options)
+
+def test_dataset_is_deterministic():
+    # Arrange
+    first = SyntheticDataset(workitem_count=100000, seed=1)
+    second = SyntheticDataset(workitem_count=100000, seed=1)
+
+    # Act & Assert
+    assert first.workitem(99999, expand='All') == second.workitem(99999, expand='All')
+    assert first.updates(42) == second.updates(42)
+    assert first.workitem(100001) is None
+
+def test_get_workitems(server: FakeAzureDevOpsServer):
+    # Arrange
+    workitem_client = ClientFactory.get_workitem_client(create_connection(server))
+    item_ids = list(range(99550, 100001))
+
+    # Act
+    workitems = workitem_client.get_workitems(item_ids)
+
+    # Assert
+    assert [workitem.id for workitem in workitems] == item_ids
+    assert workitems[0].title == server.dataset.workitem(99550)['fields']['System.Title']
+
+def test_get_workitem_changes_reads_all_pages(server: FakeAzureDevOpsServer):
+    # Arrange
+    workitem_client = ClientFactory.get_workitem_client(create_connection(server))
+    item_id = next(item_id for item_id in range(1, 100) if len(server.dataset.updates(item_id)) > 3)
+
+    # Act
+    changes = workitem_client.get_workitem_changes(item_id)
+
+    # Assert
+    assert len(changes) == len(server.dataset.updates(item_id))
+
+def test_projects_teams_members_and_boards(server: FakeAzureDevOpsServer):
+    # Arrange
+    project_client = ClientFactory.get_project_client(create_connection(server))
+
+    # Act
+    projects = project_client.get_projects()
+    teams = project_client.get_project_teams(projects[0])
+    members = project_client.get_project_team_members(projects[0], teams[0])
+    boards = project_client.get_project_team_boards(projects[0], teams[0])
+    board = project_client.get_project_team_board(projects[0], teams[0], boards[0].id)
+    groups = project_client.get_project_groups(projects[0])
+
+    # Assert
+    assert [project.name for project in projects] == [SyntheticDataset.project_name(0)]
+    assert len(teams) == 3
+    assert len(members) == 12
+    assert board.id == boards[0].id
+    assert groups and project_client.get_project_group_members(projects[0], groups[0])
+
+def test_create_and_update_workitem(server: FakeAzureDevOpsServer):
+    # Arrange
+    workitem_client = ClientFactory.get_workitem_client(create_connection(server))
+
+    # Act
+    workitem = workitem_client.create_workitem('Task', {'System.Title': 'Created'})
+    updated = workitem_client.update_workitem_fields(workitem, {'System.Title': 'Updated'})
+
+    # Assert
+    assert workitem.id > 100000
+    assert updated.title == 'Updated'
+    assert len(workitem_client.get_workitem_changes(workitem.id)) == 2
+
+def test_missing_workitem_does_not_disable_workitemsbatch():
+    # Arrange
+    with FakeAzureDevOpsServer(SyntheticDataset(workitem_count=100)) as server:
+        workitem_client = ClientFactory.get_workitem_client(create_connection(server))
+
+        # Act: TF401232 of missing workitem is error of request, not of endpoint
+        with pytest.raises(ClientError):
+            workitem_client.get_workitems([1, 99999])
+        workitems = workitem_client.get_workitems(list(range(1, 101)))
+
+        # Assert
+        assert len(workitems) == 100
+        assert workitem_client._workitems_batch_supported is not False
+        assert server.stats.endpoints['POST wit/workitemsbatch'] == 2
+        assert 'GET wit/workitems' not in server.stats.endpoints
+
+def test_get_workitems_omit_without_workitemsbatch():
+    # Arrange
+    with FakeAzureDevOpsServer(SyntheticDataset(workitem_count=100), batch_supported=False) as server:
+        workitem_client = ClientFactory.get_workitem_client(create_connection(server))
+
+        # Act
+        workitems = workitem_client.get_workitems([1, 99999, 2], error_policy='Omit')
+
+        # Assert
+        assert [workitem.id for workitem in workitems] == [1, 2]
+        assert workitem_client._workitems_batch_supported is False
+
+def test_wiql_result_size_limit(server: FakeAzureDevOpsServer):
+    # Arrange
+    workitem_client = ClientFactory.get_workitem_client(create_connection(server))
+
+    # Act & Assert
+    assert len(workitem_client.run_wiql('SELECT [System.Id] FROM workitems', max_top=100).item_ids) == 100
+    with pytest.raises(ClientError):
+        workitem_client.run_wiql('SELECT [System.Id] FROM workitems')
+
+def test_throttled_requests_are_retried():
+    # Arrange
+    with FakeAzureDevOpsServer(SyntheticDataset(workitem_count=1000), throttle_every=2, retry_after=0.01) as server:
+        retry_policy = RetryPolicy(max_retries=3, backoff_factor=0.01)
+        workitem_client = ClientFactory.get_workitem_client(create_connection(server, retry_policy=retry_policy))
+
+        # Act
+        workitems = workitem_client.get_workitems(list(range(1, 601)))
+
+        # Assert
+        assert len(workitems) == 600
+        assert server.stats.throttled > 0
+
+def test_etag_revalidation():
+    # Arrange
+    with FakeAzureDevOpsServer(SyntheticDataset(workitem_count=10)) as server:
+        project_client = ClientFactory.get_project_client(create_connection(server, http_cache=HttpCache()))
+
+        # Act
+        first = project_client.get_project(server.dataset.project_id(0))
+        second = project_client.get_project(server.dataset.project_id(0))
+
+        # Assert
+        assert first.id == second.id
+        assert server.stats.not_modified == 1
@@ -0,0 +1,123 @@
+import json
+import threading
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pytfsclient.services.http.http_client import HttpClient
+from pytfsclient.services.http.http_cache import HttpCache
+from pytfsclient.services.http.metrics import RequestHook, RequestEvent
+
+### COMMAND
+# pytest .\test\test_http_cache.py
+
+class _Handler(BaseHTTPRequestHandler):
+    '''
+    Returns projects with ETag and answers 304 for If-None-Match
+    '''
+
+    protocol_version = 'HTTP/1.1'
+    version = 1
+    full_responses = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        etag = f'"{self.path}-{_Handler.version}"'
+
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        _Handler.full_responses += 1
+        content = json.dumps({'path': self.path, 'version': _Handler.version}).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_address[1]}/'
+
+    server.shutdown()
+
+@pytest.fixture()
+def http_client(base_url: str) -> HttpClient:
+    _Handler.version = 1
+    _Handler.full_responses = 0
+
+    return HttpClient(base_url, http_cache=HttpCache(max_entries=2))
+
+def test_not_modified_response_is_served_from_cache(http_client: HttpClient):
+    # Act
+    first = http_client.get('projects', query_params={'$skip': '0'})
+    second = http_client.get('projects', query_params={'$skip': '0'})
+
+    # Assert
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert _Handler.full_responses == 1
+    assert http_client.http_cache.stats.hits == 1
+    assert http_client.http_cache.stats.misses == 1
+
+def test_changed_resource_is_downloaded_again(http_client: HttpClient):
+    # Act
+    http_client.get('teams')
+    _Handler.version = 2
+    response = http_client.get('teams')
+
+    # Assert
+    assert response.json()['version'] == 2
+    assert _Handler.full_responses == 2
+
+def test_cache_evicts_least_recently_used(http_client: HttpClient):
+    # Act
+    for resource in ['a', 'b', 'a', 'c', 'a']:
+        http_client.get(resource)
+
+    stats = http_client.http_cache.stats
+
+    # Assert
+    assert stats.size == 2
+    assert stats.evictions == 1
+    assert stats.hits == 2
+
+class _EvictingHook(RequestHook):
+    '''
+    Clears cache when 304 is received, like eviction by other thread before response is processed
+    '''
+
+    def __init__(self) -> None:
+        self.http_cache: HttpCache = None
+
+    def after_response(self, event: RequestEvent) -> None:
+        if event.status_code == 304:
+            self.http_cache.invalidate()
+
+def test_not_modified_after_eviction_is_requested_again(base_url: str):
+    # Arrange
+    _Handler.version = 1
+    _Handler.full_responses = 0
+    hook = _EvictingHook()
+    http_client = HttpClient(base_url, http_cache=HttpCache(max_entries=2), hooks=[hook])
+    hook.http_cache = http_client.http_cache
+    http_client.get('boards')
+
+    # Act
+    response = http_client.get('boards')
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == {'path': '/boards', 'version': 1}
+    assert _Handler.full_responses == 2
+    assert http_client.http_cache.stats.misses == 2
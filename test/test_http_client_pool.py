@@ -0,0 +1,85 @@
+import time
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pytfsclient.client_factory import ClientFactory
+from pytfsclient.services.http.http_client import HttpClient, HttpException
+
+### COMMAND
+# pytest .\test\test_http_client_pool.py
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(0.05)
+        content = b'{}'
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_address[1]}/'
+
+    server.shutdown()
+
+def run_concurrent(http_client: HttpClient, workers: int, count: int) -> None:
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda _: http_client.get('get'), range(count)))
+
+def test_pool_reports_saturation(base_url: str):
+    # Arrange
+    http_client = HttpClient(base_url, pool_maxsize=2)
+
+    # Act
+    run_concurrent(http_client, workers=8, count=32)
+    stats = http_client.pool_stats
+
+    # Assert
+    assert stats.pool_maxsize == 2
+    assert stats.in_flight == 0
+    assert stats.peak_in_flight > 2
+    assert stats.is_saturated
+    assert stats.connections_created > 2
+    assert stats.requests_sent == 32
+
+def test_pool_sized_for_threads_reuses_connections(base_url: str):
+    # Arrange
+    http_client = HttpClient(base_url, pool_maxsize=8)
+
+    # Act
+    run_concurrent(http_client, workers=8, count=32)
+    stats = http_client.pool_stats
+
+    # Assert
+    assert not stats.is_saturated
+    assert stats.connections_created <= 8
+    assert stats.idle_connections == stats.connections_created
+
+def test_factory_passes_pool_options(base_url: str):
+    # Act
+    client_connection = ClientFactory.create_pat('fakepat', base_url, pool_maxsize=32, pool_block=True)
+
+    # Assert
+    assert client_connection.http_client.pool_stats.pool_maxsize == 32
+    assert client_connection.http_client.pool_stats.pool_block
+
+def test_ntlm_requires_keep_alive(base_url: str):
+    # Arrange
+    http_client = HttpClient(base_url, keep_alive=False)
+
+    # Act & Assert
+    with pytest.raises(HttpException):
+        http_client.authentificate_with_password('user', 'password')
@@ -0,0 +1,131 @@
+import json
+import time
+import threading
+import pytest
+from email.utils import formatdate
+from requests import HTTPError
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pytfsclient.services.http.http_client import HttpClient
+from pytfsclient.services.http.retry_policy import RetryPolicy
+
+### COMMAND
+# pytest .\test\test_http_client_retry.py
+
+class _Handler(BaseHTTPRequestHandler):
+    '''
+    Throttles first "throttle" requests of every path with 429 and Retry-After header
+    '''
+
+    protocol_version = 'HTTP/1.1'
+    throttle = 2
+    calls = {}
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _answer(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+
+        with _Handler.lock:
+            calls = _Handler.calls.get(self.path, 0) + 1
+            _Handler.calls[self.path] = calls
+
+        if calls <= _Handler.throttle:
+            self.send_response(429)
+            self.send_header('Retry-After', '0')
+            self.send_header('X-RateLimit-Remaining', '0')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        content = json.dumps({'calls': calls}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = _answer
+    do_POST = _answer
+    do_PATCH = _answer
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_address[1]}/'
+
+    server.shutdown()
+
+@pytest.fixture()
+def http_client(base_url: str) -> HttpClient:
+    _Handler.calls.clear()
+    return HttpClient(base_url, retry_policy=RetryPolicy(backoff_factor=0.01))
+
+def test_get_is_retried_after_throttling(http_client: HttpClient):
+    # Act
+    response = http_client.get('get')
+
+    # Assert
+    assert response.json()['calls'] == 3
+    assert http_client.retry_stats.retries == 2
+    assert http_client.retry_stats.throttled_responses == 2
+
+def test_post_is_not_replayed(http_client: HttpClient):
+    # Act & Assert
+    with pytest.raises(HTTPError):
+        http_client.post_json('post', {'a': 1})
+
+    assert http_client.retry_stats.retries == 0
+    assert http_client.retry_stats.throttled_responses == 1
+
+def test_read_only_post_is_replayed(http_client: HttpClient):
+    # Act
+    response = http_client.post_json('DefaultCollection/_apis/wit/workitemsbatch', {'ids': [1]})
+
+    # Assert
+    assert response.json()['calls'] == 3
+
+def test_patch_guarded_by_revision_is_replayed(http_client: HttpClient):
+    # Arrange
+    guarded_patch = [
+        {'op': 'test', 'path': '/rev', 'value': 3},
+        {'op': 'add', 'path': '/fields/System.Title', 'value': 'Title'},
+    ]
+
+    # Act
+    response = http_client.patch_json('patch_guarded', guarded_patch)
+
+    # Assert
+    assert response.json()['calls'] == 3
+
+    with pytest.raises(HTTPError):
+        http_client.patch_json('patch', guarded_patch[1:])
+
+def test_retries_are_exhausted(base_url: str):
+    # Arrange
+    _Handler.calls.clear()
+    http_client = HttpClient(base_url, retry_policy=RetryPolicy(max_retries=1, backoff_factor=0.01))
+
+    # Act & Assert
+    with pytest.raises(HTTPError):
+        http_client.get('exhausted')
+
+    assert http_client.retry_stats.retries == 1
+    assert http_client.retry_stats.exhausted == 1
+
+def test_retry_delay_honors_headers():
+    # Arrange
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=30.0, jitter=False)
+
+    # Act & Assert
+    assert policy.get_delay(0, {'Retry-After': '7'}) == 7.0
+    assert 8.0 < policy.get_delay(0, {'Retry-After': formatdate(time.time() + 10, usegmt=True)}) <= 10.0
+    assert 3.0 < policy.get_delay(0, {'X-RateLimit-Reset': str(time.time() + 4)}) <= 4.0
+    assert policy.get_delay(0, {'Retry-After': '600'}) == 30.0
+    assert policy.get_delay(3) == 8.0
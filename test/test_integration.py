@@ -8,8 +8,10 @@ sys.path.append(SOURCE_PATH)
 
 import pytest
 import datetime
+from requests.adapters import HTTPAdapter
 from pytfsclient.client_connection import ClientConnection
 from pytfsclient.client_factory import ClientFactory
+from pytfsclient.services.http.cassette import CassetteTransport
 from pytfsclient.services.project_client.project_client import ProjectClient
 from pytfsclient.services.workitem_client.workitem_client import WorkitemClient
 from pytfsclient.models.workitems.tfs_workitem_relation import WorkitemRelation, RelationTypes, RelationMap
@@ -20,23 +22,73 @@ from pytfsclient.models.project.tfs_team_member import TeamMember
 ### ^^^ ADDED EXTRA PATHS BELOW ^^^
 ### https://pytest-docs-ru.readthedocs.io/ru/latest/fixture.html
 
+# ENV_CASSETTE: path of cassette, records requests to live server once and replays them offline afterwards.
+# Cassette keeps placeholder server and project, so it is replayed without ENV_SERVER_URL, ENV_PROJECT_NAME and ENV_PAT.
+CASSETTE = os.environ.get('ENV_CASSETTE')
+CASSETTE_SERVER_URL = 'https://tfs.cassette.local/'
+CASSETTE_COLLECTION = 'DefaultCollection'
+CASSETTE_PROJECT_NAME = f'{CASSETTE_COLLECTION}/TestProject'
+CASSETTE_PAT = 'cassette-pat'
+# bodies of recorded requests must not change from day to day
+CASSETTE_DATE = datetime.date(2024, 1, 1)
+
+class _LiveServerAdapter(HTTPAdapter):
+    '''
+    Sends requests to placeholder server of cassette to live server while cassette is recorded
+    '''
+
+    def __init__(self, server_url: str, project_name: str) -> None:
+        super().__init__()
+
+        server_url = server_url.rstrip('/') + '/'
+        collection = project_name.split('/')[0]
+        # the longest prefix is replaced first
+        self.__prefixes = [
+            (f'{CASSETTE_SERVER_URL}{CASSETTE_PROJECT_NAME}/', f'{server_url}{project_name}/'),
+            (f'{CASSETTE_SERVER_URL}{CASSETTE_COLLECTION}/', f'{server_url}{collection}/'),
+            (CASSETTE_SERVER_URL, server_url)
+        ]
+
+    def send(self, request, **kwargs):
+        request = request.copy()
+        for placeholder, live in self.__prefixes:
+            if request.url.startswith(placeholder):
+                request.url = live + request.url[len(placeholder):]
+                break
+
+        return super().send(request, **kwargs)
+
 @pytest.fixture(scope="module")
 def server_url() -> str:
-    return os.environ['ENV_SERVER_URL']
+    return CASSETTE_SERVER_URL if CASSETTE else os.environ['ENV_SERVER_URL']
 
 @pytest.fixture(scope="module")
 def project_name() -> str:
-    return os.environ['ENV_PROJECT_NAME']
+    return CASSETTE_PROJECT_NAME if CASSETTE else os.environ['ENV_PROJECT_NAME']
 
 @pytest.fixture(scope="module")
 def personal_access_token() -> str:
-    return os.environ['ENV_PAT']
+    return os.environ.get('ENV_PAT', CASSETTE_PAT) if CASSETTE else os.environ['ENV_PAT']
+
+@pytest.fixture(scope="module")
+def today() -> datetime.date:
+    return CASSETTE_DATE if CASSETTE else datetime.date.today()
 
 @pytest.fixture(scope="module")
 def client_connection(server_url, project_name, personal_access_token) -> ClientConnection:
-    client_connection = ClientFactory.create_pat(personal_access_token, server_url, project_name, True)
+    transport = None
+    if CASSETTE:
+        # live server is needed only to record missing cassette
+        inner = None if os.path.exists(CASSETTE) else \
+            _LiveServerAdapter(os.environ['ENV_SERVER_URL'], os.environ['ENV_PROJECT_NAME'])
+        transport = CassetteTransport(CASSETTE, inner=inner)
+
+    client_connection = ClientFactory.create_pat(personal_access_token, server_url, project_name, True, transport=transport)
 
-    return client_connection
+    yield client_connection
+
+    if transport:
+        transport.save()
 
 @pytest.fixture(scope="module")
 def workitem_client(client_connection: ClientConnection) -> WorkitemClient:
@@ -66,9 +118,8 @@ def test_get_workitem(workitem_client: WorkitemClient):
     assert wi.title == workitem_title
 
 # TEST: Create new workitem. Type: Requirement
-def test_create_workitem(workitem_client: WorkitemClient):
-    # Arrange   
-    today = datetime.date.today()
+def test_create_workitem(workitem_client: WorkitemClient, today: datetime.date):
+    # Arrange
     wi_type_name = 'Requirement'
     wi_title = f'[BRQ] Created test requirement - {today}'
     wi_description = f'This BRQ was created by GitHub at {today}'
@@ -85,9 +136,8 @@ def test_create_workitem(workitem_client: WorkitemClient):
     assert wi, 'Can\'t create Workitem!'
     assert wi.title == wi_title, 'Workitem title differs!'
 
-def test_create_workitem_another_project(workitem_client: WorkitemClient):
+def test_create_workitem_another_project(workitem_client: WorkitemClient, today: datetime.date):
     # Arrange
-    today = datetime.date.today()
     wi_type_name = 'User Story'
     wi_title = f'[BRQ] New user story in another project - {today}'
     wi_description = f'This BRQ was created by test at {today}'
@@ -111,10 +161,8 @@ def test_create_workitem_another_project(workitem_client: WorkitemClient):
     assert wi, 'Can\'t create Workitem!'
     assert wi.title == wi_title, 'Workitem title differs!'
 
-def test_create_child_tasks(workitem_client: WorkitemClient):
+def test_create_child_tasks(workitem_client: WorkitemClient, today: datetime.date):
     # Arrange
-    today = datetime.date.today()
-
     parent_id = 2
 
     wi_type_name = 'Task'
@@ -144,9 +192,8 @@ def test_create_child_tasks(workitem_client: WorkitemClient):
     # Check only one relation
     assert wi.relations[0].destination_id == relations[0].destination_id
 
-def test_update_workitem_fields(workitem_client: WorkitemClient):
+def test_update_workitem_fields(workitem_client: WorkitemClient, today: datetime.date):
     # Arrange
-    today = datetime.date.today()
     workitem_id = 2
 
     title = f'[BRQ] Modified test requirement {today}'
@@ -0,0 +1,100 @@
+import json
+import threading
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pytfsclient.services.http.http_client import HttpClient
+from pytfsclient.services.http.json_codec import JsonCodec, get_json_codec
+
+### COMMAND
+# pytest .\test\test_json_codec.py
+
+class _Handler(BaseHTTPRequestHandler):
+    '''
+    Echoes request body and Content-Type as json
+    '''
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        content = json.dumps({'content_type': self.headers.get('Content-Type'), \
+            'body': json.loads(body)}).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_PATCH = do_POST
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_address[1]}/'
+
+    server.shutdown()
+
+def test_stdlib_codec_round_trip():
+    # Arrange
+    codec = get_json_codec('json')
+
+    # Act
+    content = codec.dumps({'id': 1, 'title': 'Задача'})
+
+    # Assert
+    assert isinstance(content, bytes)
+    assert codec.loads(content) == {'id': 1, 'title': 'Задача'}
+
+def test_unknown_codec_raises_value_error():
+    with pytest.raises(ValueError):
+        get_json_codec('yaml')
+
+def test_default_codec_is_installed():
+    # Act
+    codec = get_json_codec()
+
+    # Assert
+    assert codec.name in ('orjson', 'ujson', 'json')
+    assert codec.loads(codec.dumps([1, 2])) == [1, 2]
+
+def test_http_client_encodes_and_decodes_with_codec(base_url: str):
+    # Arrange
+    calls = {'loads': 0, 'dumps': 0}
+
+    def loads(content):
+        calls['loads'] += 1
+        return json.loads(content)
+
+    def dumps(obj):
+        calls['dumps'] += 1
+        return json.dumps(obj).encode('utf-8')
+
+    http_client = HttpClient(base_url, json_codec=JsonCodec('counting', loads, dumps))
+
+    # Act
+    response = http_client.post_json('wit/wiql', {'query': 'SELECT [System.Id] FROM workitems'})
+    json_item = http_client.read_json(response)
+
+    # Assert
+    assert json_item['content_type'] == 'application/json'
+    assert json_item['body'] == {'query': 'SELECT [System.Id] FROM workitems'}
+    assert calls == {'loads': 1, 'dumps': 1}
+
+def test_custom_content_type_is_kept(base_url: str):
+    # Arrange
+    http_client = HttpClient(base_url, json_codec='json')
+
+    # Act
+    response = http_client.patch_json('wit/workitems/1', [{'op': 'add', 'path': '/fields/System.Title', 'value': 'T'}], \
+        custom_headers={'Content-Type': 'application/json-patch+json'})
+
+    # Assert
+    assert http_client.json_codec.name == 'json'
+    assert http_client.read_json(response)['content_type'] == 'application/json-patch+json'
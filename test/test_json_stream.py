@@ -0,0 +1,79 @@
+import json
+import pytest
+from pytfsclient.services.helpers.json_stream import iter_json_items, _iter_scanner_items, _iter_ijson_items
+
+### COMMAND
+# pytest .\test\test_json_stream.py
+
+DOCUMENT = {
+    'count': 3,
+    'note': 'value',
+    'value': [
+        {'id': 1, 'fields': {'System.Title': 'Quote \" and [brackets] {braces}, commas: "value"'}},
+        {'id': 2, 'relations': [[1, 2], {'rel': 'Parent'}], 'fields': {'System.Title': 'Задача \\\\'}},
+        {'id': 3, 'fields': {}},
+    ],
+    'continuationToken': None
+}
+
+def split_chunks(content: bytes, size: int):
+    return [content[index:index + size] for index in range(0, len(content), size)]
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 7, 64, 100000])
+def test_scanner_yields_items_for_any_chunk_size(chunk_size: int):
+    # Arrange
+    content = json.dumps(DOCUMENT, ensure_ascii=False).encode('utf-8')
+
+    # Act
+    items = list(_iter_scanner_items(split_chunks(content, chunk_size), 'value', json.loads))
+
+    # Assert
+    assert items == DOCUMENT['value']
+
+def test_scanner_yields_item_before_document_is_received():
+    # Arrange
+    received = []
+
+    def chunks():
+        for chunk in [b'{"count": 2, "value": [{"id": 1}', b', {"id": 2}', b']}']:
+            received.append(chunk)
+            yield chunk
+
+    # Act
+    iterator = _iter_scanner_items(chunks(), 'value', json.loads)
+    first = next(iterator)
+
+    # Assert
+    assert first == {'id': 1}
+    assert len(received) == 2
+    assert list(iterator) == [{'id': 2}]
+
+def test_scanner_empty_array():
+    assert list(_iter_scanner_items([b'{"count": 0, "value": []}'], 'value', json.loads)) == []
+
+def test_scanner_raises_value_error_without_array():
+    with pytest.raises(ValueError):
+        list(_iter_scanner_items([b'{"count": 0, "message": "value"}'], 'value', json.loads))
+
+def test_scanner_raises_value_error_for_truncated_document():
+    with pytest.raises(ValueError):
+        list(_iter_scanner_items([b'{"value": [{"id": 1}, {"id"'], 'value', json.loads))
+
+def test_ijson_raises_value_error_without_array():
+    pytest.importorskip('ijson')
+
+    assert list(_iter_ijson_items([b'{"count": 0, ', b'"value": []}'], 'value')) == []
+    with pytest.raises(ValueError):
+        list(_iter_ijson_items([b'{"count": 0, "message": "value"}'], 'value'))
+    with pytest.raises(ValueError):
+        list(_iter_ijson_items([b'{"value": [{"id": 1}, {"id"'], 'value'))
+
+def test_iter_json_items_other_key():
+    # Arrange
+    content = json.dumps({'values': [1, 2], 'value': [3]}).encode('utf-8')
+
+    # Act
+    items = list(iter_json_items(split_chunks(content, 3), key='values'))
+
+    # Assert
+    assert items == [1, 2]
@@ -0,0 +1,133 @@
+import json
+import threading
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pytfsclient.services.http.http_client import HttpClient
+from pytfsclient.services.http.retry_policy import RetryPolicy
+from pytfsclient.services.http.metrics import MetricsCollector, RequestHook, endpoint_template
+
+### COMMAND
+# pytest .\test\test_metrics.py
+
+class _Handler(BaseHTTPRequestHandler):
+    '''
+    Answers json with request path, throttles first request of paths with "throttled" once
+    '''
+
+    protocol_version = 'HTTP/1.1'
+    throttled = set()
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _answer(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+
+        with _Handler.lock:
+            throttle = ('throttled' in self.path) and (self.path not in _Handler.throttled)
+            _Handler.throttled.add(self.path)
+
+        if throttle:
+            self.send_response(429)
+            self.send_header('Retry-After', '0')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        content = json.dumps({'path': self.path}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = _answer
+    do_POST = _answer
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_address[1]}/DefaultCollection/'
+
+    server.shutdown()
+
+@pytest.mark.parametrize('url, endpoint', [
+    ('https://dev.azure.com/org/Project/_apis/wit/workItems/42/updates?api-version=6.0', 'wit/workitems/{id}/updates'),
+    ('https://tfs/DefaultCollection/_apis/projects/6ce954b1-ce1f-45d1-b94d-e6bf2464ba2c/teams', 'projects/{id}/teams'),
+    ('https://tfs/DefaultCollection/Project/_api/_identity/ReadScopedApplicationGroupsJson', '_identity/readscopedapplicationgroupsjson'),
+    ('wit/wiql', 'wit/wiql'),
+])
+def test_endpoint_template(url: str, endpoint: str):
+    assert endpoint_template(url) == endpoint
+
+def test_collector_records_endpoints(base_url: str):
+    # Arrange
+    collector = MetricsCollector()
+    http_client = HttpClient(base_url, hooks=[collector], retry_policy=RetryPolicy(jitter=False, backoff_factor=0))
+
+    # Act
+    for item_id in (1, 2, 3):
+        http_client.get(f'_apis/wit/workitems/{item_id}/updates', query_params={'api-version': '6.0'})
+    http_client.post_json('_apis/wit/wiql', {'query': 'SELECT [System.Id] FROM workitems'})
+    http_client.get('_apis/wit/throttled/7')
+
+    snapshot = collector.snapshot()
+
+    # Assert
+    updates = snapshot.get('GET', 'wit/workitems/{id}/updates')
+    assert updates.count == 3
+    assert updates.status_codes == {200: 3}
+    assert updates.bytes_received > 0
+    assert updates.buckets[-1][1] == 3
+    assert updates.quantile(0.5) <= updates.max_seconds
+
+    wiql = snapshot.get('POST', 'wit/wiql')
+    assert wiql.bytes_sent == len(b'{"query":"SELECT [System.Id] FROM workitems"}')
+
+    throttled = snapshot.get('GET', 'wit/throttled/{id}')
+    assert throttled.count == 2
+    assert throttled.retries == 1
+    assert throttled.status_codes == {429: 1, 200: 1}
+
+    assert snapshot.total_requests == 6
+
+def test_collector_prometheus_format(base_url: str):
+    # Arrange
+    collector = MetricsCollector(buckets=(0.5, 1.0))
+    http_client = HttpClient(base_url, hooks=[collector])
+
+    # Act
+    http_client.get('_apis/projects')
+    text = collector.to_prometheus()
+
+    # Assert
+    assert '# TYPE pytfsclient_request_duration_seconds histogram' in text
+    assert 'pytfsclient_request_duration_seconds_bucket{method="GET",endpoint="projects",le="+Inf"} 1' in text
+    assert 'pytfsclient_request_duration_seconds_count{method="GET",endpoint="projects"} 1' in text
+    assert 'pytfsclient_responses_total{method="GET",endpoint="projects",status="200"} 1' in text
+
+def test_custom_hook_gets_failed_requests():
+    # Arrange
+    events = []
+
+    class _Hook(RequestHook):
+        def after_response(self, event):
+            events.append(event)
+
+    http_client = HttpClient('http://127.0.0.1:1/', retry_policy=RetryPolicy(max_retries=0))
+    http_client.add_hook(_Hook())
+
+    # Act
+    with pytest.raises(Exception):
+        http_client.get('_apis/projects')
+
+    # Assert
+    assert len(events) == 1
+    assert events[0].status_code is None
+    assert events[0].error is not None
@@ -0,0 +1,65 @@
+from pytfsclient.services.http.rate_limiter import AdaptiveRateLimiter
+
+### COMMAND
+# pytest .\test\test_rate_limiter.py
+
+def test_limiter_does_not_limit_without_pressure():
+    # Arrange
+    limiter = AdaptiveRateLimiter()
+
+    # Act
+    delays = []
+    for _ in range(20):
+        delays.append(limiter.reserve())
+        limiter.update(200, {})
+
+    # Assert
+    assert all(delay == 0 for delay in delays)
+    assert limiter.rate is None
+    assert limiter.stats.requests == 20
+
+def test_limiter_slows_down_when_throughput_units_are_used():
+    # Arrange
+    limiter = AdaptiveRateLimiter(max_rate=50.0, decrease_factor=0.5)
+    for _ in range(10):
+        limiter.reserve()
+
+    # Act
+    limiter.update(200, {'X-RateLimit-Limit': '200', 'X-RateLimit-Remaining': '10'})
+    first = limiter.reserve()
+    second = limiter.reserve()
+
+    # Assert
+    assert limiter.rate is not None
+    assert limiter.rate <= 25.0
+    assert first >= 0
+    assert second > 0
+    assert limiter.stats.decreases == 1
+    assert limiter.stats.remaining == 10.0
+
+def test_limiter_blocks_after_throttling():
+    # Arrange
+    limiter = AdaptiveRateLimiter()
+
+    # Act
+    limiter.update(429, {'Retry-After': '0.2'})
+    delay = limiter.reserve()
+
+    # Assert
+    assert 0.1 < delay <= 0.2
+    assert limiter.stats.delayed_requests == 1
+
+def test_limiter_recovers_rate():
+    # Arrange
+    limiter = AdaptiveRateLimiter(max_rate=4.0, increase_step=2.0)
+    limiter.update(200, {'X-RateLimit-Delay': '1.5'})
+    limited_rate = limiter.rate
+
+    # Act
+    for _ in range(20):
+        limiter.update(200, {})
+
+    # Assert
+    assert limited_rate is not None
+    assert limiter.rate is None
+    assert limiter.stats.increases > 0
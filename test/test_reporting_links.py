@@ -0,0 +1,45 @@
+import pytest
+from pytfsclient.testing import FakeAzureDevOpsServer
+
+### COMMAND
+# pytest .\test\test_reporting_links.py
+
+@pytest.fixture()
+def workitem_count() -> int:
+    return 200
+
+@pytest.fixture()
+def server_options() -> dict:
+    return {'page_size': 100}
+
+def test_links_without_workitems(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    expected = {(item_id, int(relation['url'].split('/')[-1]), relation['rel']) \
+        for item_id in range(1, 201) \
+        for relation in server.dataset.workitem(item_id, expand='Relations')['relations'] \
+        if not relation['rel'].endswith('-Reverse')}
+
+    # Act
+    links = [link for batch in workitem_client.iter_reporting_links() for link in batch]
+
+    # Assert
+    assert {(source_id, target_id, rel) for source_id, target_id, rel, _, is_active in links if is_active} == expected
+    assert server.stats.endpoints.get('POST wit/workitemsbatch') is None
+    assert server.stats.endpoints['GET wit/reporting/workitemlinks'] > 1
+
+def test_watermark_returns_only_new_links(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    watermark = list(workitem_client.iter_reporting_links(link_types=['System.LinkTypes.Related']))[-1].continuation_token
+
+    source, destination = workitem_client.get_workitems([10, 150])
+    workitem_client.add_relation(source, destination, 'System.LinkTypes.Related')
+
+    # Act
+    links = [link for batch in workitem_client.iter_reporting_links(link_types=['System.LinkTypes.Related'], \
+        continuation_token=watermark) for link in batch]
+
+    # Assert
+    assert [(link.source_id, link.target_id, link.rel, link.is_active) for link in links] == \
+        [(10, 150, 'System.LinkTypes.Related', True)]
@@ -0,0 +1,44 @@
+import pytest
+from pytfsclient.testing import FakeAzureDevOpsServer
+
+### COMMAND
+# pytest .\test\test_reporting_revisions.py
+
+@pytest.fixture()
+def workitem_count() -> int:
+    return 200
+
+@pytest.fixture()
+def server_options() -> dict:
+    return {'page_size': 100}
+
+def test_all_revisions_in_pages(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    expected = sum(len(server.dataset.updates(item_id)) for item_id in range(1, 201))
+
+    # Act
+    batches = list(workitem_client.iter_reporting_revisions(fields=['System.Title', 'System.ChangedDate']))
+    revisions = [revision for batch in batches for revision in batch]
+
+    # Assert
+    assert len(revisions) == expected
+    assert len(batches) == server.stats.endpoints['GET wit/reporting/workitemrevisions']
+    assert [batch.is_last_batch for batch in batches] == [False] * (len(batches) - 1) + [True]
+    assert set(revisions[0].fields) == {'System.Title', 'System.ChangedDate'}
+    assert len({(revision.id, revision.revision) for revision in revisions}) == expected
+
+def test_resume_from_saved_token(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    batches = list(workitem_client.iter_reporting_revisions(include_latest_only=True))
+    first_token, last_token = batches[0].continuation_token, batches[-1].continuation_token
+
+    # Act
+    resumed = list(workitem_client.iter_reporting_revisions(include_latest_only=True, continuation_token=first_token))
+    server.dataset.update_workitem(5, [{'op': 'add', 'path': '/fields/System.Title', 'value': 'Changed'}])
+    changed = [revision for batch in workitem_client.iter_reporting_revisions(continuation_token=last_token) for revision in batch]
+
+    # Assert
+    assert sum(len(batch) for batch in resumed) == 200 - len(batches[0])
+    assert [(revision.id, revision['System.Title']) for revision in changed] == [(5, 'Changed')]
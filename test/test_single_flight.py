@@ -0,0 +1,104 @@
+import threading
+import pytest
+from requests import HTTPError
+from pytfsclient.client_factory import ClientFactory
+from pytfsclient.services.http.single_flight import SingleFlight
+from pytfsclient.testing import FakeAzureDevOpsServer, SyntheticDataset
+
+### COMMAND
+# pytest .\test\test_single_flight.py
+
+@pytest.fixture()
+def server():
+    with FakeAzureDevOpsServer(SyntheticDataset(workitem_count=100), latency=0.2) as fake_server:
+        yield fake_server
+
+def run_concurrently(count: int, func) -> list:
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(index: int):
+        barrier.wait()
+        try:
+            results[index] = func(index)
+        except Exception as ex:
+            results[index] = ex
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return results
+
+def test_single_flight_shares_result_and_error():
+    # Arrange
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_call():
+        calls.append(1)
+        started.set()
+        release.wait()
+        raise ValueError('failed')
+
+    leader = threading.Thread(target=lambda: pytest.raises(ValueError, single_flight.do, 'key', slow_call))
+    leader.start()
+    started.wait()
+
+    # Act
+    follower_error = []
+    follower = threading.Thread(target=lambda: follower_error.append(pytest.raises(ValueError, single_flight.do, 'key', slow_call)))
+    follower.start()
+    while single_flight.stats.shared == 0:
+        pass
+    release.set()
+    leader.join()
+    follower.join()
+
+    # Assert
+    assert len(calls) == 1
+    assert single_flight.stats.executed == 1
+    assert single_flight.stats.shared == 1
+    assert single_flight.stats.in_flight == 0
+    assert single_flight.do('key', lambda: 42) == 42
+
+def test_identical_gets_are_coalesced(server: FakeAzureDevOpsServer):
+    # Arrange
+    client_connection = ClientFactory.create_pat('token', server.url, 'DefaultCollection/Project0', single_flight=SingleFlight())
+    workitem_client = ClientFactory.get_workitem_client(client_connection)
+
+    # Act
+    workitems = run_concurrently(8, lambda index: workitem_client.get_single_workitem(7))
+
+    # Assert
+    assert [workitem.id for workitem in workitems] == [7] * 8
+    assert server.stats.requests == 1
+    assert client_connection.http_client.single_flight.stats.shared == 7
+
+def test_different_gets_are_not_coalesced(server: FakeAzureDevOpsServer):
+    # Arrange
+    client_connection = ClientFactory.create_pat('token', server.url, 'DefaultCollection/Project0', single_flight=SingleFlight())
+    workitem_client = ClientFactory.get_workitem_client(client_connection)
+
+    # Act
+    workitems = run_concurrently(4, lambda index: workitem_client.get_single_workitem(index + 1))
+
+    # Assert
+    assert [workitem.id for workitem in workitems] == [1, 2, 3, 4]
+    assert server.stats.requests == 4
+
+def test_errors_are_shared(server: FakeAzureDevOpsServer):
+    # Arrange
+    client_connection = ClientFactory.create_pat('token', server.url, 'DefaultCollection/Project0', single_flight=SingleFlight())
+    http_client = client_connection.http_client
+
+    # Act
+    results = run_concurrently(4, lambda index: http_client.get('DefaultCollection/_apis/wit/workitems/1000'))
+
+    # Assert
+    assert all(isinstance(result, HTTPError) for result in results)
+    assert server.stats.requests == 1
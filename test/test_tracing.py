@@ -0,0 +1,116 @@
+import json
+import threading
+import pytest
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pytfsclient.client_factory import ClientFactory
+from pytfsclient.services.http.http_client import HttpClient
+from pytfsclient.services.helpers import tracing
+from pytfsclient.services.helpers.tracing import traced
+from .test_workitem_client import FakeHttpClient
+
+### COMMAND
+# pytest .\test\test_tracing.py
+
+sdk_trace = pytest.importorskip('opentelemetry.sdk.trace')
+from opentelemetry import trace
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+_exporter = InMemorySpanExporter()
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        content = json.dumps({'count': 0, 'value': []}).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+@pytest.fixture(scope="module", autouse=True)
+def tracer_provider():
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(_exporter))
+    trace.set_tracer_provider(provider)
+
+    yield provider
+
+@pytest.fixture()
+def exporter() -> InMemorySpanExporter:
+    _exporter.clear()
+    return _exporter
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{server.server_address[1]}/DefaultCollection/'
+
+    server.shutdown()
+
+def test_get_workitems_batches_are_children_of_facade_span(exporter: InMemorySpanExporter):
+    # Arrange
+    workitem_client = ClientFactory.get_workitem_client(ClientFactory.create_http_client(FakeHttpClient()))
+
+    # Act
+    workitem_client.get_workitems(list(range(1, 501)), max_workers=3)
+
+    # Assert
+    spans = exporter.get_finished_spans()
+    facade = next(span for span in spans if span.name == 'WorkitemClient.get_workitems')
+    batches = [span for span in spans if span.name == 'WorkitemClient.get_batch']
+
+    assert facade.attributes['pytfsclient.id_count'] == 500
+    assert facade.attributes['pytfsclient.batch_count'] == 3
+    assert sorted(span.attributes['pytfsclient.id_count'] for span in batches) == [100, 200, 200]
+    assert all(span.parent.span_id == facade.context.span_id for span in batches)
+
+def test_project_pages_and_http_requests_are_traced(exporter: InMemorySpanExporter, base_url: str):
+    # Arrange
+    project_client = ClientFactory.get_project_client(ClientFactory.create_http_client(HttpClient(base_url)))
+
+    # Act
+    project_client.get_projects()
+
+    # Assert
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    facade = spans['ProjectClient.get_projects']
+    page = spans['ProjectClient.get_projects.page']
+    request = spans['HTTP GET']
+
+    assert page.parent.span_id == facade.context.span_id
+    assert request.parent.span_id == page.context.span_id
+    assert page.attributes['pytfsclient.page'] == 0
+    assert request.attributes['pytfsclient.endpoint'] == 'projects'
+    assert request.attributes['http.response.status_code'] == 200
+
+def test_traced_generator_span_covers_iteration(exporter: InMemorySpanExporter):
+    # Arrange
+    @traced('numbers')
+    def numbers():
+        for number in range(3):
+            with tracing.span('number', value=number):
+                pass
+            yield number
+
+    # Act
+    iterator = numbers()
+    first = next(iterator)
+    assert not [span for span in exporter.get_finished_spans() if span.name == 'numbers']
+    rest = list(iterator)
+
+    # Assert
+    spans = exporter.get_finished_spans()
+    parent = next(span for span in spans if span.name == 'numbers')
+    children = [span for span in spans if span.name == 'number']
+
+    assert [first] + rest == [0, 1, 2]
+    assert len(children) == 3
+    assert all(span.parent.span_id == parent.context.span_id for span in children)
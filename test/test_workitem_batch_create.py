@@ -0,0 +1,89 @@
+import pytest
+from pytfsclient.models.client_error import ClientError
+from pytfsclient.models.workitems.tfs_workitem_relation import RelationTypes
+from pytfsclient.models.workitems.tfs_workitem_spec import WorkitemSpec
+from pytfsclient.testing import FakeAzureDevOpsServer
+
+### COMMAND
+# pytest .\test\test_workitem_batch_create.py
+
+def make_specs(story_count: int, task_count: int):
+    specs = list()
+    for story in range(story_count):
+        specs.append(WorkitemSpec('User Story', {'System.Title': f'Story {story}'}, temp_id=-(story + 1)))
+        specs += [WorkitemSpec('Task', {'System.Title': f'Task {story}.{task}'}, relations=[(RelationTypes.PARENT, -(story + 1))]) \
+            for task in range(task_count)]
+
+    return specs
+
+def parent_of(server: FakeAzureDevOpsServer, item_id: int) -> int:
+    relations = server.dataset.workitem(item_id, expand='Relations')['relations']
+    return int(relations[0]['url'].split('/')[-1])
+
+def test_parent_and_children_in_one_batch(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    specs = make_specs(story_count=2, task_count=3)
+
+    # Act
+    result = workitem_client.create_workitems(specs)
+
+    # Assert
+    assert result.is_success
+    assert result.requests == server.stats.requests == 1
+    assert [item.workitem.title for item in result] == [spec.fields['System.Title'] for spec in specs]
+    assert parent_of(server, result[1].item_id) == result[0].item_id
+    assert parent_of(server, result[7].item_id) == result[4].item_id
+
+def test_links_across_batches_and_failed_parent(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange: parent of the second story fails, its tasks can't be linked
+    workitem_client = create_workitem_client()
+    specs = make_specs(story_count=2, task_count=2)
+    specs[3] = WorkitemSpec('User Story', {'System.Title': 'Story 1'}, relations=[(RelationTypes.RELATED, 99999)], temp_id=-2)
+
+    # Act
+    result = workitem_client.create_workitems(specs, batch_size=2)
+
+    # Assert: workitems keep input order
+    assert [item.is_success for item in result] == [True, True, True, False, False, False]
+    assert result[3].status_code == 400
+    assert result[4].item_id is None
+    assert parent_of(server, result[2].item_id) == result[0].item_id
+
+def test_concurrent_creation_without_batch(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    specs = make_specs(story_count=3, task_count=4)
+
+    # Act
+    result = workitem_client.create_workitems(specs, use_batch=False, max_workers=4)
+
+    # Assert
+    assert result.is_success
+    creates = sum(count for endpoint, count in server.stats.endpoints.items() if endpoint.startswith('POST wit/workitems/$'))
+    assert result.requests == creates == 15
+    assert parent_of(server, result[14].item_id) == result[10].item_id
+
+def test_cyclic_links_are_rejected(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    specs = [WorkitemSpec('Task', relations=[(RelationTypes.PARENT, -2)], temp_id=-1), \
+        WorkitemSpec('Task', relations=[(RelationTypes.PARENT, -1)], temp_id=-2)]
+
+    # Act & Assert
+    with pytest.raises(ClientError):
+        workitem_client.create_workitems(specs)
+
+    assert server.stats.requests == 0
+
+def test_copy_workitems(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+
+    # Act
+    result = workitem_client.copy_workitems([5, 6, 7])
+
+    # Assert: one read and one $batch request
+    assert result.is_success
+    assert server.stats.requests == 2
+    assert [item.workitem.title for item in result] == [server.dataset.workitem(item_id)['fields']['System.Title'] for item_id in (5, 6, 7)]
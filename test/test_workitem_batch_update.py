@@ -0,0 +1,80 @@
+import pytest
+from pytfsclient.testing import FakeAzureDevOpsServer
+
+### COMMAND
+# pytest .\test\test_workitem_batch_update.py
+
+@pytest.fixture()
+def workitem_count() -> int:
+    return 500
+
+def test_updates_are_packed_into_batches(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    updates = {item_id: {'System.Title': f'Triaged {item_id}'} for item_id in range(1, 451)}
+
+    # Act
+    result = workitem_client.update_workitems_batch(updates)
+
+    # Assert
+    assert result.is_success
+    assert result.requests == 3
+    assert server.stats.requests == 3
+    assert [item.item_id for item in result] == list(range(1, 451))
+    assert result[9].workitem.title == 'Triaged 10'
+    assert server.dataset.workitem(450)['fields']['System.Title'] == 'Triaged 450'
+
+def test_failed_updates_are_reported_and_retryable(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    updates = {1: {'System.Title': 'First'}, 99999: {'System.Title': 'Missing'}, 2: {'System.Title': 'Second'}}
+
+    # Act
+    result = workitem_client.update_workitems_batch(updates, batch_size=2)
+    retried = workitem_client.update_workitems_batch({1: {'System.Title': 'Again'}, **result.failed_updates})
+
+    # Assert
+    assert [item.is_success for item in result] == [True, False, True]
+    assert result[1].status_code == 404
+    assert 'does not exist' in result[1].error
+    assert result.failed_updates == {99999: {'System.Title': 'Missing'}}
+    assert [item.is_success for item in retried] == [True, False]
+    assert server.dataset.workitem(1)['fields']['System.Title'] == 'Again'
+
+def test_update_refreshes_cache(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    workitem_client.enable_cache()
+    workitem_client.get_workitems([3, 4])
+
+    # Act
+    workitem_client.update_workitems_batch({3: {'System.Title': 'Cached'}})
+    workitems = workitem_client.get_workitems([3, 4])
+
+    # Assert: workitem of older revision is dropped from cache
+    assert workitems[0].title == 'Cached'
+    assert workitem_client.cache.stats.invalidations == 1
+
+@pytest.mark.parametrize('bypass_rules, suppress_notifications, notifications', [(False, False, 3), (True, False, 3), (False, True, 0)])
+def test_suppress_notifications(server: FakeAzureDevOpsServer, create_workitem_client, bypass_rules: bool, \
+    suppress_notifications: bool, notifications: int):
+    # Arrange
+    workitem_client = create_workitem_client()
+    updates = {item_id: {'System.Title': 'Quiet'} for item_id in (1, 2, 3)}
+
+    # Act
+    result = workitem_client.update_workitems_batch(updates, bypass_rules=bypass_rules, suppress_notifications=suppress_notifications)
+
+    # Assert: suppressNotifications of query string is sent separately from bypassRules
+    assert result.is_success
+    assert server.stats.notifications == notifications
+
+def test_batch_uri_quotes_project(create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+
+    # Act
+    request = workitem_client._make_batch_request('PATCH', 'wit/workitems/1', {'api-version': '6.0'}, [], project='My Project#1')
+
+    # Assert
+    assert request['uri'] == '/My%20Project%231/_apis/wit/workitems/1?api-version=6.0'
@@ -0,0 +1,96 @@
+from pytfsclient.services.workitem_client.workitem_cache import WorkitemCache
+from pytfsclient.testing import FakeAzureDevOpsServer
+
+### COMMAND
+# pytest .\test\test_workitem_cache.py
+
+def test_cached_workitems_are_not_requested(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    workitem_client.enable_cache()
+    workitem_client.get_workitems([1, 2, 3])
+    requests = server.stats.requests
+
+    # Act
+    workitems = workitem_client.get_workitems([3, 4, 1])
+
+    # Assert
+    assert [workitem.id for workitem in workitems] == [3, 4, 1]
+    assert server.stats.requests == requests + 1
+    assert workitem_client.cache.stats.hits == 2
+    assert workitem_client.cache.stats.misses == 4
+
+def test_cache_key_has_fields(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    workitem_client.enable_cache()
+    workitem_client.get_workitems([1])
+
+    # Act
+    workitem = workitem_client.get_workitems([1], item_fields=['System.Title'], expand=None)[0]
+
+    # Assert
+    assert workitem_client.cache.stats.hits == 0
+    assert list(workitem.fields_keys) == ['System.Title']
+
+def test_update_refreshes_cache(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    workitem_client.enable_cache()
+    workitem = workitem_client.get_single_workitem(5)
+
+    # Act
+    updated = workitem_client.update_workitem_fields(workitem, {'System.Title': 'Updated'})
+    requests = server.stats.requests
+    cached = workitem_client.get_single_workitem(5)
+
+    # Assert
+    assert server.stats.requests == requests
+    assert cached.title == 'Updated'
+    assert cached.revision == updated.revision == workitem.revision + 1
+    assert cached is not updated
+
+def test_add_relation_drops_destination(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    workitem_client.enable_cache()
+    source, destination = workitem_client.get_workitems([10, 20])
+
+    # Act
+    workitem_client.add_relation(source, destination, 'System.LinkTypes.Related')
+    requests = server.stats.requests
+    workitem_client.get_workitems([10, 20])
+
+    # Assert: source is refreshed from response, destination is requested again
+    assert server.stats.requests == requests + 1
+    assert workitem_client.cache.stats.size == 2
+
+def test_lru_ttl_and_invalidation():
+    # Arrange
+    now = [0.0]
+    cache = WorkitemCache(max_entries=2, ttl=10.0, clock=lambda: now[0])
+
+    # Act
+    cache.put({'id': 1, 'rev': 1, 'fields': {}})
+    cache.put({'id': 2, 'rev': 1, 'fields': {}})
+    cache.get(1)
+    cache.put({'id': 3, 'rev': 1, 'fields': {}})
+
+    evicted = cache.get(2)
+    kept = cache.get(1)
+
+    cache.update_revision(1, 2)
+    invalidated = cache.get(1)
+
+    now[0] = 11.0
+    expired = cache.get(3)
+
+    # Assert
+    assert evicted is None
+    assert kept['id'] == 1
+    assert invalidated is None
+    assert expired is None
+    assert cache.stats.evictions == 1
+    assert cache.stats.expirations == 1
+    assert cache.stats.invalidations == 1
+    assert cache.stats.size == 0
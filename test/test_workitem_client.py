@@ -0,0 +1,188 @@
+import io
+import json
+import threading
+import time
+import pytest
+from requests import Response, HTTPError
+from pytfsclient.client_factory import ClientFactory
+from pytfsclient.services.http.http_client import HttpClient
+from pytfsclient.services.workitem_client.workitem_client import WorkitemClient
+from pytfsclient.models.client_error import ClientError
+
+### COMMAND
+# pytest .\test\test_workitem_client.py
+
+def make_response(json_body, status_code: int = 200, stream: bool = False) -> Response:
+    response = Response()
+    response.status_code = status_code
+
+    content = json.dumps(json_body).encode('utf-8')
+    if stream:
+        # body is read from raw stream like response requested with stream=True
+        response.raw = io.BytesIO(content)
+        response._content = False
+    else:
+        response._content = content
+
+    return response
+
+class FakeHttpClient(HttpClient):
+    '''
+    HttpClient which answers workitem requests without TFS/Azure server
+    '''
+
+    def __init__(self, fail_ids=None, delay: float = 0.0, batch_supported: bool = True) -> None:
+        super().__init__('http://localhost/')
+
+        self.fail_ids = fail_ids or []
+        self.delay = delay
+        self.batch_supported = batch_supported
+
+        self.lock = threading.Lock()
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+
+    def get(self, resource: str, query_params=None, custom_headers=None, cookies=None, stream: bool = False):
+        ids = [int(item_id) for item_id in query_params['ids'].split(',')]
+        return self._get_items('GET', resource, ids, stream)
+
+    def post_json(self, resource: str, json_data, query_params=None, custom_headers=None, stream: bool = False):
+        if not self.batch_supported:
+            response = make_response({'message': 'not found'}, 404)
+            raise HTTPError('404 Not Found', response=response)
+
+        return self._get_items('POST', resource, json_data['ids'], stream)
+
+    def _get_items(self, method: str, resource: str, ids, stream: bool = False):
+        with self.lock:
+            self.requests.append((method, resource, ids))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+        try:
+            time.sleep(self.delay)
+
+            if any(item_id in self.fail_ids for item_id in ids):
+                response = make_response({'message': 'error'}, 500)
+                raise HTTPError('500 Server Error', response=response)
+
+            return make_response({
+                'count': len(ids),
+                'value': [{'id': item_id, 'url': f'http://localhost/_apis/wit/workItems/{item_id}', 'fields': {}} for item_id in ids]
+            }, stream=stream)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+@pytest.fixture()
+def http_client() -> FakeHttpClient:
+    return FakeHttpClient(delay=0.05)
+
+@pytest.fixture()
+def workitem_client(http_client: FakeHttpClient) -> WorkitemClient:
+    client_connection = ClientFactory.create_http_client(http_client, 'DefaultCollection/TestProject')
+    return ClientFactory.get_workitem_client(client_connection)
+
+def test_get_workitems_sequential(workitem_client: WorkitemClient, http_client: FakeHttpClient):
+    # Arrange
+    item_ids = list(range(1, 26))
+
+    # Act
+    items = workitem_client.get_workitems(item_ids, batch_size=10)
+
+    # Assert
+    assert [item.id for item in items] == item_ids
+    assert len(http_client.requests) == 3
+    assert http_client.max_active == 1
+
+def test_get_workitems_uses_workitemsbatch(workitem_client: WorkitemClient, http_client: FakeHttpClient):
+    # Arrange
+    item_ids = list(range(1, 451))
+
+    # Act
+    items = workitem_client.get_workitems(item_ids)
+
+    # Assert
+    assert [item.id for item in items] == item_ids
+    assert [method for method, _, _ in http_client.requests] == ['POST', 'POST', 'POST']
+    assert [len(ids) for _, _, ids in http_client.requests] == [200, 200, 50]
+
+def test_get_workitems_falls_back_to_get(workitem_client: WorkitemClient, http_client: FakeHttpClient):
+    # Arrange
+    http_client.batch_supported = False
+    item_ids = list(range(1, 121))
+
+    # Act
+    items = workitem_client.get_workitems(item_ids)
+    items_again = workitem_client.get_workitems(item_ids)
+
+    # Assert
+    assert [item.id for item in items] == item_ids
+    assert [item.id for item in items_again] == item_ids
+    assert all(method == 'GET' for method, _, _ in http_client.requests)
+    assert [len(ids) for _, _, ids in http_client.requests] == [50, 50, 20] * 2
+
+def test_get_workitems_concurrent_keeps_order(workitem_client: WorkitemClient, http_client: FakeHttpClient):
+    # Arrange
+    item_ids = list(range(100, 0, -1))
+
+    # Act
+    items = workitem_client.get_workitems(item_ids, batch_size=10, max_workers=5)
+
+    # Assert
+    assert [item.id for item in items] == item_ids
+    assert len(http_client.requests) == 10
+    assert http_client.max_active > 1
+
+def test_get_workitems_concurrent_raises_client_error(workitem_client: WorkitemClient, http_client: FakeHttpClient):
+    # Arrange
+    http_client.fail_ids = [42]
+
+    # Act & Assert
+    with pytest.raises(ClientError):
+        workitem_client.get_workitems(list(range(1, 101)), batch_size=10, max_workers=4)
+
+def test_iter_workitems_yields_batch_by_batch(workitem_client: WorkitemClient, http_client: FakeHttpClient):
+    # Arrange
+    item_ids = list(range(1, 31))
+
+    # Act
+    iterator = workitem_client.iter_workitems(item_ids, batch_size=10)
+    first = next(iterator)
+    requests_after_first = len(http_client.requests)
+    rest = list(iterator)
+
+    # Assert
+    assert requests_after_first == 1
+    assert [first.id] + [item.id for item in rest] == item_ids
+    assert len(http_client.requests) == 3
+
+def test_iter_workitems_prefetch(workitem_client: WorkitemClient, http_client: FakeHttpClient):
+    # Arrange
+    item_ids = list(range(1, 31))
+
+    # Act
+    items = list(workitem_client.iter_workitems(item_ids, batch_size=10, prefetch=True))
+
+    # Assert
+    assert [item.id for item in items] == item_ids
+    assert len(http_client.requests) == 3
+    assert http_client.max_active == 1
+
+def test_iter_workitems_stream(workitem_client: WorkitemClient, http_client: FakeHttpClient):
+    # Arrange
+    http_client.batch_supported = False
+    item_ids = list(range(1, 121))
+
+    # Act
+    iterator = workitem_client.iter_workitems(item_ids, stream=True)
+    first = next(iterator)
+
+    # Assert: only the first GET request is sent before the first workitem is yielded
+    assert first.id == 1
+    assert len(http_client.requests) == 1
+
+    workitems = [first] + list(iterator)
+    assert [workitem.id for workitem in workitems] == item_ids
+    assert len(http_client.requests) == 3
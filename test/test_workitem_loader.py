@@ -0,0 +1,74 @@
+import time
+import pytest
+from pytfsclient.models.client_error import ClientError
+from pytfsclient.testing import FakeAzureDevOpsServer
+from .test_single_flight import run_concurrently
+
+### COMMAND
+# pytest .\test\test_workitem_loader.py
+
+@pytest.fixture()
+def server_options() -> dict:
+    return {'latency': 0.05}
+
+def test_concurrent_lookups_are_batched(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    loader = workitem_client.enable_batch_loader(batch_window=0.1)
+
+    # Act
+    workitems = run_concurrently(20, lambda index: workitem_client.get_single_workitem(index + 1))
+
+    # Assert
+    assert [workitem.id for workitem in workitems] == list(range(1, 21))
+    assert server.stats.requests == 1
+    assert loader.stats.loads == 20
+    assert loader.stats.batches == 1
+
+def test_full_batch_is_sent_without_waiting(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    loader = workitem_client.enable_batch_loader(max_batch_size=5, batch_window=10.0)
+
+    # Act
+    started = time.monotonic()
+    workitems = run_concurrently(10, lambda index: workitem_client.get_single_workitem(index + 1))
+
+    # Assert
+    assert time.monotonic() - started < 5.0
+    assert sorted(workitem.id for workitem in workitems) == list(range(1, 11))
+    assert loader.stats.batches == 2
+
+def test_missing_workitem_fails_only_its_caller(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    workitem_client.enable_batch_loader(batch_window=0.1)
+
+    # Act
+    results = run_concurrently(3, lambda index: workitem_client.get_single_workitem([1, 1000, 2][index]))
+
+    # Assert
+    assert results[0].id == 1
+    assert isinstance(results[1], ClientError)
+    assert results[2].id == 2
+    assert server.stats.requests == 1
+
+def test_callers_of_the_same_id_get_own_instances(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    workitem_client.enable_batch_loader(batch_window=0.1)
+
+    # Act: the first caller edits its workitem
+    def load(index: int):
+        workitem = workitem_client.get_single_workitem(7)
+        if index == 0:
+            workitem.title = 'Edited by first caller'
+        return workitem
+
+    first, second = run_concurrently(2, load)
+
+    # Assert
+    assert server.stats.requests == 1
+    assert first is not second
+    assert first.updated_fields == {'System.Title': 'Edited by first caller'}
+    assert (not second.is_dirty) and (second.title != 'Edited by first caller')
@@ -0,0 +1,97 @@
+import pytest
+from pytfsclient.models.client_error import ClientError
+from pytfsclient.testing import FakeAzureDevOpsServer
+
+### COMMAND
+# pytest .\test\test_workitem_session.py
+
+@pytest.fixture()
+def workitem_count() -> int:
+    return 300
+
+def test_edits_are_flushed_in_batches(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    workitems = workitem_client.get_workitems(list(range(1, 251)))
+    revisions = [workitem.revision for workitem in workitems]
+    server.reset_stats()
+
+    # Act
+    with workitem_client.session():
+        for workitem in workitems:
+            workitem['System.State'] = 'Closed'
+            workitem.title = f'Closed {workitem.id}'
+
+    # Assert
+    assert server.stats.endpoints == {'POST wit/$batch': 2}
+    assert all(not workitem.is_dirty for workitem in workitems)
+    assert [workitem.revision for workitem in workitems] == [revision + 1 for revision in revisions]
+    assert workitems[0]['System.State'] == 'Closed'
+    assert server.dataset.workitem(250)['fields']['System.Title'] == 'Closed 250'
+
+def test_failed_workitems_stay_dirty(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    first, second = workitem_client.get_workitems([1, 2])
+    server.dataset.delete_workitem(2)
+
+    # Act
+    with pytest.raises(ClientError):
+        with workitem_client.session(expand=None):
+            first.title = 'First'
+            second.title = 'Second'
+
+    # Assert
+    assert (not first.is_dirty) and (first.title == 'First')
+    assert second.is_dirty and (second.updated_fields == {'System.Title': 'Second'})
+
+def test_edits_outside_session_are_not_tracked(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    workitem = workitem_client.get_single_workitem(1)
+    workitem.title = 'Edited before session'
+    server.reset_stats()
+
+    # Act
+    with workitem_client.session() as session:
+        untracked = session.dirty
+        session.add(workitem)
+        result = session.flush()
+
+    # Assert
+    assert untracked == []
+    assert result.is_success and (len(result) == 1)
+    assert server.stats.requests == 1
+
+def test_instances_of_the_same_workitem(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    first = workitem_client.get_single_workitem(1)
+    second = workitem_client.get_single_workitem(1)
+    server.reset_stats()
+
+    # Act: different fields are merged into one update
+    with workitem_client.session():
+        first.title = 'Merged'
+        second['System.State'] = 'Closed'
+
+    # Assert
+    assert server.stats.requests == 1
+    assert (not first.is_dirty) and (not second.is_dirty)
+    assert (second.title == 'Merged') and (first['System.State'] == 'Closed')
+
+def test_conflicting_edits_of_the_same_workitem(server: FakeAzureDevOpsServer, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    first = workitem_client.get_single_workitem(1)
+    second = workitem_client.get_single_workitem(1)
+    server.reset_stats()
+
+    # Act & Assert
+    with pytest.raises(ClientError):
+        with workitem_client.session():
+            first.title = 'First'
+            second.title = 'Second'
+
+    assert server.stats.requests == 0
+    assert first.is_dirty and second.is_dirty
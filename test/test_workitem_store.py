@@ -0,0 +1,64 @@
+import sqlite3
+import pytest
+from pytfsclient.services.workitem_client.workitem_store import WorkitemStore
+from pytfsclient.testing import FakeAzureDevOpsServer
+
+### COMMAND
+# pytest .\test\test_workitem_store.py
+
+@pytest.fixture()
+def workitem_count() -> int:
+    return 1000
+
+def test_warm_start_reads_only_revisions(server: FakeAzureDevOpsServer, tmp_path, create_workitem_client):
+    # Arrange
+    path = str(tmp_path / 'workitems.db')
+    item_ids = list(range(1, 301))
+    first_client = create_workitem_client()
+    first_client.attach_store(path)
+    expected = first_client.get_workitems(item_ids)
+    server.reset_stats()
+
+    # Act: new client and store over the same file
+    workitem_client = create_workitem_client()
+    workitem_client.attach_store(path)
+    workitems = workitem_client.get_workitems(item_ids)
+
+    # Assert
+    assert [workitem.title for workitem in workitems] == [workitem.title for workitem in expected]
+    assert server.stats.requests == 2
+    assert workitem_client.store.stats.hits == 300
+    assert workitem_client.store.count() == 300
+
+def test_changed_workitems_are_downloaded(server: FakeAzureDevOpsServer, tmp_path, create_workitem_client):
+    # Arrange
+    workitem_client = create_workitem_client()
+    workitem_client.attach_store(str(tmp_path / 'workitems.db'))
+    workitem_client.get_workitems([1, 2, 3])
+    server.dataset.update_workitem(2, [{'op': 'add', 'path': '/fields/System.Title', 'value': 'Changed'}])
+
+    # Act
+    workitems = workitem_client.get_workitems([3, 2, 1, 4])
+
+    # Assert
+    assert [workitem.id for workitem in workitems] == [3, 2, 1, 4]
+    assert workitems[1].title == 'Changed'
+    assert workitem_client.store.stats.hits == 2
+    assert workitem_client.store.stats.stale == 1
+    assert workitem_client.store.stats.misses == 3 + 1
+
+def test_store_keeps_newest_revision_and_uses_wal(tmp_path):
+    # Arrange
+    path = str(tmp_path / 'workitems.db')
+    first, second = WorkitemStore(path), WorkitemStore(path)
+
+    # Act
+    first.put([{'id': 1, 'rev': 3, 'fields': {'System.Title': 'new'}}])
+    second.put([{'id': 1, 'rev': 2, 'fields': {'System.Title': 'old'}}])
+
+    # Assert
+    assert second.get([1]) == {1: (3, {'id': 1, 'rev': 3, 'fields': {'System.Title': 'new'}})}
+    assert sqlite3.connect(path).execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+    first.close()
+    second.close()
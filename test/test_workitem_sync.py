@@ -0,0 +1,66 @@
+import pytest
+from pytfsclient.models.client_error import ClientError
+from pytfsclient.services.workitem_client.workitem_store import WorkitemStore
+from pytfsclient.services.workitem_client.workitem_sync import WorkitemSync
+from pytfsclient.testing import FakeAzureDevOpsServer
+
+### COMMAND
+# pytest .\test\test_workitem_sync.py
+
+@pytest.fixture()
+def workitem_count() -> int:
+    return 400
+
+@pytest.fixture()
+def server_options() -> dict:
+    return {'wiql_max_results': 150}
+
+def create_sync(workitem_client, path: str, max_results: int = 150):
+    return WorkitemSync(workitem_client, WorkitemStore(path), max_results=max_results)
+
+def test_initial_sync_splits_window(server: FakeAzureDevOpsServer, tmp_path, create_workitem_client):
+    # Arrange
+    sync = create_sync(create_workitem_client(), str(tmp_path / 'workitems.db'))
+
+    # Act
+    result = sync.run()
+
+    # Assert: 400 workitems don't fit into one query of 150 results
+    assert result.changed == 400
+    assert result.queries > 1
+    assert sync.store.count() == 400
+    assert sync.watermark == result.watermark == max(server.dataset.workitem(item_id)['fields']['System.ChangedDate'] \
+        for item_id in range(1, 401))
+
+def test_delta_sync_reads_changed_and_removes_deleted(server: FakeAzureDevOpsServer, tmp_path, create_workitem_client):
+    # Arrange
+    path = str(tmp_path / 'workitems.db')
+    create_sync(create_workitem_client(), path).run()
+
+    server.dataset.update_workitem(7, [{'op': 'add', 'path': '/fields/System.Title', 'value': 'Changed'}])
+    server.dataset.delete_workitem(8)
+    server.reset_stats()
+
+    # Act: new process continues from stored watermark
+    sync = create_sync(create_workitem_client(), path)
+    result = sync.run()
+
+    # Assert: workitem of previous watermark is read again because of overlap
+    assert result.changed == 2
+    assert result.deleted == 1
+    assert result.queries == 1
+    assert server.stats.endpoints['POST wit/workitemsbatch'] == 1
+    assert sync.store.get([7], None, 'All')[7][1]['fields']['System.Title'] == 'Changed'
+    assert sync.store.get([8], None, 'All') == {}
+
+@pytest.mark.parametrize('workitem_count', [10])
+def test_too_many_changes_in_one_second(server: FakeAzureDevOpsServer, tmp_path, create_workitem_client):
+    # Arrange: every update gets the same second
+    for item_id in range(1, 11):
+        server.dataset.update_workitem(item_id, [{'op': 'add', 'path': '/fields/System.Title', 'value': 'Changed'}])
+
+    sync = create_sync(create_workitem_client(), str(tmp_path / 'workitems.db'), max_results=5)
+
+    # Act & Assert
+    with pytest.raises(ClientError):
+        sync.run()